@@ -0,0 +1,84 @@
+"""Benchmark: keyword automaton vs. the former per-keyword rfind scan.
+
+Times NamingPattern.extract_action_fuzzy on template-like names, with the
+built-in keywords and with a large custom vocabulary. The former scan ran one
+rfind per keyword over the lowercased name.
+
+Usage:
+    python benchmarks/bench_action_keywords.py [names] [extra keywords]
+"""
+
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.naming import NamingPattern
+
+SUFFIX_PATTERN = re.compile(r'^([_]?[A-Za-z0-9])(?:[_]|$|\.)')
+
+
+def scan(name, keywords):
+    """Former extract_action_fuzzy loop."""
+    name_lower = name.lower()
+    for base_action in keywords:
+        action_lower = base_action.lower()
+        pos = name_lower.rfind(action_lower)
+        if pos == -1:
+            continue
+        action_end = pos + len(action_lower)
+        remaining = name[action_end:]
+        if pos > 0:
+            char_before = name[pos - 1]
+            if char_before == '_' or (char_before.islower() and name[pos].isupper()):
+                pass
+            elif char_before.isalnum():
+                continue
+        suffix_match = SUFFIX_PATTERN.match(remaining)
+        if suffix_match:
+            return name[pos:action_end] + suffix_match.group(1)
+        elif remaining == '' or remaining.startswith('_') or remaining.startswith('.'):
+            return name[pos:action_end]
+    return None
+
+
+def run(label, pattern, keywords, names):
+    start = time.perf_counter()
+    expected = [scan(name, keywords) for name in names]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = [pattern.extract_action_fuzzy(name) for name in names]
+    automaton_time = time.perf_counter() - start
+
+    assert found == expected, "Automaton results differ from the keyword scan"
+    print(f"{label} ({len(keywords)} keywords, {len(names)} names)")
+    print(f"  keyword scan:  {scan_time:8.3f} s")
+    print(f"  automaton:     {automaton_time:8.3f} s  ({scan_time / automaton_time:5.1f}x)")
+
+
+def main():
+    num_names = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    num_extra = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    rng = random.Random(0)
+    keywords = list(NamingPattern.ACTION_KEYWORDS)
+    names = [f"Mechaflora{rng.choice(['StrongRepair', 'Weak_Ranged', 'Boss'])}"
+             + rng.choice(['', '_']) + rng.choice(keywords + ['Unknown']) + rng.choice(['', 'A', '_B', '_1'])
+             for _ in range(num_names)]
+    run("Built-in vocabulary", NamingPattern("$prefix_$feature_$action"), keywords, names)
+
+    extra = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10))).capitalize()
+             for _ in range(num_extra)]
+    vocabulary = keywords + extra
+    names = [name[:-3] + rng.choice(extra) if rng.random() < 0.5 else name for name in names]
+    run("Large vocabulary", NamingPattern("$prefix_$feature_$action", action_keywords=vocabulary),
+        vocabulary, names)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark: template suffix index vs. the former per-file template scan.
+
+Times the "Try 3" fallback of AudioMatcher.match_files_with_pattern, which
+finds the first template whose normalized name ends with a file's action.
+The former scan is O(files x templates), so it is timed on a sample of files
+and extrapolated.
+
+Usage:
+    python benchmarks/bench_matcher_suffix.py [templates] [files] [sample]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.matcher import SuffixIndex
+
+WORDS = ['Attack', 'Stun', 'Loop', 'Idle', 'Walk', 'Run', 'Jump', 'Hit', 'Death', 'Alert',
+         'Heavy', 'Light', 'Charge', 'Release', 'Spawn', 'Cast', 'Block', 'Dodge']
+
+
+def normalize_for_matching(s: str) -> str:
+    return s.replace('_', '').replace(' ', '').lower()
+
+
+def scan(template_names, file_action):
+    """Former Try 3 loop."""
+    file_action_normalized = normalize_for_matching(file_action)
+    for template_name in template_names:
+        if normalize_for_matching(template_name).endswith(file_action_normalized):
+            return template_name
+    return None
+
+
+def main():
+    num_templates = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    num_files = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    sample = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    rng = random.Random(0)
+    template_names = [f"Prefix_Feature{i}_" + '_'.join(rng.sample(WORDS, rng.randint(1, 3)))
+                      for i in range(num_templates)]
+    actions = ['_'.join(rng.sample(WORDS, rng.randint(1, 3))) for _ in range(num_files)]
+
+    start = time.perf_counter()
+    scanned = [scan(template_names, action) for action in actions[:sample]]
+    scan_time = (time.perf_counter() - start) / sample * num_files
+
+    start = time.perf_counter()
+    index = SuffixIndex((normalize_for_matching(n), n) for n in template_names)
+    indexed = [index.first_ending_with(normalize_for_matching(action)) for action in actions]
+    index_time = time.perf_counter() - start
+
+    assert indexed[:sample] == scanned, "Index results differ from the template scan"
+
+    print(f"{num_templates} templates x {num_files} files")
+    print(f"  template scan:  {scan_time:9.2f} s  (extrapolated from {sample} files)")
+    print(f"  suffix index:   {index_time:9.3f} s  (including index build)")
+    print(f"  speedup:        {scan_time / index_time:9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark: NamingPattern.parse_many vs. the former per-name generic parsing.
+
+The former extract_action_generic re-lowercased the prefix, re-normalized the
+feature and re-joined every candidate feature boundary for each name. This
+times it against parse_many, serially and on a process pool.
+
+Usage:
+    python benchmarks/bench_naming_parse.py [names] [workers]
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.naming import NamingPattern, normalize_for_comparison
+
+WORDS = ['Attack', 'Stun', 'Loop', 'Idle', 'Walk', 'Run', 'Jump', 'Hit', 'Death', 'Alert',
+         'Heavy', 'Light', 'Charge', 'Release', 'Spawn', 'Cast', 'Block', 'Dodge']
+
+
+def extract_action_per_name(pattern, name, prefix, feature):
+    """Former extract_action_generic."""
+    if '.' in name:
+        name = os.path.splitext(name)[0]
+    name = pattern._strip_iterator(name)
+    name_lower = name.lower()
+    prefix_lower = prefix.lower()
+    feature_normalized = normalize_for_comparison(feature)
+    if name_lower.startswith(prefix_lower + '_') or name_lower.startswith(prefix_lower + '-'):
+        remaining = name[len(prefix) + 1:]
+    elif name_lower.startswith(prefix_lower):
+        remaining = name[len(prefix):]
+    else:
+        return None
+    if not remaining:
+        return None
+    parts = [p for p in remaining.replace('-', '_').replace(' ', '_').split('_') if p]
+    for i in range(1, len(parts) + 1):
+        if normalize_for_comparison('_'.join(parts[:i])) == feature_normalized:
+            if parts[i:]:
+                return '_'.join(parts[i:])
+            break
+    if normalize_for_comparison(remaining).startswith(feature_normalized):
+        norm_pos = orig_pos = 0
+        while norm_pos < len(feature_normalized) and orig_pos < len(remaining):
+            if remaining[orig_pos] not in '_- ':
+                norm_pos += 1
+            orig_pos += 1
+        return remaining[orig_pos:].lstrip('_- ') or None
+    return None
+
+
+def parse_per_name(pattern, names, user_values):
+    results = []
+    for name in names:
+        action = extract_action_per_name(pattern, name, user_values['prefix'], user_values['feature'])
+        results.append({**user_values, 'action': action} if action else None)
+    return results
+
+
+def main():
+    num_names = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    rng = random.Random(0)
+    features = ['Strong_Repair', 'StrongRepair', 'Weak_Ranged', 'Boss']
+    names = [f"Mechaflora_{rng.choice(features)}_" + '_'.join(rng.sample(WORDS, rng.randint(1, 3)))
+             + f"_{rng.randint(1, 20):02d}.wav" for _ in range(num_names)]
+    user_values = {'prefix': 'Mechaflora', 'feature': 'StrongRepair'}
+    pattern = NamingPattern("$prefix_$feature_$action")
+
+    start = time.perf_counter()
+    expected = parse_per_name(pattern, names, user_values)
+    per_name_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    serial = pattern.parse_many(names, user_values)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = pattern.parse_many(names, user_values, workers=workers)
+    parallel_time = time.perf_counter() - start
+
+    assert serial == expected and parallel == expected, "parse_many results differ"
+
+    print(f"{num_names} names")
+    print(f"  per-name parsing:       {per_name_time:8.3f} s")
+    print(f"  parse_many, serial:     {serial_time:8.3f} s  ({per_name_time / serial_time:5.1f}x)")
+    print(f"  parse_many, {workers:2d} procs:  {parallel_time:8.3f} s  ({per_name_time / parallel_time:5.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
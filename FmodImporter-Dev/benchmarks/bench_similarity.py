@@ -0,0 +1,122 @@
+"""Benchmark: edit-distance suffix similarity vs. the former character-overlap ratio.
+
+Accuracy: files whose suffix has a typo (substitution, deletion, insertion or
+adjacent swap) or is unrelated to every event are matched against a list of
+event suffixes; a match is correct when a typo finds its event and an
+unrelated suffix finds nothing.
+
+Throughput: every file suffix is matched against every event suffix, first by
+scoring each pair with the unbounded edit distance, then with the pruned,
+banded batch match of EditDistanceScorer.
+
+Usage:
+    python benchmarks/bench_similarity.py [events] [files]
+"""
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.similarity import (
+    EditDistanceScorer, SimilarityScorer, normalize_suffix, suffix_similarity
+)
+
+WORDS = ['Attack', 'Stun', 'Loop', 'Idle', 'Walk', 'Run', 'Jump', 'Hit', 'Death', 'Alert',
+         'Heavy', 'Light', 'Charge', 'Release', 'Spawn', 'Cast', 'Block', 'Dodge', 'Footstep',
+         'Grass', 'Metal', 'Explosion', 'Reload', 'Whoosh']
+
+
+def overlap_similarity(str1, str2):
+    """Former calculate_similarity (character-set overlap as the last tier)."""
+    if str1 == str2:
+        return 1.0
+    norm1, norm2 = normalize_suffix(str1), normalize_suffix(str2)
+    if norm1 == norm2:
+        return 0.95
+    if norm1 in norm2 or norm2 in norm1:
+        if abs(len(norm1) - len(norm2)) <= 1:
+            return 0.92
+        return min(len(norm1), len(norm2)) / max(len(norm1), len(norm2)) * 0.9
+    if max(len(norm1), len(norm2)) == 0:
+        return 0.0
+    set1, set2 = set(norm1), set(norm2)
+    return len(set1 & set2) / len(set1 | set2) * 0.7
+
+
+def unbounded_similarity(str1, str2):
+    return suffix_similarity(str1, str2, min_score=0.0)
+
+
+def typo(rng, word):
+    i = rng.randrange(1, len(word) - 1)
+    kind = rng.choice(['substitute', 'delete', 'insert', 'swap'])
+    if kind == 'substitute':
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+    if kind == 'delete':
+        return word[:i] + word[i + 1:]
+    if kind == 'insert':
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+    return word[:i - 1] + word[i] + word[i - 1] + word[i + 1:]
+
+
+def make_data(rng, num_events, num_files):
+    events = list(dict.fromkeys(
+        '_'.join(rng.sample(WORDS, rng.randint(2, 3))) for _ in range(num_events * 2)
+    ))[:num_events]
+    files = []
+    for _ in range(num_files):
+        if rng.random() < 0.7:
+            target = rng.randrange(len(events))
+            files.append((typo(rng, events[target]), target))
+        else:
+            files.append((''.join(rng.choice(string.ascii_letters) for _ in range(12)), None))
+    return events, files
+
+
+def accuracy(scorer, events, files):
+    correct = 0
+    for query, target in files:
+        index, _ = scorer.best_match(query, events)
+        correct += index == target or (index is not None and target is not None
+                                       and events[index] == events[target])
+    return correct / len(files)
+
+
+def main():
+    num_events = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    num_files = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    rng = random.Random(0)
+    events, files = make_data(rng, num_events, num_files)
+
+    print(f"{len(events)} event suffixes x {len(files)} file suffixes")
+    print("Accuracy (typos found, unrelated suffixes rejected):")
+    print(f"  character overlap:  {accuracy(SimilarityScorer(overlap_similarity), events, files):6.1%}")
+    print(f"  edit distance:      {accuracy(EditDistanceScorer(), events, files):6.1%}")
+
+    queries = [query for query, _ in files]
+
+    start = time.perf_counter()
+    pairwise = SimilarityScorer(unbounded_similarity)
+    expected = [pairwise.best_match(query, events) for query in queries]
+    pairwise_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scorer = EditDistanceScorer()
+    batched = [scorer.best_match(query, events) for query in queries]
+    batch_time = time.perf_counter() - start
+
+    assert batched == expected, "Batch results differ from pairwise scoring"
+
+    print("Throughput:")
+    print(f"  pairwise, unbounded:  {pairwise_time:8.3f} s  ({len(queries) / pairwise_time:8.0f} files/s)")
+    print(f"  batch, banded:        {batch_time:8.3f} s  ({len(queries) / batch_time:8.0f} files/s)")
+    print(f"  speedup:              {pairwise_time / batch_time:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
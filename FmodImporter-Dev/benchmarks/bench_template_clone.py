@@ -0,0 +1,132 @@
+"""Benchmark: compiled clone plan vs. the former two-pass template deep copy.
+
+Builds a template event with a realistic object graph, then times copying it
+with the old per-element deep copy and with ClonePlan.instantiate.
+
+Usage:
+    python benchmarks/bench_template_clone.py [objects] [copies]
+"""
+
+import sys
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core.template_cache import ParsedTemplate
+
+
+def deep_copy(template_root, new_name, dest_folder_id, bank_id, bus_id):
+    """Former copy_from_template loop (parse excluded)."""
+    new_event_id = "{" + str(uuid.uuid4()) + "}"
+    new_root = ET.Element('objects', serializationModel="Studio.02.02.00")
+
+    id_map = {}
+    for obj in template_root.findall(".//object"):
+        id_map[obj.get('id')] = "{" + str(uuid.uuid4()) + "}"
+
+    event_obj = template_root.find(".//object[@class='Event']")
+    if event_obj is not None:
+        id_map[event_obj.get('id')] = new_event_id
+
+    for obj in template_root.findall(".//object"):
+        new_obj = ET.SubElement(new_root, 'object')
+        new_obj.set('class', obj.get('class'))
+        new_obj.set('id', id_map[obj.get('id')])
+
+        for prop in obj.findall('property'):
+            if obj.get('class') == 'EventMixerMaster' and prop.get('name') == 'name':
+                continue
+            new_prop = ET.SubElement(new_obj, 'property')
+            new_prop.set('name', prop.get('name'))
+            value_elem = prop.find('value')
+            if value_elem is not None:
+                new_value = ET.SubElement(new_prop, 'value')
+                if obj.get('class') == 'Event' and prop.get('name') == 'name':
+                    new_value.text = new_name
+                else:
+                    new_value.text = value_elem.text
+
+        for rel in obj.findall('relationship'):
+            new_rel = ET.SubElement(new_obj, 'relationship')
+            new_rel.set('name', rel.get('name'))
+            if obj.get('class') == 'Event':
+                if rel.get('name') == 'folder':
+                    ET.SubElement(new_rel, 'destination').text = dest_folder_id
+                    continue
+                elif rel.get('name') == 'banks':
+                    ET.SubElement(new_rel, 'destination').text = bank_id
+                    continue
+            if obj.get('class') == 'MixerInput' and rel.get('name') == 'output':
+                ET.SubElement(new_rel, 'destination').text = bus_id
+                continue
+            for dest_elem in rel.findall('destination'):
+                new_dest = ET.SubElement(new_rel, 'destination')
+                new_dest.text = id_map.get(dest_elem.text, dest_elem.text)
+
+    return new_root
+
+
+def build_template(num_objects: int) -> ET.Element:
+    root = ET.Element('objects', serializationModel="Studio.02.02.00")
+    ids = [f"{{{uuid.uuid4()}}}" for _ in range(num_objects)]
+
+    event = ET.SubElement(root, 'object', {'class': 'Event', 'id': ids[0]})
+    for name, value in (('name', 'Template'), ('outputFormat', '1')):
+        ET.SubElement(ET.SubElement(event, 'property', name=name), 'value').text = value
+    for name, dest in (('folder', '{folder}'), ('banks', '{bank}'), ('mixerInput', ids[1])):
+        ET.SubElement(ET.SubElement(event, 'relationship', name=name), 'destination').text = dest
+
+    mixer_input = ET.SubElement(root, 'object', {'class': 'MixerInput', 'id': ids[1]})
+    ET.SubElement(ET.SubElement(mixer_input, 'relationship', name='output'), 'destination').text = '{bus}'
+
+    classes = ['MixerBusEffectChain', 'MixerBusFader', 'MixerBusPanner', 'SingleSound', 'EventMixerMaster']
+    for i in range(2, num_objects):
+        obj = ET.SubElement(root, 'object', {'class': classes[i % len(classes)], 'id': ids[i]})
+        for name, value in (('name', f'Object {i}'), ('volume', '-3')):
+            ET.SubElement(ET.SubElement(obj, 'property', name=name), 'value').text = value
+        rel = ET.SubElement(obj, 'relationship', name='effects')
+        ET.SubElement(rel, 'destination').text = ids[(i * 7) % num_objects]
+        ET.SubElement(rel, 'destination').text = '{external}'
+    return root
+
+
+def best_of(func, repeats: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    num_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    copies = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    template_root = build_template(num_objects)
+    plan = ParsedTemplate(template_root).clone_plan
+
+    def run_deep_copy():
+        for i in range(copies):
+            deep_copy(template_root, f'Event_{i}', '{dest}', '{bank-1}', '{bus-1}')
+
+    def run_clone_plan():
+        for i in range(copies):
+            root = ET.Element('objects', serializationModel="Studio.02.02.00")
+            plan.instantiate(root, "{" + str(uuid.uuid4()) + "}", f'Event_{i}',
+                             '{dest}', '{bank-1}', '{bus-1}')
+
+    old_time = best_of(run_deep_copy)
+    new_time = best_of(run_clone_plan)
+
+    print(f"{copies} copies of a {num_objects}-object template, best of 5")
+    print(f"  two-pass deep copy: {old_time * 1000:8.1f} ms ({old_time / copies * 1e6:6.1f} us/copy)")
+    print(f"  compiled plan:      {new_time * 1000:8.1f} ms ({new_time / copies * 1e6:6.1f} us/copy)")
+    print(f"  speedup:            {old_time / new_time:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
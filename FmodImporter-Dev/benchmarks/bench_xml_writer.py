@@ -0,0 +1,77 @@
+"""Benchmark: streaming write_pretty_xml vs. the former minidom round-trip.
+
+Builds a large Event-like tree (thousands of objects with properties and
+relationships), writes it with both implementations, checks that the bytes
+are identical and prints the timings.
+
+Usage:
+    python benchmarks/bench_xml_writer.py [objects] [repeats]
+"""
+
+import sys
+import tempfile
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core.xml_writer import write_pretty_xml
+
+
+def write_pretty_xml_minidom(element: ET.Element, filepath: Path):
+    """Former implementation: serialize, re-parse into a DOM, pretty-print."""
+    xml_str = ET.tostring(element, encoding='unicode')
+    dom = minidom.parseString(xml_str)
+    with open(filepath, 'wb') as f:
+        f.write(dom.toprettyxml(indent='\t', encoding='UTF-8'))
+
+
+def build_event(num_objects: int) -> ET.Element:
+    root = ET.Element('objects', serializationModel="Studio.02.02.00")
+    for i in range(num_objects):
+        obj = ET.SubElement(root, 'object', {'class': 'SingleSound', 'id': f"{{{uuid.uuid4()}}}"})
+        for name, value in (('name', f"Sound_{i}"), ('start', "0"), ('length', "1.25")):
+            prop = ET.SubElement(obj, 'property', name=name)
+            ET.SubElement(prop, 'value').text = value
+        for name in ('audioFile', 'mixer'):
+            rel = ET.SubElement(obj, 'relationship', name=name)
+            ET.SubElement(rel, 'destination').text = f"{{{uuid.uuid4()}}}"
+    return root
+
+
+def best_of(func, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    num_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    root = build_event(num_objects)
+    with tempfile.TemporaryDirectory() as tmp:
+        old_file = Path(tmp) / "minidom.xml"
+        new_file = Path(tmp) / "stream.xml"
+
+        old_time = best_of(lambda: write_pretty_xml_minidom(root, old_file), repeats)
+        new_time = best_of(lambda: write_pretty_xml(root, new_file), repeats)
+
+        identical = old_file.read_bytes() == new_file.read_bytes()
+        size_kb = new_file.stat().st_size / 1024
+
+    print(f"Event with {num_objects} objects ({size_kb:.0f} KB), best of {repeats}")
+    print(f"  minidom round-trip: {old_time * 1000:8.1f} ms")
+    print(f"  streaming writer:   {new_time * 1000:8.1f} ms")
+    print(f"  speedup:            {old_time / new_time:8.1f}x")
+    print(f"  byte-identical:     {identical}")
+
+
+if __name__ == '__main__':
+    main()
@@ -21,7 +21,10 @@ __all__ = [
 
 def main():
     """Entry point for the FMOD Importer application."""
+    import multiprocessing
     import tkinter as tk
+    # Required for the metadata parsing process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = FmodImporterGUI(root)
     root.mainloop()
@@ -0,0 +1,217 @@
+"""
+Action Vocabulary Module
+Loads user-defined action keywords from vocabulary files and caches their
+compiled keyword automaton on disk.
+
+A vocabulary file is plain text with one action per line; blank lines and
+lines starting with '#' are ignored. Order is priority, so list multi-word
+actions before the words they contain:
+
+    # Studio actions
+    GrappleStart
+    Grapple
+    Overheat
+
+Vocabularies are looked up next to a preset ("<preset>.actions.txt" beside
+"<preset>.json") or next to an FMOD project ("fmod_importer_actions.txt"
+beside the .fspro file). Their actions come before NamingPattern's built-in
+ACTION_KEYWORDS.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .keyword_automaton import KeywordAutomaton
+
+# Vocabulary file beside a preset JSON file: <preset>.actions.txt
+PRESET_VOCABULARY_SUFFIX = ".actions.txt"
+
+# Vocabulary file beside an FMOD project's .fspro file
+PROJECT_VOCABULARY_FILE = "fmod_importer_actions.txt"
+
+# Bump whenever the compiled cache layout changes
+VOCABULARY_CACHE_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """Get the compiled vocabulary cache directory, next to the presets."""
+    return Path.home() / ".fmod_importer_presets" / ".action_vocabularies"
+
+
+def read_vocabulary(vocabulary_file: Path) -> List[str]:
+    """
+    Read the actions of a vocabulary file.
+
+    Args:
+        vocabulary_file: Path to the vocabulary file
+
+    Returns:
+        Actions in file order (duplicates removed)
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    return _parse_vocabulary(_read_vocabulary_text(vocabulary_file))
+
+
+def _read_vocabulary_text(vocabulary_file: Path) -> str:
+    with open(vocabulary_file, 'r', encoding='utf-8-sig') as f:
+        return f.read()
+
+
+def _parse_vocabulary(text: str) -> List[str]:
+    actions = []
+    for line in text.splitlines():
+        action = line.strip()
+        if action and not action.startswith('#'):
+            actions.append(action)
+    return list(dict.fromkeys(actions))
+
+
+def find_vocabulary_file(preset_path: Optional[Path] = None,
+                         project_path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Find the vocabulary file of a preset or project (the preset's wins).
+
+    Args:
+        preset_path: Path to a preset JSON file
+        project_path: Path to an FMOD project's .fspro file
+
+    Returns:
+        Path of the vocabulary file, or None if there is none
+    """
+    candidates = []
+    if preset_path is not None:
+        preset_path = Path(preset_path)
+        candidates.append(preset_path.with_name(preset_path.stem + PRESET_VOCABULARY_SUFFIX))
+    if project_path is not None:
+        candidates.append(Path(project_path).parent / PROJECT_VOCABULARY_FILE)
+
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+class VocabularyCache:
+    """
+    Compiled keyword automatons of vocabulary files, keyed by content hash.
+
+    The hash covers the vocabulary text and the built-in keywords, so editing
+    a vocabulary (or upgrading the tool) simply produces a new cache entry.
+    Only the most recently used entries are kept on disk. Loaded automatons
+    are also kept in memory for the rest of the session.
+    """
+
+    # Compiled entries kept on disk (least recently used are deleted first)
+    MAX_CACHE_FILES = 32
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Directory of the compiled cache files (None keeps them in memory only)
+        """
+        self.cache_dir = cache_dir
+        self._automatons: Dict[str, KeywordAutomaton] = {}
+
+    @classmethod
+    def default(cls) -> 'VocabularyCache':
+        """Get a cache stored next to the presets."""
+        return cls(default_cache_dir())
+
+    @staticmethod
+    def _content_hash(text: str, builtin_keywords) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(f"v{VOCABULARY_CACHE_VERSION}\n".encode('utf-8'))
+        hasher.update('\n'.join(builtin_keywords).encode('utf-8'))
+        hasher.update(b'\0')
+        hasher.update(text.encode('utf-8'))
+        return hasher.hexdigest()
+
+    def _read_compiled(self, cache_file: Path) -> Optional[KeywordAutomaton]:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != VOCABULARY_CACHE_VERSION:
+                return None
+            automaton = KeywordAutomaton.from_dict(data['automaton'])
+            os.utime(cache_file)  # Mark as recently used for _prune
+            return automaton
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Ignoring unreadable vocabulary cache {cache_file}: {e}")
+            return None
+
+    def _write_compiled(self, cache_file: Path, automaton: KeywordAutomaton):
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': VOCABULARY_CACHE_VERSION, 'automaton': automaton.to_dict()}, f,
+                          separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: Failed to save vocabulary cache {cache_file}: {e}")
+            return
+        self._prune(cache_file)
+
+    def _prune(self, written: Path):
+        """Delete the least recently used entries beyond MAX_CACHE_FILES."""
+        cache_dir = written.parent
+        try:
+            entries = []
+            for cache_file in cache_dir.glob('*.json'):
+                entries.append((cache_file.stat().st_mtime_ns, cache_file))
+        except OSError as e:
+            print(f"Warning: Failed to list vocabulary cache {cache_dir}: {e}")
+            return
+
+        entries.sort(reverse=True)
+        for _, cache_file in entries[self.MAX_CACHE_FILES:]:
+            if cache_file == written or cache_file.stem in self._automatons:
+                continue  # The new entry, or one loaded by this session
+            try:
+                cache_file.unlink()
+            except OSError as e:
+                print(f"Warning: Failed to delete vocabulary cache {cache_file}: {e}")
+
+    def load(self, vocabulary_file: Path, builtin_keywords=None) -> KeywordAutomaton:
+        """
+        Get the compiled keyword automaton of a vocabulary file.
+
+        Args:
+            vocabulary_file: Path to the vocabulary file
+            builtin_keywords: Keywords appended after the vocabulary's actions
+                              (defaults to NamingPattern.ACTION_KEYWORDS)
+
+        Returns:
+            Automaton of the lowercased keywords, ready for NamingPattern(action_keywords=...)
+
+        Raises:
+            OSError: If the vocabulary file cannot be read
+        """
+        if builtin_keywords is None:
+            from .naming import NamingPattern
+            builtin_keywords = NamingPattern.ACTION_KEYWORDS
+
+        text = _read_vocabulary_text(vocabulary_file)
+        content_hash = self._content_hash(text, builtin_keywords)
+
+        automaton = self._automatons.get(content_hash)
+        if automaton is not None:
+            return automaton
+
+        cache_file = self.cache_dir / f"{content_hash}.json" if self.cache_dir is not None else None
+        if cache_file is not None and cache_file.exists():
+            automaton = self._read_compiled(cache_file)
+
+        if automaton is None:
+            keywords = _parse_vocabulary(text) + list(builtin_keywords)
+            automaton = KeywordAutomaton(keyword.lower() for keyword in keywords)
+            if cache_file is not None:
+                self._write_compiled(cache_file, automaton)
+
+        self._automatons[content_hash] = automaton
+        return automaton
@@ -5,6 +5,7 @@ manipulation, extracted from the monolithic project.py for better maintainabilit
 """
 
 from .xml_loader import XMLLoader
+from .metadata_cache import MetadataCache
 from .xml_writer import write_pretty_xml
 from .pending_folder_manager import PendingFolderManager
 from .bus_manager import BusManager
@@ -12,10 +13,20 @@ from .bank_manager import BankManager
 from .event_folder_manager import EventFolderManager
 from .asset_folder_manager import AssetFolderManager
 from .event_creator import EventCreator
+from .event_index import EventIndex
+from .folder_tree import FolderTree
+from .import_plan import ImportPlan
+from .copy_pipeline import CopyPipeline, CopyProgress
+from .asset_index import AssetIndex, FileHashCache
+from .asset_placement import AssetPlacer, PLACEMENT_STRATEGIES
+from .audio_headers import AudioInfo, read_audio_header
+from .audio_probe import AudioProbe
+from .batch_importer import BatchImporter
 from .audio_file_manager import AudioFileManager
 
 __all__ = [
     'XMLLoader',
+    'MetadataCache',
     'write_pretty_xml',
     'PendingFolderManager',
     'BusManager',
@@ -23,5 +34,18 @@ __all__ = [
     'EventFolderManager',
     'AssetFolderManager',
     'EventCreator',
+    'EventIndex',
+    'FolderTree',
+    'ImportPlan',
+    'CopyPipeline',
+    'CopyProgress',
+    'AssetIndex',
+    'FileHashCache',
+    'AssetPlacer',
+    'PLACEMENT_STRATEGIES',
+    'AudioInfo',
+    'read_audio_header',
+    'AudioProbe',
+    'BatchImporter',
     'AudioFileManager',
 ]
@@ -0,0 +1,210 @@
+"""Content-hash index of the project's audio assets.
+
+Lets imports recognise media that is already in the project: when the file at
+an asset path is byte-identical to the source, the copy is skipped and the
+existing AudioFile object is reused.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .metadata_cache import project_cache_path
+
+# Bump whenever the digest algorithm or entry layout changes
+HASH_CACHE_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """
+    Compute the BLAKE2b digest of a file's contents.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    hasher = hashlib.blake2b(digest_size=32)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class FileHashCache:
+    """Persistent file digests keyed by path, size and modification time."""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Initialize the cache and load any existing entries from disk.
+
+        Args:
+            cache_file: Path of the JSON cache file (None keeps it in memory only)
+        """
+        self.cache_file = cache_file
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_path: Path) -> 'FileHashCache':
+        """Get the hash cache of a project, stored in the user cache directory."""
+        return cls(project_cache_path(project_path, "_hashes"))
+
+    def _load(self):
+        """Load the cache file, discarding it if missing, corrupt or outdated."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable hash cache {self.cache_file}: {e}")
+            return
+
+        if data.get('version') == HASH_CACHE_VERSION:
+            self._entries = data.get('files', {})
+
+    def digest(self, path: Path, stat: Optional[os.stat_result] = None) -> str:
+        """
+        Get the digest of a file, hashing it only if it changed since last time.
+
+        Args:
+            path: File to hash
+            stat: Current stat result of the file (looked up if omitted)
+
+        Returns:
+            Hex digest string
+        """
+        if stat is None:
+            stat = os.stat(path)
+        key = os.path.normcase(os.path.abspath(path))
+
+        entry = self._entries.get(key)
+        if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['digest']
+
+        digest = file_digest(path)
+        with self._lock:
+            self._entries[key] = {
+                'mtime': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'digest': digest
+            }
+            self._dirty = True
+        return digest
+
+    def save(self):
+        """Write the cache to disk if anything changed (atomic replace)."""
+        if self.cache_file is None or not self._dirty:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': HASH_CACHE_VERSION, 'files': self._entries}, f,
+                          separators=(',', ':'))
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: Failed to save hash cache {self.cache_file}: {e}")
+
+
+class AssetIndex:
+    """Maps asset paths to AudioFile IDs and detects identical media."""
+
+    def __init__(self, assets_path: Path, audio_files: Dict[str, str],
+                 hash_cache: Optional[FileHashCache] = None):
+        """
+        Initialize the index.
+
+        Args:
+            assets_path: Path to the project's Assets directory
+            audio_files: Existing AudioFile objects (asset path -> AudioFile ID)
+            hash_cache: Digest cache (in-memory cache if omitted)
+        """
+        self.assets_path = assets_path
+        self.audio_files = {self._key(path): audio_id for path, audio_id in audio_files.items()}
+        self.hash_cache = hash_cache if hash_cache is not None else FileHashCache()
+        self._planned = {}  # Asset path -> source file queued by the current import
+
+    @staticmethod
+    def _key(asset_path: str) -> str:
+        return asset_path.replace('\\', '/')
+
+    def _same_content(self, src: Path, other: Path) -> bool:
+        """Check whether two files are byte-identical (size first, then digest)."""
+        try:
+            src_stat = os.stat(src)
+            other_stat = os.stat(other)
+        except OSError:
+            return False
+
+        if os.path.samestat(src_stat, other_stat):
+            return True
+        if src_stat.st_size != other_stat.st_size:
+            return False
+        return self.hash_cache.digest(src, src_stat) == self.hash_cache.digest(other, other_stat)
+
+    def lookup(self, src: Path, asset_path: str) -> Tuple[Optional[str], bool]:
+        """
+        Check whether a source file is already present at an asset path.
+
+        Args:
+            src: Source audio file
+            asset_path: Asset path within the project (e.g., "Characters/Cat.wav")
+
+        Returns:
+            Tuple of (AudioFile ID to reuse or None, True if the copy can be skipped)
+        """
+        key = self._key(asset_path)
+
+        # Already queued by this import (the asset file may not be copied yet)
+        planned = self._planned.get(key)
+        if planned is not None:
+            if self._same_content(src, planned):
+                return self.audio_files.get(key), True
+            return None, False
+
+        if not self._same_content(src, self.assets_path / key):
+            return None, False
+        return self.audio_files.get(key), True
+
+    def add(self, asset_path: str, audio_file_id: str, src: Path):
+        """
+        Register an AudioFile created (or planned) by an import.
+
+        Args:
+            asset_path: Asset path of the new AudioFile
+            audio_file_id: ID of the new AudioFile
+            src: Source file that is copied to the asset path
+        """
+        key = self._key(asset_path)
+        self.audio_files[key] = audio_file_id
+        self._planned[key] = Path(src)
+
+    def discard(self, asset_path: str, audio_file_id: str):
+        """
+        Unregister an AudioFile added by an import that was not written after all.
+
+        Args:
+            asset_path: Asset path of the AudioFile
+            audio_file_id: ID passed to add()
+        """
+        key = self._key(asset_path)
+        if self.audio_files.get(key) == audio_file_id:
+            del self.audio_files[key]
+            self._planned.pop(key, None)
+
+    def save(self):
+        """Persist the digest cache."""
+        self.hash_cache.save()
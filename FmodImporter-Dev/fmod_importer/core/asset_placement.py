@@ -0,0 +1,160 @@
+"""Audio asset placement strategies.
+
+Decides how a source file ends up at its path in the project's Assets folder:
+a regular copy, a copy-on-write clone (reflink), a hard link, or no write at
+all when an identical file is already there. Strategies the platform or
+filesystem cannot honour fall back to a regular copy.
+"""
+
+import errno
+import filecmp
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+COPY = 'copy'
+REFLINK = 'reflink'
+HARDLINK = 'hardlink'
+SKIP_IDENTICAL = 'skip_identical'
+
+# Strategy actually used when an identical file was left in place
+SKIPPED = 'skipped'
+
+PLACEMENT_STRATEGIES = (COPY, REFLINK, HARDLINK, SKIP_IDENTICAL)
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)), supported by Btrfs, XFS and others
+_FICLONE = 0x40049409
+
+# Errors meaning "this filesystem pair cannot do it", as opposed to I/O failures
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EPERM, errno.EINVAL, errno.ENOTTY, errno.EBADF,
+    errno.EMLINK, getattr(errno, 'EOPNOTSUPP', errno.EINVAL),
+    getattr(errno, 'ENOTSUP', errno.EINVAL), getattr(errno, 'ENOSYS', errno.EINVAL),
+}
+
+
+def _reflink(src: Path, dest: Path):
+    """Clone src to dest sharing data blocks (Linux FICLONE)."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.ENOTSUP, "Reflink is not supported on this platform")
+
+    with open(src, 'rb') as fsrc:
+        try:
+            with open(dest, 'wb') as fdest:
+                fcntl.ioctl(fdest.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            try:
+                os.unlink(dest)
+            except OSError:
+                pass
+            raise
+    shutil.copystat(src, dest)
+
+
+def _hardlink(src: Path, dest: Path):
+    """Hard link dest to src, replacing an existing different file."""
+    if os.path.lexists(dest):
+        if os.path.samefile(src, dest):
+            return
+        os.unlink(dest)
+    os.link(src, dest)
+
+
+def _detach(dest: Path):
+    """Unlink a hard-linked destination so writing to it cannot modify the other links."""
+    try:
+        if os.stat(dest).st_nlink > 1:
+            os.unlink(dest)
+    except FileNotFoundError:
+        pass
+
+
+def _is_identical(src: Path, dest: Path) -> bool:
+    """Check whether dest exists with exactly the content of src."""
+    try:
+        return filecmp.cmp(src, dest, shallow=False)
+    except OSError:
+        return False
+
+
+class AssetPlacer:
+    """Places files with a strategy, falling back to a copy when unsupported."""
+
+    def __init__(self, strategy: str = COPY):
+        """
+        Initialize the placer.
+
+        Args:
+            strategy: One of PLACEMENT_STRATEGIES
+
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        if strategy not in PLACEMENT_STRATEGIES:
+            raise ValueError(f"Unknown asset placement strategy: {strategy}")
+        self.strategy = strategy
+        self._lock = threading.Lock()
+        self._unsupported = set()  # (strategy, src device, dest device) known to fail
+        self.counts: Dict[str, int] = {}
+
+    def _device_pair(self, src: Path, dest: Path) -> Tuple[int, int]:
+        try:
+            return os.stat(src).st_dev, os.stat(dest.parent).st_dev
+        except OSError:
+            return -1, -1
+
+    def _try_link(self, link, src: Path, dest: Path) -> bool:
+        """Run a reflink/hardlink, remembering device pairs where it is unsupported."""
+        key = (self.strategy,) + self._device_pair(src, dest)
+        if key in self._unsupported:
+            return False
+
+        try:
+            link(src, dest)
+            return True
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            with self._lock:
+                if key not in self._unsupported:
+                    self._unsupported.add(key)
+                    print(f"Warning: {self.strategy} is not supported for {dest.parent}, "
+                          f"copying instead ({e})")
+            return False
+
+    def place(self, src: Path, dest: Path) -> str:
+        """
+        Place one file at its destination (the parent directory must exist).
+
+        Args:
+            src: Source file
+            dest: Destination file
+
+        Returns:
+            Strategy actually used: COPY, REFLINK, HARDLINK or SKIPPED
+        """
+        src, dest = Path(src), Path(dest)
+
+        if os.path.exists(dest) and os.path.samefile(src, dest):
+            # Already linked to the source by an earlier hardlink import
+            used = SKIPPED if self.strategy != HARDLINK else HARDLINK
+        elif self.strategy == SKIP_IDENTICAL and _is_identical(src, dest):
+            used = SKIPPED
+        elif self.strategy == HARDLINK and self._try_link(_hardlink, src, dest):
+            used = HARDLINK
+        else:
+            # Never write through a hard link into the user's original media
+            _detach(dest)
+            if self.strategy == REFLINK and self._try_link(_reflink, src, dest):
+                used = REFLINK
+            else:
+                shutil.copy2(src, dest)
+                used = COPY
+
+        with self._lock:
+            self.counts[used] = self.counts.get(used, 0) + 1
+        return used
@@ -4,20 +4,25 @@ Handles creation of AudioFile XML entries with audio properties.
 """
 
 import uuid
-import wave
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from .xml_writer import write_pretty_xml
+from .import_plan import ImportPlan
+from .audio_probe import AudioProbe
 
 
 class AudioFileManager:
     """Static methods for audio file operations."""
 
+    # Header probes shared with EventCreator (keyed by path + mtime)
+    audio_probe = AudioProbe()
+
     @staticmethod
     def create(audio_file_path: str, asset_relative_path: str,
-               metadata_path: Path, workspace: Dict) -> str:
+               metadata_path: Path, workspace: Dict,
+               plan: Optional[ImportPlan] = None) -> str:
         """
         Create an AudioFile XML entry in the FMOD project.
 
@@ -26,6 +31,7 @@ class AudioFileManager:
             asset_relative_path: Relative path within FMOD project (e.g., "Characters/Cat.wav")
             metadata_path: Path to the Metadata directory
             workspace: Workspace dictionary with master folder references
+            plan: Import plan to record the write in instead of writing now
 
         Returns:
             The new AudioFile UUID
@@ -36,22 +42,16 @@ class AudioFileManager:
         # Generate new UUID for AudioFile
         audio_file_id = "{" + str(uuid.uuid4()) + "}"
 
-        # Read audio file properties
+        # Read audio file properties (header only, cached)
         try:
-            with wave.open(audio_file_path, 'rb') as wav_file:
-                # Get audio properties
-                channel_count = wav_file.getnchannels()
-                sample_rate = wav_file.getframerate()
-                n_frames = wav_file.getnframes()
-
-                # Calculate frequency in kHz
-                frequency_khz = sample_rate / 1000.0
-
-                # Calculate length in seconds
-                length_seconds = n_frames / float(sample_rate)
+            info = AudioFileManager.audio_probe.probe(audio_file_path)
         except Exception as e:
             raise ValueError(f"Failed to read audio file properties: {e}")
 
+        channel_count = info.channels
+        frequency_khz = info.sample_rate / 1000.0
+        length_seconds = info.duration
+
         # Create XML structure
         root = ET.Element('objects', serializationModel="Studio.02.02.00")
         obj = ET.SubElement(root, 'object', {'class': 'AudioFile', 'id': audio_file_id})
@@ -81,12 +81,16 @@ class AudioFileManager:
         dest = ET.SubElement(rel, 'destination')
         dest.text = workspace['masterAssetFolder']
 
-        # Ensure AudioFile directory exists
         audio_file_dir = metadata_path / "AudioFile"
+        audio_file_xml_path = audio_file_dir / f"{audio_file_id}.xml"
+        if plan is not None:
+            plan.write_xml(root, audio_file_xml_path)
+            return audio_file_id
+
+        # Ensure AudioFile directory exists
         audio_file_dir.mkdir(exist_ok=True)
 
         # Write XML to file
-        audio_file_xml_path = audio_file_dir / f"{audio_file_id}.xml"
         write_pretty_xml(root, audio_file_xml_path)
 
         return audio_file_id
@@ -0,0 +1,393 @@
+"""Audio file header parsing.
+
+Reads the stream properties FMOD needs (channels, sample rate, length) from
+the header of an audio file without decoding or reading its sample data.
+Supports WAV (RIFF/RF64), AIFF/AIFF-C, FLAC, Ogg Vorbis/Opus and MP3.
+"""
+
+import struct
+from typing import BinaryIO, NamedTuple, Optional
+
+# Bytes searched for an MP3 frame sync or the last Ogg page
+_SCAN_SIZE = 64 * 1024
+
+# WAVE format tags accepted by FMOD Studio
+_WAVE_FORMATS = {
+    0x0001: 'pcm',
+    0x0003: 'float',
+    0xFFFE: 'extensible',
+}
+
+
+class AudioInfo(NamedTuple):
+    """Stream properties of an audio file."""
+    channels: int
+    sample_rate: int
+    frames: int
+    duration: float  # Seconds
+    format: str  # Container/codec, e.g. "wav/pcm"
+
+
+def _make_info(channels: int, sample_rate: int, frames: int, fmt: str) -> AudioInfo:
+    if channels <= 0 or sample_rate <= 0:
+        raise ValueError(f"Invalid {fmt} header: {channels} channels at {sample_rate} Hz")
+    return AudioInfo(channels, sample_rate, frames, frames / float(sample_rate), fmt)
+
+
+def read_wav_header(f: BinaryIO) -> AudioInfo:
+    """
+    Parse a RIFF/RF64 WAVE header.
+
+    Walks the chunk list up to the 'data' chunk, seeking over everything else,
+    so only a few hundred bytes are read whatever the file size.
+
+    Args:
+        f: Binary file positioned at the start of the file
+
+    Returns:
+        AudioInfo of the file
+
+    Raises:
+        ValueError: If the file is not a supported WAVE file
+    """
+    header = f.read(12)
+    if len(header) < 12 or header[8:12] != b'WAVE' or header[:4] not in (b'RIFF', b'RF64'):
+        raise ValueError("Not a RIFF WAVE file")
+
+    fmt = None
+    ds64_data_size = None
+
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("WAVE file has no data chunk")
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+
+        if chunk_id == b'fmt ':
+            data = f.read(chunk_size)
+            if len(data) < 16:
+                raise ValueError("Truncated WAVE fmt chunk")
+            format_tag, channels, sample_rate, _, block_align = struct.unpack('<HHIIH', data[:14])
+            if format_tag not in _WAVE_FORMATS:
+                raise ValueError(f"Unsupported WAVE format tag: 0x{format_tag:04x}")
+            fmt = (format_tag, channels, sample_rate, block_align)
+        elif chunk_id == b'ds64':
+            data = f.read(chunk_size)
+            if len(data) >= 16:
+                ds64_data_size = struct.unpack('<Q', data[8:16])[0]
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise ValueError("WAVE data chunk before fmt chunk")
+            format_tag, channels, sample_rate, block_align = fmt
+            if chunk_size == 0xFFFFFFFF and ds64_data_size is not None:
+                chunk_size = ds64_data_size
+            frames = chunk_size // block_align if block_align else 0
+            return _make_info(channels, sample_rate, frames, f"wav/{_WAVE_FORMATS[format_tag]}")
+        else:
+            f.seek(chunk_size, 1)
+
+        # Chunks are padded to an even size
+        if chunk_size & 1:
+            f.seek(1, 1)
+
+
+def _read_exactly(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) < size:
+        raise ValueError("Truncated audio header")
+    return data
+
+
+def _extended_to_float(data: bytes) -> float:
+    """Convert an 80-bit IEEE 754 extended float (AIFF sample rate)."""
+    exponent, mantissa = struct.unpack('>HQ', data)
+    sign = -1.0 if exponent & 0x8000 else 1.0
+    exponent &= 0x7FFF
+    if exponent == 0 and mantissa == 0:
+        return 0.0
+    return sign * mantissa * 2.0 ** (exponent - 16383 - 63)
+
+
+def read_aiff_header(f: BinaryIO) -> AudioInfo:
+    """
+    Parse an AIFF or AIFF-C header (COMM chunk).
+
+    Args:
+        f: Binary file positioned at the start of the file
+
+    Returns:
+        AudioInfo of the file
+
+    Raises:
+        ValueError: If the file is not an AIFF file
+    """
+    header = _read_exactly(f, 12)
+    if header[:4] != b'FORM' or header[8:12] not in (b'AIFF', b'AIFC'):
+        raise ValueError("Not an AIFF file")
+    is_aifc = header[8:12] == b'AIFC'
+
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("AIFF file has no COMM chunk")
+        chunk_id, chunk_size = struct.unpack('>4sI', chunk_header)
+
+        if chunk_id == b'COMM':
+            data = _read_exactly(f, chunk_size)
+            if len(data) < 18:
+                raise ValueError("Truncated AIFF COMM chunk")
+            channels, frames, _ = struct.unpack('>HIH', data[:8])
+            sample_rate = int(round(_extended_to_float(data[8:18])))
+            fmt = 'aiff'
+            if is_aifc and len(data) >= 22:
+                fmt = 'aifc/' + data[18:22].decode('latin-1').strip().lower()
+            return _make_info(channels, sample_rate, frames, fmt)
+
+        f.seek(chunk_size + (chunk_size & 1), 1)
+
+
+def read_flac_header(f: BinaryIO) -> AudioInfo:
+    """
+    Parse the STREAMINFO block of a FLAC file.
+
+    Args:
+        f: Binary file positioned at the "fLaC" marker
+
+    Returns:
+        AudioInfo of the file
+
+    Raises:
+        ValueError: If the file is not a FLAC file
+    """
+    if _read_exactly(f, 4) != b'fLaC':
+        raise ValueError("Not a FLAC file")
+
+    block_header = _read_exactly(f, 4)
+    if block_header[0] & 0x7F != 0:
+        raise ValueError("FLAC file does not start with STREAMINFO")
+    info = _read_exactly(f, 34)
+
+    # 20 bits sample rate, 3 bits channels - 1, 5 bits bits per sample - 1, 36 bits total samples
+    packed = int.from_bytes(info[10:18], 'big')
+    sample_rate = packed >> 44
+    channels = ((packed >> 41) & 0x7) + 1
+    frames = packed & 0xFFFFFFFFF
+    return _make_info(channels, sample_rate, frames, 'flac')
+
+
+def read_ogg_header(f: BinaryIO) -> AudioInfo:
+    """
+    Parse an Ogg Vorbis or Ogg Opus file.
+
+    Channels and rate come from the identification header in the first page;
+    the length comes from the granule position of the last page.
+
+    Args:
+        f: Binary file positioned at the start of the file
+
+    Returns:
+        AudioInfo of the file
+
+    Raises:
+        ValueError: If the file is not an Ogg Vorbis/Opus file
+    """
+    page = _read_exactly(f, 27)
+    if page[:4] != b'OggS':
+        raise ValueError("Not an Ogg file")
+    segment_count = page[26]
+    f.seek(segment_count, 1)
+    packet = f.read(19)
+
+    if packet[:7] == b'\x01vorbis' and len(packet) >= 16:
+        channels = packet[11]
+        sample_rate = struct.unpack('<I', packet[12:16])[0]
+        pre_skip = 0
+        fmt = 'ogg/vorbis'
+    elif packet[:8] == b'OpusHead' and len(packet) >= 12:
+        # Opus always decodes at 48 kHz; granule positions count 48 kHz samples
+        channels = packet[9]
+        pre_skip = struct.unpack('<H', packet[10:12])[0]
+        sample_rate = 48000
+        fmt = 'ogg/opus'
+    else:
+        raise ValueError("Unsupported Ogg codec (expected Vorbis or Opus)")
+
+    # Granule position of the last page = total samples
+    f.seek(0, 2)
+    file_size = f.tell()
+    f.seek(max(0, file_size - _SCAN_SIZE))
+    tail = f.read()
+    last_page = tail.rfind(b'OggS')
+    frames = 0
+    if last_page >= 0 and last_page + 14 <= len(tail):
+        granule = struct.unpack('<q', tail[last_page + 6:last_page + 14])[0]
+        frames = max(0, granule - pre_skip)
+    return _make_info(channels, sample_rate, frames, fmt)
+
+
+# MPEG audio tables, indexed by [version][layer] (version: 1 = MPEG-1, 2 = MPEG-2/2.5)
+_MP3_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    0b11: (44100, 48000, 32000),  # MPEG-1
+    0b10: (22050, 24000, 16000),  # MPEG-2
+    0b00: (11025, 12000, 8000),   # MPEG-2.5
+}
+
+
+class _MpegFrame(NamedTuple):
+    version: int  # 1 = MPEG-1, 2 = MPEG-2/2.5
+    layer: int
+    bitrate: int  # kbit/s
+    sample_rate: int
+    channels: int
+    samples_per_frame: int
+    length: int  # Bytes
+
+
+def _parse_mpeg_frame(header: bytes) -> Optional[_MpegFrame]:
+    """Decode a 4-byte MPEG audio frame header (None if it is not one)."""
+    value = int.from_bytes(header, 'big')
+    if value >> 21 != 0x7FF:
+        return None
+    version_bits = (value >> 19) & 0x3
+    layer = 4 - ((value >> 17) & 0x3)
+    bitrate_index = (value >> 12) & 0xF
+    rate_index = (value >> 10) & 0x3
+    if version_bits == 0b01 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    version = 1 if version_bits == 0b11 else 2
+    bitrate = _MP3_BITRATES[(version, layer)][bitrate_index]
+    sample_rate = _MP3_SAMPLE_RATES[version_bits][rate_index]
+    padding = (value >> 9) & 0x1
+    channels = 1 if ((value >> 6) & 0x3) == 0b11 else 2
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate * 1000 // sample_rate + padding) * 4
+    else:
+        samples = 1152 if layer == 2 or version == 1 else 576
+        length = samples // 8 * bitrate * 1000 // sample_rate + padding
+    return _MpegFrame(version, layer, bitrate, sample_rate, channels, samples, length)
+
+
+def _skip_id3v2(f: BinaryIO) -> int:
+    """Skip an ID3v2 tag at the current position; return the audio start offset."""
+    start = f.tell()
+    header = f.read(10)
+    if len(header) == 10 and header[:3] == b'ID3':
+        size = 0
+        for byte in header[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        if header[5] & 0x10:  # Footer present
+            size += 10
+        start += 10 + size
+    f.seek(start)
+    return start
+
+
+def read_mp3_header(f: BinaryIO) -> AudioInfo:
+    """
+    Parse an MP3 (MPEG audio) file.
+
+    Uses the frame count of a Xing/Info or VBRI header when present, otherwise
+    derives the length from the constant bitrate and the audio data size.
+
+    Args:
+        f: Binary file positioned at the start of the file
+
+    Returns:
+        AudioInfo of the file
+
+    Raises:
+        ValueError: If no valid MPEG audio frame is found
+    """
+    audio_start = _skip_id3v2(f)
+    data = f.read(_SCAN_SIZE)
+
+    # First frame sync followed by a second valid frame (avoids false syncs)
+    frame = None
+    offset = data.find(b'\xff')
+    while 0 <= offset <= len(data) - 4:
+        frame = _parse_mpeg_frame(data[offset:offset + 4])
+        if frame is not None:
+            following = offset + frame.length
+            if following + 4 > len(data) or _parse_mpeg_frame(data[following:following + 4]):
+                break
+        frame = None
+        offset = data.find(b'\xff', offset + 1)
+    if frame is None:
+        raise ValueError("No MPEG audio frame found")
+
+    # Xing/Info tag after the side information, VBRI tag at a fixed offset
+    side_info = (32 if frame.channels == 2 else 17) if frame.version == 1 else \
+                (17 if frame.channels == 2 else 9)
+    xing = offset + 4 + side_info
+    vbri = offset + 36
+    mpeg_frames = None
+    if data[xing:xing + 4] in (b'Xing', b'Info') and len(data) >= xing + 12:
+        flags = struct.unpack('>I', data[xing + 4:xing + 8])[0]
+        if flags & 0x1:
+            mpeg_frames = struct.unpack('>I', data[xing + 8:xing + 12])[0]
+    elif data[vbri:vbri + 4] == b'VBRI' and len(data) >= vbri + 18:
+        mpeg_frames = struct.unpack('>I', data[vbri + 14:vbri + 18])[0]
+
+    if mpeg_frames is not None:
+        frames = mpeg_frames * frame.samples_per_frame
+    else:
+        # Constant bitrate: audio bytes (minus a trailing ID3v1 tag) / byte rate
+        f.seek(0, 2)
+        end = f.tell()
+        if end >= 128:
+            f.seek(end - 128)
+            if f.read(3) == b'TAG':
+                end -= 128
+        audio_bytes = max(0, end - audio_start - offset)
+        frames = audio_bytes * 8 * frame.sample_rate // (frame.bitrate * 1000)
+
+    return _make_info(frame.channels, frame.sample_rate, frames, f"mp3/layer{frame.layer}")
+
+
+def read_audio_header(path) -> AudioInfo:
+    """
+    Read the stream properties of an audio file from its header.
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        AudioInfo of the file
+
+    Raises:
+        ValueError: If the format is unsupported or the header is malformed
+        OSError: If the file cannot be read
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(12)
+        f.seek(0)
+        try:
+            if magic[:4] in (b'RIFF', b'RF64'):
+                return read_wav_header(f)
+            if magic[:4] == b'FORM':
+                return read_aiff_header(f)
+            if magic[:4] == b'OggS':
+                return read_ogg_header(f)
+            if magic[:4] == b'fLaC':
+                return read_flac_header(f)
+
+            # FLAC may also be preceded by an ID3v2 tag; anything else is tried as MP3
+            start = _skip_id3v2(f)
+            if f.read(4) == b'fLaC':
+                f.seek(start)
+                return read_flac_header(f)
+            f.seek(0)
+            return read_mp3_header(f)
+        except struct.error as e:
+            raise ValueError(f"Malformed audio header: {e}")
@@ -0,0 +1,90 @@
+"""Cache of audio file header probes.
+
+Each audio file's header is read once per path and modification time; the
+AudioFile writer, the MultiSound length and the media scanner all share the
+same record.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+from .audio_headers import AudioInfo, read_audio_header
+
+
+class AudioProbe:
+    """Thread-safe cache of AudioInfo records keyed by path, mtime and size."""
+
+    def __init__(self, max_size: int = 20000):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of cached files (the cache is cleared when full)
+        """
+        self.max_size = max_size
+        self._entries: Dict[str, Tuple[int, int, AudioInfo]] = {}
+        self._lock = threading.Lock()
+
+    def probe(self, path) -> AudioInfo:
+        """
+        Get the stream properties of an audio file.
+
+        Args:
+            path: Path to the audio file
+
+        Returns:
+            AudioInfo of the file (cached until the file changes)
+
+        Raises:
+            ValueError: If the header cannot be parsed
+            OSError: If the file cannot be read
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        stat = os.stat(path)
+
+        entry = self._entries.get(key)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        info = read_audio_header(path)
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                self._entries.clear()
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, info)
+        return info
+
+    def _probe_quietly(self, path):
+        try:
+            self.probe(path)
+        except (OSError, ValueError):
+            pass  # Reported when the file is actually used
+
+    def prefetch(self, paths: Iterable, workers: int = 8):
+        """
+        Probe many files ahead of time on a thread pool.
+
+        Unreadable files are skipped; probe() raises for them when they are used.
+
+        Args:
+            paths: Audio file paths
+            workers: Number of threads reading headers
+        """
+        paths = list(dict.fromkeys(str(Path(p)) for p in paths))
+        if len(paths) < 2 or workers <= 1:
+            for path in paths:
+                self._probe_quietly(path)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            list(executor.map(self._probe_quietly, paths))
+
+    def clear(self):
+        """Drop all cached records."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
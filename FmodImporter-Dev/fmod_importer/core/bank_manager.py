@@ -6,7 +6,7 @@ Handles creation and deletion of bank folders (BankFolder objects).
 import uuid
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 from .xml_writer import write_pretty_xml
 
@@ -199,34 +199,56 @@ class BankManager:
             event_id: UUID of the event to add
             metadata_path: Path to the Metadata directory
         """
+        BankManager.add_events_to_bank(bank_id, [event_id], metadata_path)
+
+    @staticmethod
+    def add_events_to_bank(bank_id: str, event_ids: List[str], metadata_path: Path) -> int:
+        """
+        Add several events to a bank's XML relationship with a single rewrite.
+
+        The bank file is parsed once, duplicates are skipped with a set lookup
+        and the file is written once (only if something was added).
+
+        Args:
+            bank_id: UUID of the bank
+            event_ids: UUIDs of the events to add, in order
+            metadata_path: Path to the Metadata directory
+
+        Returns:
+            Number of events actually added
+        """
         bank_path = metadata_path / "Bank" / f"{bank_id}.xml"
         if not bank_path.exists():
             # Might be a bank folder instead of a bank
-            return
+            return 0
 
         try:
             tree = ET.parse(bank_path)
             root = tree.getroot()
-            
+
             bank_obj = root.find(".//object[@class='Bank']")
             if bank_obj is None:
-                return
+                return 0
 
             rel_events = bank_obj.find("relationship[@name='events']")
             if rel_events is None:
                 rel_events = ET.SubElement(bank_obj, 'relationship', {'name': 'events'})
-            
-            # Check if already exists
-            exists = False
-            for dest in rel_events.findall('destination'):
-                if dest.text == event_id:
-                    exists = True
-                    break
-            
-            if not exists:
+
+            existing = {dest.text for dest in rel_events.findall('destination')}
+
+            added = 0
+            for event_id in event_ids:
+                if event_id in existing:
+                    continue
+                existing.add(event_id)
                 dest = ET.SubElement(rel_events, 'destination')
                 dest.text = event_id
+                added += 1
+
+            if added:
                 write_pretty_xml(root, bank_path)
-                
+            return added
+
         except Exception as e:
-            print(f"Error adding event {event_id} to bank {bank_id}: {e}")
+            print(f"Error adding {len(event_ids)} event(s) to bank {bank_id}: {e}")
+            return 0
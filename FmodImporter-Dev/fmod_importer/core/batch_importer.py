@@ -0,0 +1,210 @@
+"""Batch event import for FMOD project.
+
+Plans every event of an import in memory first, then applies all XML writes
+in a single write phase. Audio files are copied by a background copy stage
+that starts as soon as each event is planned and is drained before the write
+phase, so events whose audio failed to copy are left out.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .asset_index import AssetIndex
+from .asset_placement import COPY
+from .audio_file_manager import AudioFileManager
+from .copy_pipeline import CopyPipeline, CopyProgress
+from .event_creator import EventCreator
+from .event_index import EventIndex
+from .import_plan import ImportPlan
+
+
+class BatchImporter:
+    """Imports a list of events with one deferred write phase."""
+
+    def __init__(self, metadata_path: Path, project_path: Path, workspace: Dict,
+                 dest_folder_id: str, bank_id: str, bus_id: str, audio_asset_folder: str,
+                 serialization_model: str = "Studio.02.02.00",
+                 event_index: Optional[EventIndex] = None,
+                 asset_index: Optional[AssetIndex] = None,
+                 progress_callback: Optional[Callable[[str], None]] = None,
+                 copy_progress_callback: Optional[Callable[[CopyProgress], None]] = None,
+                 copy_workers: int = 4,
+                 placement: str = COPY):
+        """
+        Initialize the importer for one destination.
+
+        Args:
+            metadata_path: Path to the Metadata directory
+            project_path: Path to the project file
+            workspace: Workspace dictionary with master folder references
+            dest_folder_id: Destination event folder ID
+            bank_id: Bank ID to assign
+            bus_id: Bus ID to assign
+            audio_asset_folder: Folder where audio assets should be placed
+            serialization_model: FMOD serialization model version string
+            event_index: Project event index to register new events in (if loaded)
+            asset_index: Project asset index; identical media already in the
+                         project is neither copied nor given a new AudioFile
+            progress_callback: Optional callable receiving status messages
+            copy_progress_callback: Optional callable receiving a CopyProgress after
+                                    each copied audio file (from copy threads)
+            copy_workers: Number of threads copying audio files
+            placement: Asset placement strategy (copy, reflink, hardlink or
+                       skip_identical); unsupported strategies fall back to copy
+        """
+        self.metadata_path = metadata_path
+        self.project_path = project_path
+        self.workspace = workspace
+        self.dest_folder_id = dest_folder_id
+        self.bank_id = bank_id
+        self.bus_id = bus_id
+        self.audio_asset_folder = audio_asset_folder
+        self.serialization_model = serialization_model
+        self.event_index = event_index
+        self.asset_index = asset_index
+        self.progress_callback = progress_callback
+        self.copy_progress_callback = copy_progress_callback
+        self.copy_workers = copy_workers
+        self.placement = placement
+
+    def _report(self, message: str):
+        if self.progress_callback:
+            self.progress_callback(message)
+
+    def _plan_event(self, event: Dict, plan: ImportPlan) -> str:
+        """Record the writes of one event in the plan and return its new ID."""
+        if event.get('template_id'):
+            return EventCreator.copy_from_template(
+                event['template_id'], event['name'], self.dest_folder_id,
+                self.bank_id, self.bus_id, event['audio_files'],
+                self.audio_asset_folder, self.metadata_path, self.project_path,
+                self.workspace, serialization_model=self.serialization_model,
+                plan=plan, asset_index=self.asset_index
+            )
+
+        # Auto-Create (from scratch)
+        return EventCreator.create_from_scratch(
+            event['name'], self.dest_folder_id, self.bank_id, self.bus_id,
+            event['audio_files'], self.audio_asset_folder, self.metadata_path,
+            self.project_path, self.workspace,
+            serialization_model=self.serialization_model, plan=plan,
+            asset_index=self.asset_index
+        )
+
+    def run(self, events_to_process: List[Dict]) -> Dict:
+        """
+        Import a list of events.
+
+        Each event is planned into its own plan and merged only if planning
+        succeeds, so a failing event leaves no partial files behind. Its audio
+        copies are then handed to the copy stage, overlapping disk I/O with the
+        planning of the following events. Once every copy has finished, events
+        referencing an audio file that failed to copy are counted as failed
+        and their XML is not written.
+
+        Args:
+            events_to_process: List of dicts with 'name', 'template_id'
+                               (None for Auto-Create) and 'audio_files'
+
+        Returns:
+            Dictionary with 'success' and 'failed' counts, 'errors' messages,
+            'event_ids' (new event IDs in import order), 'reused_audio_files'
+            (existing AudioFiles reused), 'skipped_copies' (identical media),
+            'placement' (requested strategy) and 'placements' (files placed
+            per strategy actually used)
+        """
+        results = {
+            'success': 0,
+            'failed': 0,
+            'errors': [],
+            'event_ids': [],
+            'reused_audio_files': 0,
+            'skipped_copies': 0,
+            'placement': self.placement,
+            'placements': {}
+        }
+        planned = []  # (name, event ID, plan) of events that planned successfully
+        imported = []  # (name, event ID) of events whose audio was copied
+
+        plan = ImportPlan()
+        num_events = len(events_to_process)
+        # Read every audio header up front, concurrently; planning then hits the cache
+        self._report("Reading audio file headers...")
+        AudioFileManager.audio_probe.prefetch(
+            path for event in events_to_process for path in event['audio_files']
+        )
+
+        pipeline = CopyPipeline(self.copy_workers, progress_callback=self.copy_progress_callback,
+                                placement=self.placement)
+
+        try:
+            try:
+                # Phase 1: build every event in memory
+                for i, event in enumerate(events_to_process):
+                    self._report(f"Preparing {i+1}/{num_events}: {event['name']}")
+
+                    event_plan = ImportPlan()
+                    try:
+                        event_id = self._plan_event(event, event_plan)
+                    except Exception as e:
+                        results['failed'] += 1
+                        results['errors'].append(f"{event['name']}: {str(e)}")
+                        print(f"Error importing {event['name']}: {e}")
+                        continue
+
+                    # Start copying this event's audio while the next ones are planned
+                    for dest, src in event_plan.file_copies.items():
+                        pipeline.submit(src, dest)
+                    event_plan.file_copies.clear()
+
+                    # Later events reuse the AudioFiles this one creates
+                    if self.asset_index is not None:
+                        for asset_path, audio_file_id, src in event_plan.new_audio_files:
+                            self.asset_index.add(asset_path, audio_file_id, src)
+
+                    planned.append((event['name'], event_id, event_plan))
+            finally:
+                # Every copy must have finished before XML referencing it is written
+                self._report("Finishing audio file copies...")
+                copy_errors = pipeline.close()
+
+            failed_files = set()
+            for src, dest, error in copy_errors:
+                failed_files.add(dest)
+                results['errors'].append(f"{src.name}: failed to copy to {dest}: {error}")
+                print(f"Error copying {src} to {dest}: {error}")
+
+            # An event whose audio could not be copied is not written at all
+            for name, event_id, event_plan in planned:
+                missing = event_plan.asset_files & failed_files
+                if missing:
+                    results['failed'] += 1
+                    results['errors'].append(
+                        f"{name}: audio not copied ({', '.join(sorted(p.name for p in missing))})"
+                    )
+                    if self.asset_index is not None:
+                        for asset_path, audio_file_id, _ in event_plan.new_audio_files:
+                            self.asset_index.discard(asset_path, audio_file_id)
+                    continue
+                plan.merge(event_plan)
+                imported.append((name, event_id))
+
+            # Phase 2: single write phase
+            plan.flush(self.metadata_path, self.progress_callback)
+        finally:
+            if self.asset_index is not None:
+                self.asset_index.save()
+
+        results['success'] = len(imported)
+        results['reused_audio_files'] = plan.reused_audio_files
+        results['skipped_copies'] = plan.skipped_copies
+        results['placements'] = pipeline.placements
+        results['event_ids'] = [event_id for _, event_id in imported]
+
+        if self.event_index is not None:
+            for name, event_id in imported:
+                event_file = self.metadata_path / "Event" / f"{event_id}.xml"
+                self.event_index.add(event_id, name, self.dest_folder_id,
+                                     event_file, self.bus_id)
+
+        return results
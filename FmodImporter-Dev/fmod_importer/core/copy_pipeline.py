@@ -0,0 +1,165 @@
+"""Audio asset copy stage for batch imports.
+
+Copies audio files into the project's Assets folder on a pool of worker
+threads fed through a bounded queue, so disk I/O runs while the importer keeps
+building event XML on the calling thread. Each file is placed with the
+configured asset placement strategy (copy, reflink, hardlink, skip-if-identical).
+"""
+
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .asset_placement import AssetPlacer, COPY
+
+
+class CopyProgress:
+    """Snapshot of the copy stage, passed to progress callbacks."""
+
+    def __init__(self, files_done: int, files_total: int, bytes_done: int,
+                 bytes_total: int, elapsed: float, current_file: str):
+        self.files_done = files_done
+        self.files_total = files_total
+        self.bytes_done = bytes_done
+        self.bytes_total = bytes_total
+        self.elapsed = elapsed
+        self.current_file = current_file
+
+    @property
+    def rate(self) -> float:
+        """Average throughput in bytes per second."""
+        return self.bytes_done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds left for the files submitted so far (None if unknown)."""
+        rate = self.rate
+        if rate <= 0:
+            return None
+        return (self.bytes_total - self.bytes_done) / rate
+
+
+class CopyPipeline:
+    """Bounded-queue thread pool copying files to their destinations."""
+
+    def __init__(self, workers: int = 4, queue_size: Optional[int] = None,
+                 progress_callback: Optional[Callable[[CopyProgress], None]] = None,
+                 placement: str = COPY):
+        """
+        Start the worker threads.
+
+        Args:
+            workers: Number of copy threads
+            queue_size: Maximum number of pending copies before submit() blocks
+                        (default: 4 per worker)
+            progress_callback: Optional callable receiving a CopyProgress after
+                               each copied file (called from worker threads)
+            placement: Asset placement strategy (see asset_placement)
+        """
+        self.progress_callback = progress_callback
+        self._placer = AssetPlacer(placement)
+        self._queue = queue.Queue(maxsize=queue_size or workers * 4)
+        self._lock = threading.Lock()
+        self._submitted: Dict[Path, Path] = {}  # Destination -> source
+        self._late: Dict[Path, Tuple[Path, int]] = {}  # Re-targeted destinations, copied last
+        self._errors: List[Tuple[Path, Path, Exception]] = []
+        self._files_done = 0
+        self._bytes_done = 0
+        self._bytes_total = 0
+        self._start_time = time.perf_counter()
+
+        self._threads = [
+            threading.Thread(target=self._worker, daemon=True) for _ in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, src: Path, dest: Path):
+        """
+        Queue a copy, blocking while the queue is full.
+
+        A destination that is already queued with the same source is skipped.
+        If it is queued with a different source, the copy is deferred until all
+        other copies finished, so the last submitted source wins.
+
+        Args:
+            src: Source file
+            dest: Destination file
+        """
+        src, dest = Path(src), Path(dest)
+        try:
+            size = src.stat().st_size
+        except OSError:
+            size = 0
+
+        with self._lock:
+            if dest in self._submitted:
+                late = self._late.get(dest)
+                current = late[0] if late else self._submitted[dest]
+                if current == src:
+                    return
+                if late:
+                    self._bytes_total -= late[1]
+                self._late[dest] = (src, size)
+                self._bytes_total += size
+                return
+            self._submitted[dest] = src
+            self._bytes_total += size
+
+        self._queue.put((src, dest, size))
+
+    def _copy(self, src: Path, dest: Path, size: int):
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            self._placer.place(src, dest)
+        except Exception as e:
+            with self._lock:
+                self._errors.append((src, dest, e))
+
+        with self._lock:
+            self._files_done += 1
+            self._bytes_done += size
+            progress = CopyProgress(
+                self._files_done, len(self._submitted) + len(self._late),
+                self._bytes_done, self._bytes_total,
+                time.perf_counter() - self._start_time, src.name
+            )
+        if self.progress_callback:
+            self.progress_callback(progress)
+
+    @property
+    def placements(self) -> Dict[str, int]:
+        """Number of files placed per strategy actually used (after fallbacks)."""
+        with self._lock:
+            return dict(self._placer.counts)
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._copy(*item)
+            finally:
+                self._queue.task_done()
+
+    def close(self) -> List[Tuple[Path, Path, Exception]]:
+        """
+        Wait for all copies to finish and stop the workers.
+
+        Returns:
+            List of (source, destination, error) for copies that failed
+        """
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+        # Destinations re-targeted to another source: copy the final source now
+        for dest, (src, size) in list(self._late.items()):
+            self._copy(src, dest, size)
+        self._late.clear()
+
+        return list(self._errors)
@@ -5,25 +5,34 @@ Handles complex event copying from templates with audio file assignment.
 
 import uuid
 import shutil
-import wave
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .xml_writer import write_pretty_xml
 from .audio_file_manager import AudioFileManager
 from .bank_manager import BankManager
+from .event_index import EventIndex
+from .import_plan import ImportPlan
+from .template_cache import TemplateCache
+from .asset_index import AssetIndex
 
 
 class EventCreator:
     """Static methods for event creation and copying operations."""
 
+    # Parsed templates shared by all copies (keyed by template ID + mtime)
+    template_cache = TemplateCache()
+
     @staticmethod
     def copy_from_template(template_event_id: str, new_name: str,
                           dest_folder_id: str, bank_id: str, bus_id: str,
                           audio_files: List[str], audio_asset_folder: str,
                           metadata_path: Path, project_path: Path, workspace: Dict,
-                          serialization_model: str = "Studio.02.02.00") -> str:
+                          serialization_model: str = "Studio.02.02.00",
+                          event_index: Optional[EventIndex] = None,
+                          plan: Optional[ImportPlan] = None,
+                          asset_index: Optional[AssetIndex] = None) -> str:
         """
         Copy an event from template and assign audio files to it.
 
@@ -47,6 +56,9 @@ class EventCreator:
             project_path: Path to the project file
             workspace: Workspace dictionary with master folder references
             serialization_model: FMOD serialization model version string
+            event_index: Project event index to register the new event in (if loaded)
+            plan: Import plan to record writes in instead of touching the disk
+            asset_index: Asset index used to reuse identical, already imported audio
 
         Returns:
             New event ID
@@ -59,9 +71,8 @@ class EventCreator:
         if not template_event_path.exists():
             raise ValueError(f"Template event {template_event_id} not found")
 
-        # Parse template XML
-        template_tree = ET.parse(template_event_path)
-        template_root = template_tree.getroot()
+        # Pre-analysed template, parsed once per file version
+        template = EventCreator.template_cache.get(template_event_id, template_event_path)
 
         # Create new event ID
         new_event_id = "{" + str(uuid.uuid4()) + "}"
@@ -69,93 +80,27 @@ class EventCreator:
         # Deep copy the entire XML structure
         new_root = ET.Element('objects', serializationModel=serialization_model)
 
-        # Map old IDs to new IDs
-        id_map = {}
-
-        # First pass: collect all IDs and create new ones
-        for obj in template_root.findall(".//object"):
-            old_id = obj.get('id')
-            new_id = "{" + str(uuid.uuid4()) + "}"
-            id_map[old_id] = new_id
-
-        # Override the event ID with our chosen ID
-        event_obj = template_root.find(".//object[@class='Event']")
-        if event_obj is not None:
-            id_map[event_obj.get('id')] = new_event_id
-
-        # Second pass: copy objects and update references
-        for obj in template_root.findall(".//object"):
-            old_id = obj.get('id')
-            new_obj = ET.SubElement(new_root, 'object')
-            new_obj.set('class', obj.get('class'))
-            new_obj.set('id', id_map[old_id])
-
-            # Copy properties
-            for prop in obj.findall('property'):
-                # SKIP: EventMixerMaster should not have a 'name' property in FMOD 2.03+
-                if obj.get('class') == 'EventMixerMaster' and prop.get('name') == 'name':
-                    continue
-
-                new_prop = ET.SubElement(new_obj, 'property')
-                new_prop.set('name', prop.get('name'))
-                value_elem = prop.find('value')
-                if value_elem is not None:
-                    new_value = ET.SubElement(new_prop, 'value')
-                    # Special case: replace event name
-                    if obj.get('class') == 'Event' and prop.get('name') == 'name':
-                        new_value.text = new_name
-                    else:
-                        new_value.text = value_elem.text
-
-            # Copy relationships and update destinations
-            for rel in obj.findall('relationship'):
-                new_rel = ET.SubElement(new_obj, 'relationship')
-                new_rel.set('name', rel.get('name'))
-
-                # Special cases for relationships we want to override
-                if obj.get('class') == 'Event':
-                    if rel.get('name') == 'folder':
-                        # Change to destination folder
-                        dest = ET.SubElement(new_rel, 'destination')
-                        dest.text = dest_folder_id
-                        continue
-                    elif rel.get('name') == 'banks':
-                        # Change to selected bank
-                        dest = ET.SubElement(new_rel, 'destination')
-                        dest.text = bank_id
-                        continue
-
-                if obj.get('class') == 'MixerInput' and rel.get('name') == 'output':
-                    # Change to selected bus
-                    dest = ET.SubElement(new_rel, 'destination')
-                    dest.text = bus_id
-                    continue
-
-                # Copy all destinations
-                for dest_elem in rel.findall('destination'):
-                    new_dest = ET.SubElement(new_rel, 'destination')
-                    old_dest_id = dest_elem.text
-                    # Update to new ID if it's in our map
-                    new_dest.text = id_map.get(old_dest_id, old_dest_id)
+        # Emit the copy from the compiled clone plan: all IDs remapped,
+        # name/folder/bank/bus overridden
+        template.clone_plan.instantiate(
+            new_root, new_event_id, new_name, dest_folder_id, bank_id, bus_id
+        )
 
         # Create audio files and add them to the event
         if audio_files:
             EventCreator._assign_audio_to_event(
                 new_root, new_event_id, audio_files, audio_asset_folder,
-                metadata_path, project_path, workspace
+                metadata_path, project_path, workspace, plan, asset_index
             )
 
-        # Ensure Event directory exists
-        event_dir = metadata_path / "Event"
-        event_dir.mkdir(exist_ok=True)
+        # Write new event file (deferred when planning a batch import)
+        event_file = metadata_path / "Event" / f"{new_event_id}.xml"
+        EventCreator._write_event(new_root, event_file, new_event_id, bank_id,
+                                  metadata_path, plan)
 
-        # Write new event file
-        event_file = event_dir / f"{new_event_id}.xml"
-        write_pretty_xml(new_root, event_file)
-
-        # Bi-directional bank assignment
-        if bank_id:
-            BankManager.add_event_to_bank(bank_id, new_event_id, metadata_path)
+        # Keep the event index current without a rescan
+        if event_index is not None:
+            event_index.add(new_event_id, new_name, dest_folder_id, event_file, bus_id)
 
         return new_event_id
 
@@ -163,7 +108,10 @@ class EventCreator:
     def create_from_scratch(new_name: str, dest_folder_id: str, bank_id: str,
                            bus_id: str, audio_files: List[str], audio_asset_folder: str,
                            metadata_path: Path, project_path: Path, workspace: Dict,
-                           serialization_model: str = "Studio.02.02.00") -> str:
+                           serialization_model: str = "Studio.02.02.00",
+                           event_index: Optional[EventIndex] = None,
+                           plan: Optional[ImportPlan] = None,
+                          asset_index: Optional[AssetIndex] = None) -> str:
         """
         Create a new event from scratch (Auto-Create) without a template.
         """
@@ -335,30 +283,53 @@ class EventCreator:
         if audio_files:
             EventCreator._assign_audio_to_event(
                 root, new_event_id, audio_files, audio_asset_folder,
-                metadata_path, project_path, workspace
+                metadata_path, project_path, workspace, plan, asset_index
             )
             
-        # Ensure Event directory exists
-        event_dir = metadata_path / "Event"
-        event_dir.mkdir(exist_ok=True)
+        # Write new event file (deferred when planning a batch import)
+        event_file = metadata_path / "Event" / f"{new_event_id}.xml"
+        EventCreator._write_event(root, event_file, new_event_id, bank_id,
+                                  metadata_path, plan)
+
+        # Keep the event index current without a rescan
+        if event_index is not None:
+            event_index.add(new_event_id, new_name, dest_folder_id, event_file, bus_id)
         
-        # Write new event file
-        event_file = event_dir / f"{new_event_id}.xml"
+        return new_event_id
+
+    @staticmethod
+    def _write_event(root: ET.Element, event_file: Path, event_id: str, bank_id: str,
+                     metadata_path: Path, plan: Optional[ImportPlan] = None):
+        """
+        Write an event file and add the event to its bank.
+        Records both operations in the plan instead when one is given.
+        """
+        if plan is not None:
+            plan.write_xml(root, event_file)
+            if bank_id:
+                plan.add_to_bank(bank_id, event_id)
+            return
+
+        # Ensure Event directory exists
+        event_file.parent.mkdir(exist_ok=True)
         write_pretty_xml(root, event_file)
-        
+
         # Bi-directional bank assignment
         if bank_id:
-            BankManager.add_event_to_bank(bank_id, new_event_id, metadata_path)
-        
-        return new_event_id
+            BankManager.add_event_to_bank(bank_id, event_id, metadata_path)
 
     @staticmethod
     def _assign_audio_to_event(root: ET.Element, event_id: str,
                               audio_files: List[str], audio_asset_folder: str,
-                              metadata_path: Path, project_path: Path, workspace: Dict):
+                              metadata_path: Path, project_path: Path, workspace: Dict,
+                              plan: Optional[ImportPlan] = None,
+                              asset_index: Optional[AssetIndex] = None):
         """
         Helper to create audio assets, MultiSounds, and GroupTracks for an event.
         Shared by copy_from_template and create_from_scratch.
+
+        With an asset index, media already present and byte-identical at its
+        asset path is not copied again and its existing AudioFile is reused.
         """
         # Create AudioFile objects and SingleSound objects
         single_sound_ids = []
@@ -374,17 +345,40 @@ class EventCreator:
             # Copy audio file to FMOD project Assets folder
             assets_folder = project_path.parent / "Assets"
             dest_folder = assets_folder / Path(audio_asset_folder)
-            dest_folder.mkdir(parents=True, exist_ok=True)
-
             dest_file = dest_folder / audio_file_src.name
-            shutil.copy2(audio_file_src, dest_file)
 
-            # Create AudioFile using the AudioFileManager
-            # Pass the actual file path for reading properties, and the FMOD asset path
-            audio_file_id = AudioFileManager.create(
-                str(audio_file_src), asset_relative_path,
-                metadata_path, workspace
-            )
+            # Skip media that is already in the project with identical content
+            existing_id, identical = None, False
+            if asset_index is not None:
+                existing_id, identical = asset_index.lookup(audio_file_src, asset_relative_path)
+
+            if plan is not None:
+                plan.use_asset_file(dest_file)
+
+            if identical:
+                if plan is not None:
+                    plan.skipped_copies += 1
+            elif plan is not None:
+                plan.copy_file(audio_file_src, dest_file)
+            else:
+                dest_folder.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(audio_file_src, dest_file)
+
+            if existing_id is not None:
+                audio_file_id = existing_id
+                if plan is not None:
+                    plan.reused_audio_files += 1
+            else:
+                # Create AudioFile using the AudioFileManager
+                # Pass the actual file path for reading properties, and the FMOD asset path
+                audio_file_id = AudioFileManager.create(
+                    str(audio_file_src), asset_relative_path,
+                    metadata_path, workspace, plan
+                )
+                if plan is not None:
+                    plan.add_audio_file(asset_relative_path, audio_file_id, audio_file_src)
+                elif asset_index is not None:
+                    asset_index.add(asset_relative_path, audio_file_id, audio_file_src)
 
             # Create SingleSound object
             single_sound_id = "{" + str(uuid.uuid4()) + "}"
@@ -420,13 +414,12 @@ class EventCreator:
         value_ms_vs = ET.SubElement(prop_ms_vs, 'value')
         value_ms_vs.text = "3"
 
-        # Add length property (calculate from first audio file)
+        # Add length property (from the first audio file's cached header probe)
         try:
-            with wave.open(audio_files[0], 'rb') as wav_file:
-                length_seconds = wav_file.getnframes() / float(wav_file.getframerate())
-                prop_ms_length = ET.SubElement(multi_sound_obj, 'property', name='length')
-                value_ms_length = ET.SubElement(prop_ms_length, 'value')
-                value_ms_length.text = str(length_seconds)
+            length_seconds = AudioFileManager.audio_probe.probe(audio_files[0]).duration
+            prop_ms_length = ET.SubElement(multi_sound_obj, 'property', name='length')
+            value_ms_length = ET.SubElement(prop_ms_length, 'value')
+            value_ms_length.text = str(length_seconds)
         except Exception:
             # If we can't read the file, use a default length
             prop_ms_length = ET.SubElement(multi_sound_obj, 'property', name='length')
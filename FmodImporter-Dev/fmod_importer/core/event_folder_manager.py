@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .xml_writer import write_pretty_xml
+from .event_index import EventIndex
+from .folder_tree import FolderTree
 
 
 class EventFolderManager:
@@ -111,102 +113,81 @@ class EventFolderManager:
             del event_folders_dict[folder_id]
 
     @staticmethod
-    def get_hierarchy(master_id: str, event_folders_dict: Dict) -> List[Tuple[str, str, int]]:
+    def get_hierarchy(master_id: str, event_folders_dict: Dict,
+                      folder_tree: Optional[FolderTree] = None) -> List[Tuple[str, str, int]]:
         """
         Get event folders as a hierarchical list.
 
         Args:
             master_id: ID of the master event folder
             event_folders_dict: Dictionary of event folders
+            folder_tree: Children index covering event_folders_dict (built from
+                         the dictionary if None); other indexed folders are skipped
 
         Returns:
             List of tuples (folder_name, folder_id, depth)
         """
-        def build_hierarchy(folder_id: str, depth: int = 0) -> List[Tuple[str, str, int]]:
-            result = []
-            if folder_id in event_folders_dict:
-                folder = event_folders_dict[folder_id]
-                result.append((folder['name'], folder_id, depth))
-
-                # Find children
-                for fid, fdata in event_folders_dict.items():
-                    if fdata['parent'] == folder_id:
-                        result.extend(build_hierarchy(fid, depth + 1))
-
-            return result
+        if master_id not in event_folders_dict:
+            return []
+        if folder_tree is None:
+            folder_tree = FolderTree(event_folders_dict)
 
-        return build_hierarchy(master_id)
+        return [
+            (event_folders_dict[folder_id]['name'], folder_id, depth)
+            for folder_id, depth in folder_tree.walk(master_id, event_folders_dict.__contains__)
+        ]
 
     @staticmethod
     def get_events_in_folder(folder_id: str, event_folders_dict: Dict,
-                            metadata_path: Path) -> List[Dict]:
+                            event_index: EventIndex,
+                            folder_tree: Optional[FolderTree] = None) -> List[Dict]:
         """
         Recursively get all events in a folder and its subfolders.
 
         Args:
             folder_id: Starting folder ID
             event_folders_dict: Dictionary of event folders
-            metadata_path: Path to the Metadata directory
+            event_index: EventIndex of the project's events
+            folder_tree: Children index covering event_folders_dict (built from
+                         the dictionary if None); other indexed folders are skipped
 
         Returns:
             List of event dictionaries with 'id', 'name', 'path', 'folder_id' keys
         """
-        # Get all folder IDs in the hierarchy (this folder + all subfolders)
-        target_folder_ids = {folder_id}
-
-        def collect_subfolder_ids(current_folder_id: str):
-            for fid, fdata in event_folders_dict.items():
-                if fdata.get('parent') == current_folder_id:
-                    target_folder_ids.add(fid)
-                    collect_subfolder_ids(fid)
-
-        collect_subfolder_ids(folder_id)
-
-        # Parse XML files directly
-        event_dir = metadata_path / "Event"
-        if not event_dir.exists():
-            return []
+        if folder_tree is None:
+            folder_tree = FolderTree(event_folders_dict)
 
-        events = []
-
-        for xml_file in event_dir.glob("*.xml"):
-            try:
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-
-                for obj in root.findall(".//object[@class='Event']"):
-                    folder_rel = obj.find(".//relationship[@name='folder']/destination")
-                    event_folder_id = folder_rel.text if folder_rel is not None else None
-
-                    if event_folder_id in target_folder_ids:
-                        event_id = obj.get('id')
-                        name_elem = obj.find(".//property[@name='name']/value")
-                        event_name = name_elem.text if name_elem is not None else "Unnamed"
-
-                        events.append({
-                            'id': event_id,
-                            'name': event_name,
-                            'path': xml_file,
-                            'folder_id': event_folder_id
-                        })
-            except Exception:
-                continue
+        # Get all folder IDs in the hierarchy (this folder + all subfolders)
+        target_folder_ids = {
+            fid for fid, _ in folder_tree.walk(folder_id, event_folders_dict.__contains__)
+        }
 
-        return events
+        return [
+            {
+                'id': event['id'],
+                'name': event['name'],
+                'path': event['path'],
+                'folder_id': event['folder_id']
+            }
+            for event in event_index.in_folders(target_folder_ids)
+        ]
 
     @staticmethod
     def get_bus_from_template_events(folder_id: str, event_folders_dict: Dict,
-                                     metadata_path: Path) -> Tuple[Optional[str], bool, set]:
+                                     event_index: EventIndex,
+                                     folder_tree: Optional[FolderTree] = None
+                                     ) -> Tuple[Optional[str], bool, set]:
         """
         Analyze bus routing in template folder events.
 
-        Parses all event XML files in the template folder to extract their
-        bus routing (MixerInput.output relationship).
+        Reads the bus routing (MixerInput.output relationship) of every event
+        in the template folder from the event index.
 
         Args:
             folder_id: Template folder UUID
             event_folders_dict: Dictionary of event folders
-            metadata_path: Path to the Metadata directory
+            event_index: EventIndex of the project's events
+            folder_tree: Children index covering event_folders_dict (optional)
 
         Returns:
             Tuple of (common_bus_id, all_same, all_bus_ids):
@@ -216,36 +197,17 @@ class EventFolderManager:
         """
         # Get all events in folder
         events = EventFolderManager.get_events_in_folder(
-            folder_id, event_folders_dict, metadata_path
+            folder_id, event_folders_dict, event_index, folder_tree
         )
 
         if not events:
             return (None, True, set())
 
         bus_ids = set()
-        event_dir = metadata_path / "Event"
-
-        # Parse each event's XML to find bus routing
         for event in events:
-            event_id = event['id']
-            event_file = event_dir / f"{event_id}.xml"
-
-            if not event_file.exists():
-                continue
-
-            try:
-                tree = ET.parse(event_file)
-                root = tree.getroot()
-
-                # Find MixerInput object's output relationship
-                mixer_input = root.find(".//object[@class='MixerInput']")
-                if mixer_input is not None:
-                    output_rel = mixer_input.find(".//relationship[@name='output']/destination")
-                    if output_rel is not None and output_rel.text:
-                        bus_ids.add(output_rel.text)
-            except Exception:
-                # Skip problematic XML files
-                continue
+            bus_id = event_index.get(event['id'])['bus']
+            if bus_id:
+                bus_ids.add(bus_id)
 
         # Determine if all events use same bus
         all_same = len(bus_ids) == 1
@@ -0,0 +1,84 @@
+"""Event index for FMOD project.
+
+In-memory index of all events in Metadata/Event, built once per project load
+so folder queries do not have to re-parse every Event XML file.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+class EventIndex:
+    """Maps event IDs to their summary and folder IDs to their events."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._events = {}
+        self._by_folder = {}
+        self._order = {}  # Insertion sequence, keeps results in load order
+        self._next_seq = 0
+
+    def add(self, event_id: str, name: str, folder_id: Optional[str],
+            path: Path, bus_id: Optional[str] = None):
+        """
+        Add or replace an event in the index.
+
+        Args:
+            event_id: Event UUID
+            name: Event name
+            folder_id: UUID of the containing event folder
+            path: Path of the event XML file
+            bus_id: Bus UUID of the event's MixerInput output (if any)
+        """
+        if event_id in self._events:
+            self.remove(event_id)
+
+        self._events[event_id] = {
+            'id': event_id,
+            'name': name,
+            'folder_id': folder_id,
+            'path': path,
+            'bus': bus_id
+        }
+        self._by_folder.setdefault(folder_id, []).append(event_id)
+        self._order[event_id] = self._next_seq
+        self._next_seq += 1
+
+    def remove(self, event_id: str):
+        """Remove an event from the index (no-op if unknown)."""
+        event = self._events.pop(event_id, None)
+        if event is None:
+            return
+        del self._order[event_id]
+
+        siblings = self._by_folder.get(event['folder_id'], [])
+        if event_id in siblings:
+            siblings.remove(event_id)
+
+    def get(self, event_id: str) -> Optional[Dict]:
+        """Get the summary of an event, or None if unknown."""
+        return self._events.get(event_id)
+
+    def in_folders(self, folder_ids: Iterable[str]) -> List[Dict]:
+        """
+        Get the events directly contained in any of the given folders.
+
+        Args:
+            folder_ids: Event folder UUIDs
+
+        Returns:
+            Event summaries in index order
+        """
+        event_ids = []
+        for folder_id in set(folder_ids):
+            event_ids.extend(self._by_folder.get(folder_id, ()))
+
+        # Preserve load order (directory order) like the former disk scan
+        event_ids.sort(key=self._order.__getitem__)
+        return [self._events[event_id] for event_id in event_ids]
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._events
+
+    def __len__(self) -> int:
+        return len(self._events)
@@ -0,0 +1,124 @@
+"""Folder tree index for FMOD project.
+
+Parent -> children index of hierarchical items (event folders, banks, buses),
+so hierarchy walks cost O(subtree) instead of rescanning every item per node.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+
+class FolderTree:
+    """Maps each item ID to its parent and each parent ID to its children."""
+
+    def __init__(self, items: Optional[Dict[str, Dict]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            items: Optional dictionary of items to index, each with a 'parent' key
+        """
+        self._parents = {}
+        self._children = {}  # parent ID -> {child ID: None}, keeps insertion order
+        if items:
+            for item_id, item_data in items.items():
+                self.add(item_id, item_data.get('parent'))
+
+    def add(self, item_id: str, parent_id: Optional[str]):
+        """
+        Add an item, or move it under a new parent.
+
+        Args:
+            item_id: Item UUID
+            parent_id: Parent UUID (None for root items)
+        """
+        if item_id in self._parents:
+            if self._parents[item_id] == parent_id:
+                return
+            self._detach(item_id)
+
+        self._parents[item_id] = parent_id
+        self._children.setdefault(parent_id, {})[item_id] = None
+
+    def remove(self, item_id: str):
+        """
+        Remove an item (no-op if unknown).
+
+        Its children keep their parent ID, as in the items dictionary, and are
+        no longer reachable from the item's former ancestors.
+        """
+        if item_id in self._parents:
+            self._detach(item_id)
+            del self._parents[item_id]
+
+    def _detach(self, item_id: str):
+        siblings = self._children.get(self._parents[item_id])
+        if siblings is not None:
+            siblings.pop(item_id, None)
+
+    def parent(self, item_id: str) -> Optional[str]:
+        """Get the parent ID of an item, or None if unknown or a root."""
+        return self._parents.get(item_id)
+
+    def children(self, item_id: Optional[str]) -> List[str]:
+        """Get the direct children of an item, in the order they were added."""
+        return list(self._children.get(item_id, ()))
+
+    def walk(self, root_id: str,
+             include: Optional[Callable[[str], bool]] = None) -> Iterator[Tuple[str, int]]:
+        """
+        Walk a subtree depth-first, parents before their children.
+
+        Args:
+            root_id: ID of the subtree root (yielded first, at depth 0)
+            include: Optional filter; a descendant it rejects is skipped
+                     together with its own subtree
+
+        Yields:
+            Tuples of (item_id, depth)
+        """
+        visited = set()
+        stack = [(root_id, 0)]
+        while stack:
+            item_id, depth = stack.pop()
+            if item_id in visited:
+                continue  # Guard against parent cycles in malformed metadata
+            visited.add(item_id)
+            yield item_id, depth
+
+            children = [child_id for child_id in self._children.get(item_id, ())
+                        if include is None or include(child_id)]
+            stack.extend((child_id, depth + 1) for child_id in reversed(children))
+
+    def descendants(self, root_id: str) -> Set[str]:
+        """Get the IDs of every item below a root (the root excluded)."""
+        found = {item_id for item_id, _ in self.walk(root_id)}
+        found.discard(root_id)
+        return found
+
+    def with_matching_descendant(self, predicate: Callable[[str], bool]) -> Set[str]:
+        """
+        Get the items whose subtree contains an item satisfying a predicate.
+
+        Used by search filters: an item is shown when it or one of its
+        descendants matches. Each item is visited once, whatever the depth.
+
+        Args:
+            predicate: Test applied to every item ID
+
+        Returns:
+            IDs of the matching items and all of their ancestors
+        """
+        found = set()
+        for item_id in self._parents:
+            if not predicate(item_id):
+                continue
+            while item_id is not None and item_id not in found:
+                found.add(item_id)
+                item_id = self._parents.get(item_id)
+        return found
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._parents
+
+    def __len__(self) -> int:
+        return len(self._parents)
@@ -0,0 +1,105 @@
+"""Deferred write plan for batch imports.
+
+Collects every XML write, audio file copy and bank membership produced while
+planning an import, so they can be applied together in a single write phase.
+"""
+
+import shutil
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .xml_writer import write_pretty_xml
+from .bank_manager import BankManager
+
+
+class ImportPlan:
+    """In-memory record of the filesystem changes of an import."""
+
+    def __init__(self):
+        """Initialize an empty plan."""
+        self.xml_writes: List[Tuple[ET.Element, Path]] = []
+        self.file_copies: Dict[Path, Path] = {}  # Destination -> source
+        self.asset_files: Set[Path] = set()  # Asset files referenced by the planned XML
+        self.bank_events: Dict[str, List[str]] = {}  # Bank ID -> event IDs
+        self.new_audio_files: List[Tuple[str, str, Path]] = []  # (asset path, ID, source)
+        self.reused_audio_files = 0
+        self.skipped_copies = 0
+
+    def write_xml(self, root: ET.Element, path: Path):
+        """Schedule an XML element tree to be written to a file."""
+        self.xml_writes.append((root, path))
+
+    def copy_file(self, src: Path, dest: Path):
+        """Schedule a file copy (a later copy to the same destination wins)."""
+        self.file_copies.pop(dest, None)
+        self.file_copies[dest] = src
+
+    def use_asset_file(self, dest: Path):
+        """Record that the planned XML references an asset file (copied or not)."""
+        self.asset_files.add(dest)
+
+    def add_to_bank(self, bank_id: str, event_id: str):
+        """Schedule an event to be added to a bank's events relationship."""
+        self.bank_events.setdefault(bank_id, []).append(event_id)
+
+    def add_audio_file(self, asset_path: str, audio_file_id: str, src: Path):
+        """Record an AudioFile created by the plan (for the asset index)."""
+        self.new_audio_files.append((asset_path, audio_file_id, src))
+
+    def merge(self, other: 'ImportPlan'):
+        """
+        Append another plan's operations to this one.
+
+        Args:
+            other: Plan to merge (e.g., the plan of a single event)
+        """
+        self.xml_writes.extend(other.xml_writes)
+        for dest, src in other.file_copies.items():
+            self.copy_file(src, dest)
+        self.asset_files.update(other.asset_files)
+        for bank_id, event_ids in other.bank_events.items():
+            self.bank_events.setdefault(bank_id, []).extend(event_ids)
+        self.new_audio_files.extend(other.new_audio_files)
+        self.reused_audio_files += other.reused_audio_files
+        self.skipped_copies += other.skipped_copies
+
+    def flush(self, metadata_path: Path,
+              progress_callback: Optional[Callable[[str], None]] = None):
+        """
+        Apply all planned operations.
+
+        Audio files still in the plan are copied first, then XML files are
+        written, then bank memberships are updated, so the project never
+        references an event whose file does not exist yet. BatchImporter
+        hands its copies to a CopyPipeline instead and flushes only once
+        every copy has finished.
+
+        Args:
+            metadata_path: Path to the Metadata directory
+            progress_callback: Optional callable receiving status messages
+        """
+        def report(message):
+            if progress_callback:
+                progress_callback(message)
+
+        # Create each destination directory once
+        directories = {dest.parent for dest in self.file_copies}
+        directories.update(path.parent for _, path in self.xml_writes)
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        total = len(self.file_copies)
+        for i, (dest, src) in enumerate(self.file_copies.items()):
+            report(f"Copying audio files {i+1}/{total}: {Path(src).name}")
+            shutil.copy2(src, dest)
+
+        total = len(self.xml_writes)
+        for i, (root, path) in enumerate(self.xml_writes):
+            report(f"Writing project files {i+1}/{total}")
+            write_pretty_xml(root, path)
+
+        # One parse and one write per bank, however many events it receives
+        for bank_id, event_ids in self.bank_events.items():
+            report("Updating banks...")
+            BankManager.add_events_to_bank(bank_id, event_ids, metadata_path)
@@ -0,0 +1,141 @@
+"""Persistent metadata index for FMOD project XML files.
+
+Stores the objects extracted from each metadata XML file, keyed by the file's
+relative path, modification time and size. Unchanged files are served from the
+index instead of being re-parsed, so warm project loads skip almost all XML work.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Bump whenever the shape of the cached object records changes
+CACHE_VERSION = 1
+
+
+def project_cache_path(project_path: Path, suffix: str = "") -> Path:
+    """
+    Get the path of a per-project cache file in ~/.fmod_importer_cache/.
+
+    Args:
+        project_path: Path to the .fspro file
+        suffix: Distinguishes cache kinds (e.g., "_hashes")
+
+    Returns:
+        Path of the JSON cache file
+    """
+    cache_dir = Path.home() / ".fmod_importer_cache"
+    digest = hashlib.sha1(str(Path(project_path).resolve()).encode('utf-8')).hexdigest()[:12]
+    return cache_dir / f"{Path(project_path).stem}_{digest}{suffix}.json"
+
+
+class MetadataCache:
+    """On-disk index of parsed metadata objects, one entry per XML file."""
+
+    def __init__(self, cache_file: Path):
+        """
+        Initialize the cache and load any existing index from disk.
+
+        Args:
+            cache_file: Path of the JSON index file
+        """
+        self.cache_file = cache_file
+        self._entries = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_path: Path) -> 'MetadataCache':
+        """
+        Get the cache for a project, stored in the user cache directory.
+
+        The index lives in ~/.fmod_importer_cache/ rather than next to the .fspro
+        so it never ends up in the project's version control.
+
+        Args:
+            project_path: Path to the .fspro file
+
+        Returns:
+            MetadataCache bound to this project
+        """
+        return cls(project_cache_path(project_path))
+
+    def _load(self):
+        """Load the index file, discarding it if missing, corrupt or outdated."""
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable metadata cache {self.cache_file}: {e}")
+            return
+
+        if data.get('version') == CACHE_VERSION:
+            self._entries = data.get('files', {})
+
+    def get(self, key: str, stat: os.stat_result) -> Optional[List[Dict]]:
+        """
+        Get the cached objects of a file if it has not changed.
+
+        Args:
+            key: File path relative to the Metadata directory
+            stat: Current stat result of the file
+
+        Returns:
+            List of object records, or None if the file is unknown or modified
+        """
+        entry = self._entries.get(key)
+        if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['objects']
+        return None
+
+    def put(self, key: str, stat: os.stat_result, objects: List[Dict]):
+        """
+        Store the objects parsed from a file.
+
+        Args:
+            key: File path relative to the Metadata directory
+            stat: Stat result of the file at parse time
+            objects: Object records extracted from the file
+        """
+        self._entries[key] = {
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'objects': objects
+        }
+        self._dirty = True
+
+    def prune(self, prefix: str, keep: Iterable[str]):
+        """
+        Drop entries under a directory prefix whose files no longer exist.
+
+        Args:
+            prefix: Relative directory prefix (e.g., "EventFolder/")
+            keep: Keys that are still present on disk
+        """
+        keep = set(keep)
+        stale = [k for k in self._entries if k.startswith(prefix) and k not in keep]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self):
+        """Write the index to disk if anything changed (atomic replace)."""
+        if not self._dirty:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'files': self._entries}, f,
+                          separators=(',', ':'))
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: Failed to save metadata cache {self.cache_file}: {e}")
@@ -6,7 +6,7 @@ Provides transaction-like semantics for folder creation.
 
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 import uuid
 
 from .xml_writer import write_pretty_xml
@@ -26,6 +26,14 @@ class PendingFolderManager:
         """Add an event folder to the pending list."""
         self._pending_event_folders[folder_id] = folder_data
 
+    def remove_event_folder(self, folder_id: str) -> bool:
+        """Remove an event folder from the pending list (returns False if it is not pending)."""
+        return self._pending_event_folders.pop(folder_id, None) is not None
+
+    def get_pending_event_folder_ids(self) -> List[str]:
+        """Get the IDs of the pending event folders."""
+        return list(self._pending_event_folders)
+
     def add_asset_folder(self, asset_id: str, folder_data: Dict):
         """Add an asset folder to the pending list."""
         self._pending_asset_folders[asset_id] = folder_data
@@ -3,29 +3,245 @@
 Handles loading all XML data structures from FMOD project metadata files.
 """
 
+import fnmatch
+import os
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
-from typing import Dict
+from typing import Collection, Dict, List, Optional, Sequence, Tuple
+
+from .metadata_cache import MetadataCache
+from .event_index import EventIndex
+
+# Below this many files to parse, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+
+def read_serialization_model(xml_file: Path) -> Optional[str]:
+    """
+    Read the serializationModel attribute of a metadata file's root element.
+
+    Only the opening root tag is parsed; the rest of the file is never read
+    into a tree.
+
+    Args:
+        xml_file: Path to the XML file
+
+    Returns:
+        Model string (e.g., "Studio.02.03.00") or None if absent
+    """
+    for _, elem in ET.iterparse(xml_file, events=('start',)):
+        return elem.get('serializationModel')
+    return None
+
+
+def read_objects(xml_file: Path, properties: Sequence[str] = ('name',),
+                 relationships: Sequence[str] = ('folder',),
+                 classes: Optional[Collection[str]] = None) -> List[Dict]:
+    """
+    Extract the identifying fields of objects in a metadata XML file.
+
+    Streams the file with iterparse instead of building the whole tree: only
+    the requested fields are kept and each object is discarded once read, so
+    large Event and Group files are processed in near-constant memory.
+
+    Args:
+        xml_file: Path to the XML file
+        properties: Property names whose first value should be read
+        relationships: Relationship names whose first destination should be read
+        classes: Object classes to keep (None keeps every object)
+
+    Returns:
+        List of records with 'id', 'class' and one key per requested
+        property/relationship (None when absent)
+    """
+    wanted = {'property': set(properties), 'relationship': set(relationships)}
+    child_tag = {'property': 'value', 'relationship': 'destination'}
+
+    objects = []
+    root = None
+    record = None
+    field = None  # Record key filled by the next value/destination
+    field_tag = None
+    found = set()
+
+    for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if root is None:
+                root = elem
+            elif tag == 'object':
+                if classes is None or elem.get('class') in classes:
+                    record = {'id': elem.get('id'), 'class': elem.get('class')}
+                    record.update(dict.fromkeys(properties))
+                    record.update(dict.fromkeys(relationships))
+                    found.clear()
+            elif record is not None and tag in wanted:
+                name = elem.get('name')
+                if name in wanted[tag] and name not in found:
+                    field = name
+                    field_tag = child_tag[tag]
+            continue
+
+        if tag == 'object':
+            if record is not None:
+                objects.append(record)
+                record = None
+            # Drop everything parsed so far; only the records are kept
+            root.clear()
+        elif field is not None:
+            if tag == field_tag:
+                record[field] = elem.text
+                found.add(field)
+                field = None
+            elif tag in wanted:
+                field = None
+
+    return objects
+
+
+def read_objects_or_none(xml_file: Path, properties: Sequence[str] = ('name',),
+                         relationships: Sequence[str] = ('folder',),
+                         classes: Optional[Collection[str]] = None) -> Optional[List[Dict]]:
+    """Same as read_objects(), but returns None for unreadable or malformed files."""
+    try:
+        return read_objects(xml_file, properties, relationships, classes)
+    except (ET.ParseError, OSError):
+        return None
 
 
 class XMLLoader:
     """Loads and parses FMOD project XML metadata files."""
 
-    def __init__(self, metadata_path: Path):
+    def __init__(self, metadata_path: Path, cache: Optional[MetadataCache] = None,
+                 workers: int = 1):
         """
         Initialize the XML loader.
 
         Args:
             metadata_path: Path to the FMOD project Metadata directory
+            cache: Optional persistent index used to skip unchanged files
+            workers: Number of processes used to parse files (1 = serial)
         """
         self.metadata_path = metadata_path
+        self.cache = cache
+        self.workers = max(1, workers or 1)
+
+    def _read_file(self, xml_file: Path, stat: os.stat_result, properties: Sequence[str],
+                   relationships: Sequence[str], classes: Optional[Collection[str]] = None) -> List[Dict]:
+        """Read objects from one file, going through the cache when available."""
+        if self.cache is None:
+            return read_objects(xml_file, properties, relationships, classes)
+
+        key = xml_file.relative_to(self.metadata_path).as_posix()
+        objects = self.cache.get(key, stat)
+        if objects is None:
+            objects = read_objects(xml_file, properties, relationships, classes)
+            self.cache.put(key, stat, objects)
+        return objects
+
+    def _parse_files(self, files: List[Path], properties: Sequence[str],
+                     relationships: Sequence[str],
+                     classes: Optional[Collection[str]] = None,
+                     skip_errors: bool = False) -> List[Optional[List[Dict]]]:
+        """
+        Parse several files, spreading them across a process pool when worthwhile.
+
+        Args:
+            files: XML files to parse
+            properties: Property names to extract
+            relationships: Relationship names to extract
+            classes: Object classes to keep (None keeps every object)
+            skip_errors: If True, malformed files yield None instead of raising
+
+        Returns:
+            List of object lists, in the same order as files
+        """
+        reader = read_objects_or_none if skip_errors else read_objects
+        if self.workers > 1 and len(files) >= PARALLEL_MIN_FILES:
+            chunksize = max(1, len(files) // (self.workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    return list(pool.map(reader, files, repeat(properties),
+                                         repeat(relationships), repeat(classes),
+                                         chunksize=chunksize))
+            except (OSError, BrokenProcessPool) as e:
+                print(f"Warning: Parallel XML parsing unavailable, parsing serially: {e}")
+
+        return [reader(xml_file, properties, relationships, classes) for xml_file in files]
+
+    def _load_directory(self, dir_name: str, properties: Sequence[str],
+                        relationships: Sequence[str],
+                        classes: Optional[Collection[str]] = None,
+                        skip_errors: bool = False) -> List[Tuple[Path, List[Dict]]]:
+        """
+        Read objects from every XML file of a Metadata sub-directory.
+
+        Cached files are served from the index; the remaining files are parsed
+        in one batch (in parallel when the loader has several workers).
+
+        Args:
+            dir_name: Sub-directory name (e.g., "EventFolder")
+            properties: Property names to extract
+            relationships: Relationship names to extract
+            classes: Object classes to keep (None keeps every object)
+            skip_errors: If True, malformed files are left out instead of raising
+
+        Returns:
+            List of (xml_file, objects) tuples in directory order
+        """
+        directory = self.metadata_path / dir_name
+        if not directory.exists():
+            return []
+
+        files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Same matching rules as glob("*.xml"): no hidden files, OS case rules
+                if entry.name.startswith('.') or not fnmatch.fnmatch(entry.name, '*.xml'):
+                    continue
+                if not entry.is_file():
+                    continue
+                files.append((Path(entry.path), entry.stat(), f"{dir_name}/{entry.name}"))
+
+        objects_by_key = {}
+        misses = []
+        for xml_file, stat, key in files:
+            objects = self.cache.get(key, stat) if self.cache is not None else None
+            if objects is None:
+                misses.append((xml_file, stat, key))
+            else:
+                objects_by_key[key] = objects
+
+        parsed = self._parse_files([xml_file for xml_file, _, _ in misses],
+                                   properties, relationships, classes, skip_errors)
+        for (xml_file, stat, key), objects in zip(misses, parsed):
+            if objects is None:
+                continue  # Malformed file: skipped and not cached, retried next load
+            objects_by_key[key] = objects
+            if self.cache is not None:
+                self.cache.put(key, stat, objects)
+
+        if self.cache is not None:
+            self.cache.prune(f"{dir_name}/", objects_by_key.keys())
+
+        return [(xml_file, objects_by_key[key]) for xml_file, _, key in files
+                if key in objects_by_key]
+
+    def _save_cache(self):
+        """Persist the metadata index after a load."""
+        if self.cache is not None:
+            self.cache.save()
 
     def load_workspace(self) -> Dict:
         """
         Load workspace.xml to get master folder references.
 
         Returns:
-            Dictionary containing workspace ID and master folder references
+            Dictionary containing workspace ID, master folder references and
+            the project's serializationModel (None if absent)
 
         Raises:
             ValueError: If Workspace.xml is not found or invalid
@@ -45,7 +261,8 @@ class XMLLoader:
             'id': workspace_obj.get('id'),
             'masterEventFolder': workspace_obj.find(".//relationship[@name='masterEventFolder']/destination").text,
             'masterBankFolder': workspace_obj.find(".//relationship[@name='masterBankFolder']/destination").text,
-            'masterAssetFolder': workspace_obj.find(".//relationship[@name='masterAssetFolder']/destination").text
+            'masterAssetFolder': workspace_obj.find(".//relationship[@name='masterAssetFolder']/destination").text,
+            'serializationModel': root.get('serializationModel')
         }
 
     def load_event_folders(self) -> Dict[str, Dict]:
@@ -56,31 +273,17 @@ class XMLLoader:
             Dictionary mapping folder IDs to folder information
         """
         folders = {}
-        event_folder_dir = self.metadata_path / "EventFolder"
-
-        if not event_folder_dir.exists():
-            return folders
-
-        for xml_file in event_folder_dir.glob("*.xml"):
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
 
-            for obj in root.findall(".//object"):
-                folder_id = obj.get('id')
-                name_elem = obj.find(".//property[@name='name']/value")
-                name = name_elem.text if name_elem is not None else "Unnamed"
-
-                # Get parent folder
-                parent_rel = obj.find(".//relationship[@name='folder']/destination")
-                parent_id = parent_rel.text if parent_rel is not None else None
-
-                folders[folder_id] = {
-                    'name': name,
-                    'parent': parent_id,
+        for xml_file, objects in self._load_directory("EventFolder", ('name',), ('folder',)):
+            for obj in objects:
+                folders[obj['id']] = {
+                    'name': obj['name'] if obj['name'] is not None else "Unnamed",
+                    'parent': obj['folder'],
                     'path': xml_file,
                     'items': []
                 }
 
+        self._save_cache()
         return folders
 
     def load_banks(self) -> Dict[str, Dict]:
@@ -99,72 +302,54 @@ class XMLLoader:
             master_bank_id = self.workspace.get('masterBankFolder')
 
         # Load BankFolder objects (organizational folders)
-        bank_folder_dir = self.metadata_path / "BankFolder"
-        if bank_folder_dir.exists():
-            for xml_file in bank_folder_dir.glob("*.xml"):
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-
-                # Look for BankFolder and MasterBankFolder class objects
-                for obj in root.findall(".//object"):
-                    obj_class = obj.get('class')
-                    if obj_class in ['BankFolder', 'MasterBankFolder']:
-                        bank_id = obj.get('id')
-
-                        # MasterBankFolder typically has no name
-                        if obj_class == 'MasterBankFolder':
-                            name = "Master"
-                            parent_id = None
-                        else:
-                            name_elem = obj.find(".//property[@name='name']/value")
-                            name = name_elem.text if name_elem is not None else "Unnamed"
-
-                            # Get parent relationship if exists
-                            parent_rel = obj.find(".//relationship[@name='folder']/destination")
-                            parent_id = parent_rel.text if parent_rel is not None else None
-
-                            # If no explicit parent, set to master bank folder
-                            if not parent_id and master_bank_id:
-                                parent_id = master_bank_id
-
-                        banks[bank_id] = {
-                            'name': name,
-                            'path': xml_file,
-                            'parent': parent_id,
-                            'type': 'folder'  # Mark as folder
-                        }
+        for xml_file, objects in self._load_directory("BankFolder", ('name',), ('folder',),
+                                                          {'BankFolder', 'MasterBankFolder'}):
+            # Look for BankFolder and MasterBankFolder class objects
+            for obj in objects:
+                obj_class = obj['class']
+                if obj_class not in ['BankFolder', 'MasterBankFolder']:
+                    continue
+
+                # MasterBankFolder typically has no name
+                if obj_class == 'MasterBankFolder':
+                    name = "Master"
+                    parent_id = None
+                else:
+                    name = obj['name'] if obj['name'] is not None else "Unnamed"
+                    parent_id = obj['folder']
+
+                    # If no explicit parent, set to master bank folder
+                    if not parent_id and master_bank_id:
+                        parent_id = master_bank_id
+
+                banks[obj['id']] = {
+                    'name': name,
+                    'path': xml_file,
+                    'parent': parent_id,
+                    'type': 'folder'  # Mark as folder
+                }
 
         # Load Bank objects (individual bank files)
-        bank_dir = self.metadata_path / "Bank"
-        if bank_dir.exists():
-            for xml_file in bank_dir.glob("*.xml"):
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-
-                # Look for Bank class objects
-                for obj in root.findall(".//object"):
-                    obj_class = obj.get('class')
-                    if obj_class == 'Bank':
-                        bank_id = obj.get('id')
-
-                        name_elem = obj.find(".//property[@name='name']/value")
-                        name = name_elem.text if name_elem is not None else "Unnamed"
-
-                        # Get parent folder relationship
-                        parent_rel = obj.find(".//relationship[@name='folder']/destination")
-                        parent_id = parent_rel.text if parent_rel is not None else None
-
-                        # If no explicit parent, set to master bank folder
-                        if not parent_id and master_bank_id:
-                            parent_id = master_bank_id
-
-                        banks[bank_id] = {
-                            'name': name,
-                            'path': xml_file,
-                            'parent': parent_id,
-                            'type': 'bank'  # Mark as individual bank
-                        }
+        for xml_file, objects in self._load_directory("Bank", ('name',), ('folder',), {'Bank'}):
+            for obj in objects:
+                if obj['class'] != 'Bank':
+                    continue
+
+                name = obj['name'] if obj['name'] is not None else "Unnamed"
+                parent_id = obj['folder']
 
+                # If no explicit parent, set to master bank folder
+                if not parent_id and master_bank_id:
+                    parent_id = master_bank_id
+
+                banks[obj['id']] = {
+                    'name': name,
+                    'path': xml_file,
+                    'parent': parent_id,
+                    'type': 'bank'  # Mark as individual bank
+                }
+
+        self._save_cache()
         return banks
 
     def load_buses(self) -> Dict[str, Dict]:
@@ -179,46 +364,26 @@ class XMLLoader:
         # Load master bus from Master.xml
         master_file = self.metadata_path / "Master.xml"
         if master_file.exists():
-            tree = ET.parse(master_file)
-            root = tree.getroot()
-
-            for obj in root.findall(".//object"):
-                obj_class = obj.get('class')
-                if obj_class == 'MixerMaster':
-                    bus_id = obj.get('id')
-                    name_elem = obj.find(".//property[@name='name']/value")
-                    name = name_elem.text if name_elem is not None else "Master Bus"
-
-                    buses[bus_id] = {
-                        'name': name,
+            for obj in self._read_file(master_file, master_file.stat(),
+                                       ('name',), ('output',), {'MixerMaster'}):
+                if obj['class'] == 'MixerMaster':
+                    buses[obj['id']] = {
+                        'name': obj['name'] if obj['name'] is not None else "Master Bus",
                         'path': master_file,
                         'parent': None  # Master has no parent
                     }
 
         # Load other buses from Group directory
-        group_dir = self.metadata_path / "Group"
-        if group_dir.exists():
-            for xml_file in group_dir.glob("*.xml"):
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-
-                for obj in root.findall(".//object"):
-                    obj_class = obj.get('class')
-                    if obj_class == 'MixerGroup':
-                        bus_id = obj.get('id')
-                        name_elem = obj.find(".//property[@name='name']/value")
-                        name = name_elem.text if name_elem is not None else "Unnamed"
-
-                        # Get parent relationship (output)
-                        parent_rel = obj.find(".//relationship[@name='output']/destination")
-                        parent_id = parent_rel.text if parent_rel is not None else None
-
-                        buses[bus_id] = {
-                            'name': name,
-                            'path': xml_file,
-                            'parent': parent_id
-                        }
+        for xml_file, objects in self._load_directory("Group", ('name',), ('output',), {'MixerGroup'}):
+            for obj in objects:
+                if obj['class'] == 'MixerGroup':
+                    buses[obj['id']] = {
+                        'name': obj['name'] if obj['name'] is not None else "Unnamed",
+                        'path': xml_file,
+                        'parent': obj['output']
+                    }
 
+        self._save_cache()
         return buses
 
     def load_asset_folders(self) -> Dict[str, Dict]:
@@ -229,27 +394,68 @@ class XMLLoader:
             Dictionary mapping asset IDs to asset folder information
         """
         asset_folders = {}
-        asset_dir = self.metadata_path / "Asset"
-
-        if not asset_dir.exists():
-            return asset_folders
-
-        for xml_file in asset_dir.glob("*.xml"):
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
 
-            for obj in root.findall(".//object[@class='EncodableAsset']"):
-                asset_id = obj.get('id')
-                path_elem = obj.find(".//property[@name='assetPath']/value")
-                asset_path = path_elem.text if path_elem is not None else ""
+        for xml_file, objects in self._load_directory("Asset", ('assetPath',), ('masterAssetFolder',),
+                                                      {'EncodableAsset'}):
+            for obj in objects:
+                if obj['class'] != 'EncodableAsset':
+                    continue
 
-                master_folder_rel = obj.find(".//relationship[@name='masterAssetFolder']/destination")
-                master_folder_id = master_folder_rel.text if master_folder_rel is not None else None
-
-                asset_folders[asset_id] = {
-                    'path': asset_path,
+                asset_folders[obj['id']] = {
+                    'path': obj['assetPath'] if obj['assetPath'] is not None else "",
                     'xml_path': xml_file,
-                    'master_folder': master_folder_id
+                    'master_folder': obj['masterAssetFolder']
                 }
 
+        self._save_cache()
         return asset_folders
+
+    def load_events(self) -> EventIndex:
+        """
+        Load a summary of every event from the Event directory.
+
+        Only the Event name/folder and the MixerInput output bus are read.
+        Malformed event files are skipped.
+
+        Returns:
+            EventIndex with one entry per event
+        """
+        index = EventIndex()
+
+        for xml_file, objects in self._load_directory("Event", ('name',), ('folder', 'output'),
+                                                      {'Event', 'MixerInput'}, skip_errors=True):
+            # Bus routing: output of the first MixerInput in the file
+            bus_id = next((obj['output'] for obj in objects if obj['class'] == 'MixerInput'), None)
+
+            for obj in objects:
+                if obj['class'] == 'Event':
+                    index.add(
+                        obj['id'],
+                        obj['name'] if obj['name'] is not None else "Unnamed",
+                        obj['folder'],
+                        xml_file,
+                        bus_id
+                    )
+
+        self._save_cache()
+        return index
+
+    def load_audio_files(self) -> Dict[str, str]:
+        """
+        Load the asset paths of every AudioFile object.
+
+        Malformed files are skipped.
+
+        Returns:
+            Dictionary mapping asset paths (e.g., "Characters/Cat.wav") to AudioFile IDs
+        """
+        audio_files = {}
+
+        for _, objects in self._load_directory("AudioFile", ('assetPath',), (),
+                                               {'AudioFile'}, skip_errors=True):
+            for obj in objects:
+                if obj['assetPath']:
+                    audio_files.setdefault(obj['assetPath'], obj['id'])
+
+        self._save_cache()
+        return audio_files
@@ -4,9 +4,61 @@ Shared utilities for writing properly formatted XML files.
 """
 
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 from pathlib import Path
 
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+# Number of pending output chunks before they are handed to the file buffer
+_FLUSH_PARTS = 4096
+
+
+def _escape(data: str) -> str:
+    """Escape text the way minidom does (also used for attribute values)."""
+    if '&' in data:
+        data = data.replace('&', '&amp;')
+    if '<' in data:
+        data = data.replace('<', '&lt;')
+    if '"' in data:
+        data = data.replace('"', '&quot;')
+    if '>' in data:
+        data = data.replace('>', '&gt;')
+    return data
+
+
+def _text(data: str) -> str:
+    """Normalize line ends like an XML parser does for character data."""
+    if '\r' in data:
+        data = data.replace('\r\n', '\n').replace('\r', '\n')
+    return data
+
+
+def _write_element(write, elem: ET.Element, indent: str):
+    """Write one element (and its subtree) in minidom's pretty-print layout."""
+    parts = [indent, '<', elem.tag]
+    for name, value in elem.attrib.items():
+        parts.append(f' {name}="{_escape(value)}"')
+    write(''.join(parts))
+
+    text = elem.text
+    if len(elem) == 0:
+        if text:
+            # A single text child stays inline
+            write(f'>{_escape(_text(text))}</{elem.tag}>\n')
+        else:
+            write('/>\n')
+        return
+
+    write('>\n')
+    child_indent = indent + '\t'
+    if text:
+        # Whitespace text nodes (e.g., from a parsed file) are kept as lines
+        write(_escape(f'{child_indent}{_text(text)}\n'))
+    for child in elem:
+        _write_element(write, child, child_indent)
+        if child.tail:
+            write(_escape(f'{child_indent}{_text(child.tail)}\n'))
+    write(f'{indent}</{elem.tag}>\n')
+
 
 def write_pretty_xml(element: ET.Element, filepath: Path):
     """
@@ -17,14 +69,19 @@ def write_pretty_xml(element: ET.Element, filepath: Path):
         filepath: Path where to write the XML file
 
     The output will be properly indented with tabs and encoded in UTF-8.
+    The tree is serialized in a single pass straight to the file, producing
+    the same bytes as a minidom toprettyxml(indent='\\t', encoding='UTF-8')
+    round-trip without building a DOM.
     """
-    # Convert element tree to string
-    xml_str = ET.tostring(element, encoding='unicode')
+    with open(filepath, 'w', encoding='utf-8', errors='xmlcharrefreplace',
+              newline='\n') as f:
+        parts = [XML_DECLARATION]
 
-    # Parse and prettify
-    dom = minidom.parseString(xml_str)
-    pretty_xml = dom.toprettyxml(indent='\t', encoding='UTF-8')
+        def write(chunk):
+            parts.append(chunk)
+            if len(parts) >= _FLUSH_PARTS:
+                f.write(''.join(parts))
+                parts.clear()
 
-    # Write to file
-    with open(filepath, 'wb') as f:
-        f.write(pretty_xml)
+        _write_element(write, element, '')
+        f.write(''.join(parts))
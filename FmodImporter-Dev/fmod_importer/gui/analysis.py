@@ -9,6 +9,7 @@ from tkinter import messagebox
 
 from ..naming import NamingPattern, format_template_name
 from ..matcher import AudioMatcher
+from ..media_scanner import MediaScanCache
 
 
 class AnalysisMixin:
@@ -19,6 +20,20 @@ class AnalysisMixin:
     All methods access shared state through 'self'.
     """
 
+    def _scan_media(self, media_path: str, recursive: bool):
+        """Collect audio files, re-listing only the folders changed since the last scan"""
+        cache = getattr(self, '_media_scan_cache', None)
+        if cache is None or cache.directory != media_path or cache.recursive != recursive:
+            cache = MediaScanCache.for_directory(media_path, recursive)
+            self._media_scan_cache = cache
+
+        audio_files, diff = cache.scan()
+        cache.save()
+        if diff:
+            print(f"Media changes since last scan: {len(diff.added)} added, "
+                  f"{len(diff.removed)} removed, {len(diff.modified)} modified")
+        return audio_files
+
     def analyze(self):
         """Analyze what will be imported and populate preview tree"""
         try:
@@ -140,7 +155,7 @@ class AnalysisMixin:
 
             # Collect audio files
             recursive = self.recursive_var.get() if hasattr(self, 'recursive_var') else False
-            audio_files = AudioMatcher.collect_audio_files(media_path, recursive=recursive)
+            audio_files = self._scan_media(media_path, recursive)
 
             if not audio_files:
                 messagebox.showinfo("Info", "No audio files found in the selected directory")
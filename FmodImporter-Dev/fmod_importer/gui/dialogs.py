@@ -8,6 +8,8 @@ from tkinter import ttk, messagebox, simpledialog
 import xml.etree.ElementTree as ET
 import uuid
 
+from ..core.folder_tree import FolderTree
+
 
 class DialogsMixin:
     """
@@ -202,6 +204,7 @@ class DialogsMixin:
 
         # Initial fetch
         items = items_getter()
+        items_tree = FolderTree(items)
 
         frame = ttk.Frame(dialog, padding="10")
         frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -229,55 +232,14 @@ class DialogsMixin:
 
         result = [None]
 
-        def has_matching_descendant(item_id, search_filter):
-            """Check if item or any descendant matches the search filter"""
-            if not search_filter:
-                return True
-
-            # Check current item
-            if item_id in items and search_filter.lower() in items[item_id]['name'].lower():
-                return True
-
-            # Check children recursively
-            for child_id, child_data in items.items():
-                if child_data.get('parent') == item_id:
-                    if has_matching_descendant(child_id, search_filter):
-                        return True
-
-            return False
-
-        def build_tree(parent_item, parent_id, search_filter=""):
-            """Build tree hierarchy with alphabetical sorting and search filter"""
-            # Get children and sort alphabetically
-            children = [(item_id, item_data) for item_id, item_data in items.items()
-                       if item_data.get('parent') == parent_id]
-            children.sort(key=lambda x: x[1]['name'].lower())
-
-            for item_id, item_data in children:
-                # Apply search filter - show if item or any descendant matches
-                if search_filter:
-                    if not has_matching_descendant(item_id, search_filter):
-                        continue
-
-                # Show type prefix for banks (folder vs bank)
-                display_name = item_data['name']
-                item_type = item_data.get('type')
-                
-                # Check for pending status
-                if self.project.is_folder_pending(item_id):
-                    # Add pending indicator
-                    pass # Handled by tag? Or just implied by existence in list
-
-                if item_type == 'folder':
-                    display_name = f"📁 {display_name}"
-                elif item_type == 'bank':
-                    display_name = f"💾 {display_name}"
-                
-                # Add tag for pending items
-                tags = ('pending',) if self.project.is_folder_pending(item_id) else ()
-
-                node = tree.insert(parent_item, 'end', text=display_name, values=(item_id,), tags=tags)
-                build_tree(node, item_id, search_filter)
+        def format_name(item_data):
+            """Show type prefix for banks (folder vs bank)"""
+            item_type = item_data.get('type')
+            if item_type == 'folder':
+                return f"📁 {item_data['name']}"
+            if item_type == 'bank':
+                return f"💾 {item_data['name']}"
+            return item_data['name']
 
         def find_root_items():
             """Find root items (items without parent or with None parent), sorted alphabetically"""
@@ -335,8 +297,9 @@ class DialogsMixin:
 
         def refresh_tree(search_filter=""):
             """Rebuild tree after changes, preserving expanded state"""
-            nonlocal items
+            nonlocal items, items_tree
             items = items_getter()  # REFRESH ITEMS
+            items_tree = FolderTree(items)
             
             expanded_ids = get_expanded_items()
             tree.delete(*tree.get_children())
@@ -345,25 +308,9 @@ class DialogsMixin:
             tree.tag_configure('pending', font=('TkDefaultFont', 9, 'italic'), foreground='gray')
 
             # Build tree from roots
-            roots = find_root_items()
-            for root_id, root_data in roots:
-                # Apply search filter - show if root or any descendant matches
-                if search_filter:
-                    if not has_matching_descendant(root_id, search_filter):
-                        continue
-
-                # Show type prefix for banks (folder vs bank)
-                display_name = root_data['name']
-                item_type = root_data.get('type')
-                if item_type == 'folder':
-                    display_name = f"📁 {display_name}"
-                elif item_type == 'bank':
-                    display_name = f"💾 {display_name}"
-                
-                tags = ('pending',) if self.project.is_folder_pending(root_id) else ()
-
-                root_node = tree.insert('', 'end', text=display_name, values=(root_id,), tags=tags)
-                build_tree(root_node, root_id, search_filter)
+            roots = [root_id for root_id, _ in find_root_items()]
+            visible_ids = self._matching_tree_ids(items_tree, items, search_filter)
+            self._insert_tree_items(tree, '', roots, items, items_tree, visible_ids, format_name)
 
             restore_expanded_state(expanded_ids)
             if search_filter:
@@ -557,294 +504,3 @@ class DialogsMixin:
 
         dialog.wait_window()
         return result[0]
-
-    def _show_folder_tree_dialog(self, title: str):
-        """Show a dialog with tree view for folder selection"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title(title)
-        dialog.geometry("500x600")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self._center_dialog(dialog)
-
-        frame = ttk.Frame(dialog, padding="10")
-        frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        # Search field
-        search_frame = ttk.Frame(frame)
-        search_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
-        ttk.Label(search_frame, text="Search:").grid(row=0, column=0, padx=(0, 5))
-        search_var = tk.StringVar()
-        search_entry = ttk.Entry(search_frame, textvariable=search_var, width=40)
-        search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
-        search_frame.columnconfigure(1, weight=1)
-
-        # Create treeview
-        tree_frame = ttk.Frame(frame)
-        tree_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        tree = ttk.Treeview(tree_frame, selectmode='browse')
-        tree.heading('#0', text='Event Folders')
-        tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        tree['yscrollcommand'] = scrollbar.set
-
-        # Configure pending folder style
-        tree.tag_configure('pending', font=('TkDefaultFont', 9, 'italic'), foreground='gray')
-
-        def has_matching_descendant(folder_id, search_filter, all_folders):
-            """Check if folder or any descendant matches search"""
-            if not search_filter:
-                return True
-            if search_filter.lower() in all_folders.get(folder_id, {}).get('name', '').lower():
-                return True
-            for fid, fdata in all_folders.items():
-                if fdata.get('parent') == folder_id:
-                    if has_matching_descendant(fid, search_filter, all_folders):
-                        return True
-            return False
-
-        # Build tree hierarchy sorted A-Z
-        def build_tree(parent_item, parent_folder_id, search_filter=""):
-            # Get all child folders (committed + pending) and sort them by name A-Z
-            all_folders = self.project.get_all_event_folders()
-            child_folders = [(folder_id, folder_data) for folder_id, folder_data in all_folders.items()
-                           if folder_data['parent'] == parent_folder_id]
-            child_folders.sort(key=lambda x: x[1]['name'].lower())
-
-            for folder_id, folder_data in child_folders:
-                # Apply search filter
-                if search_filter and not has_matching_descendant(folder_id, search_filter, all_folders):
-                    continue
-                # Check if pending
-                tags = ('pending',) if self.project.is_folder_pending(folder_id) else ()
-                item = tree.insert(parent_item, 'end', text=folder_data['name'],
-                                  values=(folder_id,), tags=tags)
-                build_tree(item, folder_id, search_filter)
-
-        def rebuild_tree(search_filter=""):
-            """Rebuild tree with search filter"""
-            tree.delete(*tree.get_children())
-            master_id = self.project.workspace['masterEventFolder']
-            all_folders = self.project.get_all_event_folders()
-            master_name = all_folders[master_id]['name']
-            root_item = tree.insert('', 'end', text=master_name, values=(master_id,))
-            build_tree(root_item, master_id, search_filter)
-            if search_filter:
-                expand_all()
-
-        # Start with master folder
-        rebuild_tree()
-
-        # Connect search field
-        def on_search_change(*args):
-            rebuild_tree(search_var.get())
-        search_var.trace('w', on_search_change)
-
-        result = [None]
-
-        def get_expanded_items():
-            """Get list of expanded item IDs"""
-            expanded = []
-            def check_item(item):
-                if tree.item(item, 'open'):
-                    values = tree.item(item, 'values')
-                    if values:
-                        expanded.append(values[0])
-                for child in tree.get_children(item):
-                    check_item(child)
-            for item in tree.get_children():
-                check_item(item)
-            return expanded
-
-        def expand_all():
-            """Expand all tree items"""
-            def expand_item(item):
-                tree.item(item, open=True)
-                for child in tree.get_children(item):
-                    expand_item(child)
-            for item in tree.get_children():
-                expand_item(item)
-
-        def collapse_all():
-            """Collapse all tree items except root"""
-            def collapse_item(item):
-                for child in tree.get_children(item):
-                    tree.item(child, open=False)
-                    collapse_item(child)
-            for item in tree.get_children():
-                tree.item(item, open=True)  # Keep root open
-                collapse_item(item)
-
-        def restore_expanded_state(expanded_ids):
-            """Restore expanded state of items"""
-            def restore_item(item):
-                values = tree.item(item, 'values')
-                if values and values[0] in expanded_ids:
-                    tree.item(item, open=True)
-                for child in tree.get_children(item):
-                    restore_item(child)
-            for item in tree.get_children():
-                restore_item(item)
-
-        def refresh_tree():
-            """Rebuild tree after changes, preserving expanded state"""
-            expanded_ids = get_expanded_items()
-            tree.delete(*tree.get_children())
-            master_id = self.project.workspace['masterEventFolder']
-            master_name = self.project.event_folders[master_id]['name']
-            root_item = tree.insert('', 'end', text=master_name, values=(master_id,))
-            build_tree(root_item, master_id)
-            restore_expanded_state(expanded_ids)
-
-        def on_new_folder():
-            selection = tree.selection()
-            if not selection:
-                return
-
-            parent_item = selection[0]
-            parent_id = tree.item(parent_item, 'values')[0]
-
-            initial_value = self._get_combined_name()
-            name = simpledialog.askstring("New Folder", "Enter folder name:",
-                                          initialvalue=initial_value, parent=dialog)
-            if name:
-                try:
-                    new_id = self.project.create_event_folder(name, parent_id, commit=False)
-                    refresh_tree()
-
-                    # Find and select the newly created folder in the tree
-                    def find_and_select(item=''):
-                        """Recursively find the folder with new_id and select it"""
-                        for child in tree.get_children(item):
-                            values = tree.item(child, 'values')
-                            if values and values[0] == new_id:
-                                tree.selection_set(child)
-                                tree.see(child)
-                                # Auto-select and close dialog
-                                result[0] = (name, new_id)
-                                dialog.destroy()
-                                return True
-                            if find_and_select(child):
-                                return True
-                        return False
-
-                    find_and_select()
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to create folder:\n{str(e)}")
-
-        def on_rename():
-            selection = tree.selection()
-            if not selection:
-                return
-
-            item = selection[0]
-            folder_name = tree.item(item, 'text')
-            folder_id = tree.item(item, 'values')[0]
-
-            # Check if it's the master folder
-            master_id = self.project.workspace['masterEventFolder']
-            if folder_id == master_id:
-                return
-
-            new_name = simpledialog.askstring("Rename Folder", "Enter new name:",
-                                            initialvalue=folder_name, parent=dialog)
-            if new_name and new_name != folder_name:
-                try:
-                    # Check if pending
-                    if self.project.is_folder_pending(folder_id):
-                        # Update pending data directly
-                        self.project._pending_manager._pending_event_folders[folder_id]['name'] = new_name
-                        refresh_tree()
-                    else:
-                        # Update the name in the XML
-                        folder_data = self.project.event_folders[folder_id]
-                        xml_path = folder_data['path']
-                        tree_xml = ET.parse(xml_path)
-                        root_xml = tree_xml.getroot()
-
-                        name_elem = root_xml.find(".//property[@name='name']/value")
-                        if name_elem is not None:
-                            name_elem.text = new_name
-                            self.project._write_pretty_xml(root_xml, xml_path)
-                            folder_data['name'] = new_name
-                            refresh_tree()
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to rename folder:\n{str(e)}")
-
-        def on_delete_folder():
-            selection = tree.selection()
-            if not selection:
-                return
-
-            item = selection[0]
-            folder_name = tree.item(item, 'text')
-            folder_id = tree.item(item, 'values')[0]
-
-            master_id = self.project.workspace['masterEventFolder']
-            if folder_id == master_id:
-                return
-
-            try:
-                # Check if pending
-                if self.project.is_folder_pending(folder_id):
-                    # Remove from pending
-                    if folder_id in self.project._pending_manager._pending_event_folders:
-                        del self.project._pending_manager._pending_event_folders[folder_id]
-                    refresh_tree()
-                else:
-                    self.project.delete_folder(folder_id)
-                    refresh_tree()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete folder:\n{str(e)}")
-
-        def on_select():
-            selection = tree.selection()
-            if selection:
-                item = selection[0]
-                folder_name = tree.item(item, 'text')
-                folder_id = tree.item(item, 'values')[0]
-                result[0] = (folder_name, folder_id)
-                dialog.destroy()
-
-        def on_cancel():
-            dialog.destroy()
-
-        def on_key(event):
-            """Handle keyboard shortcuts"""
-            if event.keysym == 'F2':
-                on_rename()
-
-        tree.bind('<Key>', on_key)
-        tree.bind('<Double-Button-1>', lambda e: on_select())
-
-        # Expand all by default
-        expand_all()
-
-        # Edit buttons
-        edit_frame = ttk.Frame(frame)
-        edit_frame.grid(row=2, column=0, pady=5)
-        ttk.Button(edit_frame, text="New", command=on_new_folder, width=10).grid(row=0, column=0, padx=2)
-        ttk.Button(edit_frame, text="Rename (F2)", command=on_rename, width=12).grid(row=0, column=1, padx=2)
-        ttk.Button(edit_frame, text="Delete", command=on_delete_folder, width=10).grid(row=0, column=2, padx=2)
-        ttk.Button(edit_frame, text="Expand All", command=expand_all, width=10).grid(row=0, column=3, padx=2)
-        ttk.Button(edit_frame, text="Collapse", command=collapse_all, width=10).grid(row=0, column=4, padx=2)
-
-        # Selection buttons
-        button_frame = ttk.Frame(frame)
-        button_frame.grid(row=3, column=0, pady=10)
-        ttk.Button(button_frame, text="Select", command=on_select, width=15).grid(row=0, column=0, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=on_cancel, width=15).grid(row=0, column=1, padx=5)
-
-        # Configure grid weights
-        dialog.columnconfigure(0, weight=1)
-        dialog.rowconfigure(0, weight=1)
-        frame.columnconfigure(0, weight=1)
-        frame.rowconfigure(1, weight=1)
-        tree_frame.columnconfigure(0, weight=1)
-        tree_frame.rowconfigure(0, weight=1)
-
-        dialog.wait_window()
-        return result[0]
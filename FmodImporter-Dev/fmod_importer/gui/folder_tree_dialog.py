@@ -0,0 +1,324 @@
+"""
+GUI Folder Tree Dialog Mixin Module
+Handles the event folder picker and the tree population shared by the
+hierarchical dialogs, driven by FolderTree children indexes.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog
+import xml.etree.ElementTree as ET
+
+
+class FolderTreeDialogMixin:
+    """
+    Mixin class providing the event folder tree dialog and tree helpers.
+
+    These methods are mixed into FmodImporterGUI via multiple inheritance.
+    All methods access shared state through 'self'.
+    """
+
+    def _matching_tree_ids(self, folder_tree, items: dict, search_filter: str):
+        """
+        Get the IDs of items to show for a search filter.
+
+        Args:
+            folder_tree: FolderTree indexing the items
+            items: Dictionary of items (id -> data with 'name')
+            search_filter: Search text (empty shows everything)
+
+        Returns:
+            IDs of items that match or have a matching descendant, or None without a filter
+        """
+        if not search_filter:
+            return None
+        needle = search_filter.lower()
+        return folder_tree.with_matching_descendant(
+            lambda item_id: needle in items.get(item_id, {}).get('name', '').lower()
+        )
+
+    def _insert_tree_items(self, tree, parent_node, item_ids, items: dict, folder_tree,
+                           visible_ids=None, format_name=None):
+        """
+        Insert items and their descendants under a tree node, sorted A-Z.
+
+        Args:
+            tree: ttk.Treeview to fill
+            parent_node: Tree node to insert under ('' for the top level)
+            item_ids: IDs of the items to insert at this level
+            items: Dictionary of items (id -> data with 'name')
+            folder_tree: FolderTree indexing the items' children
+            visible_ids: IDs to show (None shows every item)
+            format_name: Optional callable building the label from an item's data
+        """
+        for item_id in sorted(item_ids, key=lambda i: items[i]['name'].lower()):
+            # Apply search filter
+            if visible_ids is not None and item_id not in visible_ids:
+                continue
+            item_data = items[item_id]
+            text = format_name(item_data) if format_name else item_data['name']
+            tags = ('pending',) if self.project.is_folder_pending(item_id) else ()
+            node = tree.insert(parent_node, 'end', text=text, values=(item_id,), tags=tags)
+            self._insert_tree_items(tree, node, folder_tree.children(item_id), items,
+                                    folder_tree, visible_ids, format_name)
+
+    def _show_folder_tree_dialog(self, title: str):
+        """Show a dialog with tree view for folder selection"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("500x600")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        self._center_dialog(dialog)
+
+        frame = ttk.Frame(dialog, padding="10")
+        frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # Search field
+        search_frame = ttk.Frame(frame)
+        search_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        ttk.Label(search_frame, text="Search:").grid(row=0, column=0, padx=(0, 5))
+        search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=search_var, width=40)
+        search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        search_frame.columnconfigure(1, weight=1)
+
+        # Create treeview
+        tree_frame = ttk.Frame(frame)
+        tree_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        tree = ttk.Treeview(tree_frame, selectmode='browse')
+        tree.heading('#0', text='Event Folders')
+        tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        tree['yscrollcommand'] = scrollbar.set
+
+        # Configure pending folder style
+        tree.tag_configure('pending', font=('TkDefaultFont', 9, 'italic'), foreground='gray')
+
+        # Build tree hierarchy sorted A-Z (committed + pending folders)
+        def build_tree(parent_item, parent_folder_id, all_folders, visible_ids=None):
+            self._insert_tree_items(tree, parent_item, self.project.get_child_folders(parent_folder_id),
+                                    all_folders, self.project.folder_tree, visible_ids)
+
+        def rebuild_tree(search_filter=""):
+            """Rebuild tree with search filter"""
+            tree.delete(*tree.get_children())
+            master_id = self.project.workspace['masterEventFolder']
+            all_folders = self.project.get_all_event_folders()
+            master_name = all_folders[master_id]['name']
+            root_item = tree.insert('', 'end', text=master_name, values=(master_id,))
+            visible_ids = self._matching_tree_ids(self.project.folder_tree, all_folders, search_filter)
+            build_tree(root_item, master_id, all_folders, visible_ids)
+            if search_filter:
+                expand_all()
+
+        # Start with master folder
+        rebuild_tree()
+
+        # Connect search field
+        def on_search_change(*args):
+            rebuild_tree(search_var.get())
+        search_var.trace('w', on_search_change)
+
+        result = [None]
+
+        def get_expanded_items():
+            """Get list of expanded item IDs"""
+            expanded = []
+            def check_item(item):
+                if tree.item(item, 'open'):
+                    values = tree.item(item, 'values')
+                    if values:
+                        expanded.append(values[0])
+                for child in tree.get_children(item):
+                    check_item(child)
+            for item in tree.get_children():
+                check_item(item)
+            return expanded
+
+        def expand_all():
+            """Expand all tree items"""
+            def expand_item(item):
+                tree.item(item, open=True)
+                for child in tree.get_children(item):
+                    expand_item(child)
+            for item in tree.get_children():
+                expand_item(item)
+
+        def collapse_all():
+            """Collapse all tree items except root"""
+            def collapse_item(item):
+                for child in tree.get_children(item):
+                    tree.item(child, open=False)
+                    collapse_item(child)
+            for item in tree.get_children():
+                tree.item(item, open=True)  # Keep root open
+                collapse_item(item)
+
+        def restore_expanded_state(expanded_ids):
+            """Restore expanded state of items"""
+            def restore_item(item):
+                values = tree.item(item, 'values')
+                if values and values[0] in expanded_ids:
+                    tree.item(item, open=True)
+                for child in tree.get_children(item):
+                    restore_item(child)
+            for item in tree.get_children():
+                restore_item(item)
+
+        def refresh_tree():
+            """Rebuild tree after changes, preserving expanded state"""
+            expanded_ids = get_expanded_items()
+            tree.delete(*tree.get_children())
+            master_id = self.project.workspace['masterEventFolder']
+            master_name = self.project.event_folders[master_id]['name']
+            root_item = tree.insert('', 'end', text=master_name, values=(master_id,))
+            build_tree(root_item, master_id, self.project.get_all_event_folders())
+            restore_expanded_state(expanded_ids)
+
+        def on_new_folder():
+            selection = tree.selection()
+            if not selection:
+                return
+
+            parent_item = selection[0]
+            parent_id = tree.item(parent_item, 'values')[0]
+
+            initial_value = self._get_combined_name()
+            name = simpledialog.askstring("New Folder", "Enter folder name:",
+                                          initialvalue=initial_value, parent=dialog)
+            if name:
+                try:
+                    new_id = self.project.create_event_folder(name, parent_id, commit=False)
+                    refresh_tree()
+
+                    # Find and select the newly created folder in the tree
+                    def find_and_select(item=''):
+                        """Recursively find the folder with new_id and select it"""
+                        for child in tree.get_children(item):
+                            values = tree.item(child, 'values')
+                            if values and values[0] == new_id:
+                                tree.selection_set(child)
+                                tree.see(child)
+                                # Auto-select and close dialog
+                                result[0] = (name, new_id)
+                                dialog.destroy()
+                                return True
+                            if find_and_select(child):
+                                return True
+                        return False
+
+                    find_and_select()
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to create folder:\n{str(e)}")
+
+        def on_rename():
+            selection = tree.selection()
+            if not selection:
+                return
+
+            item = selection[0]
+            folder_name = tree.item(item, 'text')
+            folder_id = tree.item(item, 'values')[0]
+
+            # Check if it's the master folder
+            master_id = self.project.workspace['masterEventFolder']
+            if folder_id == master_id:
+                return
+
+            new_name = simpledialog.askstring("Rename Folder", "Enter new name:",
+                                            initialvalue=folder_name, parent=dialog)
+            if new_name and new_name != folder_name:
+                try:
+                    # Check if pending
+                    if self.project.is_folder_pending(folder_id):
+                        # Update pending data directly
+                        self.project._pending_manager._pending_event_folders[folder_id]['name'] = new_name
+                        refresh_tree()
+                    else:
+                        # Update the name in the XML
+                        folder_data = self.project.event_folders[folder_id]
+                        xml_path = folder_data['path']
+                        tree_xml = ET.parse(xml_path)
+                        root_xml = tree_xml.getroot()
+
+                        name_elem = root_xml.find(".//property[@name='name']/value")
+                        if name_elem is not None:
+                            name_elem.text = new_name
+                            self.project._write_pretty_xml(root_xml, xml_path)
+                            folder_data['name'] = new_name
+                            refresh_tree()
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to rename folder:\n{str(e)}")
+
+        def on_delete_folder():
+            selection = tree.selection()
+            if not selection:
+                return
+
+            item = selection[0]
+            folder_name = tree.item(item, 'text')
+            folder_id = tree.item(item, 'values')[0]
+
+            master_id = self.project.workspace['masterEventFolder']
+            if folder_id == master_id:
+                return
+
+            try:
+                # Check if pending
+                # Removes pending folders from the pending list
+                self.project.delete_folder(folder_id)
+                refresh_tree()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to delete folder:\n{str(e)}")
+
+        def on_select():
+            selection = tree.selection()
+            if selection:
+                item = selection[0]
+                folder_name = tree.item(item, 'text')
+                folder_id = tree.item(item, 'values')[0]
+                result[0] = (folder_name, folder_id)
+                dialog.destroy()
+
+        def on_cancel():
+            dialog.destroy()
+
+        def on_key(event):
+            """Handle keyboard shortcuts"""
+            if event.keysym == 'F2':
+                on_rename()
+
+        tree.bind('<Key>', on_key)
+        tree.bind('<Double-Button-1>', lambda e: on_select())
+
+        # Expand all by default
+        expand_all()
+
+        # Edit buttons
+        edit_frame = ttk.Frame(frame)
+        edit_frame.grid(row=2, column=0, pady=5)
+        ttk.Button(edit_frame, text="New", command=on_new_folder, width=10).grid(row=0, column=0, padx=2)
+        ttk.Button(edit_frame, text="Rename (F2)", command=on_rename, width=12).grid(row=0, column=1, padx=2)
+        ttk.Button(edit_frame, text="Delete", command=on_delete_folder, width=10).grid(row=0, column=2, padx=2)
+        ttk.Button(edit_frame, text="Expand All", command=expand_all, width=10).grid(row=0, column=3, padx=2)
+        ttk.Button(edit_frame, text="Collapse", command=collapse_all, width=10).grid(row=0, column=4, padx=2)
+
+        # Selection buttons
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=3, column=0, pady=10)
+        ttk.Button(button_frame, text="Select", command=on_select, width=15).grid(row=0, column=0, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=on_cancel, width=15).grid(row=0, column=1, padx=5)
+
+        # Configure grid weights
+        dialog.columnconfigure(0, weight=1)
+        dialog.rowconfigure(0, weight=1)
+        frame.columnconfigure(0, weight=1)
+        frame.rowconfigure(1, weight=1)
+        tree_frame.columnconfigure(0, weight=1)
+        tree_frame.rowconfigure(0, weight=1)
+
+        dialog.wait_window()
+        return result[0]
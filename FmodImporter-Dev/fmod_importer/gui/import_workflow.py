@@ -6,6 +6,7 @@ Handles the import workflow for importing audio assets to FMOD.
 import os
 import shutil
 import threading
+import time
 import traceback
 from pathlib import Path
 import tkinter as tk
@@ -315,6 +316,7 @@ class ImportMixin:
 
             # 6. Execute Import Loop
             num_events = len(events_to_process)
+            placement = self.load_settings().get('asset_placement', 'copy')
             progress = ProgressDialog(
                 self.root,
                 "Importing Assets",
@@ -329,42 +331,34 @@ class ImportMixin:
                     'errors': []
                 }
 
-                try:
-                    for i, event in enumerate(events_to_process):
-                        msg = f"Importing {i+1}/{num_events}: {event['name']}"
-                        self.root.after(0, lambda m=msg: progress.update_message(m))
-
-                        try:
-                            # Python-based deep copy and audio assignment
-                            if event['template_id']:
-                                self.project.copy_event_from_template(
-                                    template_event_id=event['template_id'],
-                                    new_name=event['name'],
-                                    dest_folder_id=dest_folder_id,
-                                    bank_id=bank_id,
-                                    bus_id=bus_id,
-                                    audio_files=event['audio_files'],  # Source paths
-                                    audio_asset_folder=asset_folder    # Dest folder relative to Assets/
-                                )
-                            else:
-                                # Auto-Create (from scratch)
-                                self.project.create_event_from_scratch(
-                                    new_name=event['name'],
-                                    dest_folder_id=dest_folder_id,
-                                    bank_id=bank_id,
-                                    bus_id=bus_id,
-                                    audio_files=event['audio_files'],
-                                    audio_asset_folder=asset_folder
-                                )
-                            
-                            results['success'] += 1
+                def _report(msg):
+                    self.root.after(0, lambda m=msg: progress.update_message(m))
+
+                last_copy_update = [0.0]
 
-                        except Exception as e:
-                            results['failed'] += 1
-                            error_msg = f"{event['name']}: {str(e)}"
-                            results['errors'].append(error_msg)
-                            print(f"Error importing {event['name']}: {e}")
-                            traceback.print_exc()
+                def _report_copy(copy_progress):
+                    # Called from copy threads; throttle UI updates to ~10/s
+                    now = time.monotonic()
+                    done = copy_progress.files_done == copy_progress.files_total
+                    if not done and now - last_copy_update[0] < 0.1:
+                        return
+                    last_copy_update[0] = now
+
+                    fraction, detail = self._format_copy_progress(copy_progress)
+                    self.root.after(0, lambda f=fraction, d=detail: progress.update_progress(f, d))
+
+                try:
+                    # Plan every event in memory, then write everything in one phase
+                    results.update(self.project.import_events(
+                        events_to_process,
+                        dest_folder_id=dest_folder_id,
+                        bank_id=bank_id,
+                        bus_id=bus_id,
+                        audio_asset_folder=asset_folder,  # Dest folder relative to Assets/
+                        progress_callback=_report,
+                        copy_progress_callback=_report_copy,
+                        placement=placement
+                    ))
 
                 except Exception as fatal_e:
                     self.root.after(0, lambda: messagebox.showerror("Fatal Error", f"Import crashed: {str(fatal_e)}"))
@@ -375,9 +369,16 @@ class ImportMixin:
 
                     # Show summary
                     def _show_summary():
-                        if results['failed'] == 0:
-                            messagebox.showinfo("Import Complete",
-                                              f"Successfully imported {results['success']} events.")
+                        if results['failed'] == 0 and not results['errors']:
+                            summary = f"Successfully imported {results['success']} events."
+                            if results.get('reused_audio_files'):
+                                summary += (f"\n{results['reused_audio_files']} audio files were "
+                                            f"already in the project and reused.")
+                            if results.get('placements') and results.get('placement') != 'copy':
+                                used = ", ".join(f"{count} {strategy}"
+                                                 for strategy, count in sorted(results['placements'].items()))
+                                summary += f"\nAsset placement ({results['placement']}): {used}."
+                            messagebox.showinfo("Import Complete", summary)
                         else:
                             error_text = "\n".join(results['errors'][:5])
                             if len(results['errors']) > 5:
@@ -403,6 +404,24 @@ class ImportMixin:
             messagebox.showerror("Error", f"Failed to start import: {str(e)}")
             traceback.print_exc()
 
+    def _format_copy_progress(self, copy_progress):
+        """
+        Format audio copy progress for the progress dialog.
+
+        Returns:
+            Tuple of (completed fraction, detail text with throughput and ETA)
+        """
+        total = copy_progress.bytes_total
+        fraction = copy_progress.bytes_done / total if total else 1.0
+
+        detail = (f"Copied {copy_progress.files_done}/{copy_progress.files_total} audio files - "
+                  f"{copy_progress.rate / (1024 * 1024):.1f} MB/s")
+        eta = copy_progress.eta
+        if eta is not None:
+            minutes, seconds = divmod(int(eta + 0.5), 60)
+            detail += f" - ETA {minutes}:{seconds:02d}"
+        return fraction, detail
+
     def _get_folder_path(self, folder_id):
         """Get full path of an event folder (excluding master folder)"""
         parts = []
@@ -17,6 +17,7 @@ from .utils import UtilsMixin
 from .widgets import WidgetsMixin
 from .pattern_setup import PatternSetupMixin
 from .dialogs import DialogsMixin
+from .folder_tree_dialog import FolderTreeDialogMixin
 from .asset_dialogs import AssetDialogsMixin
 from .drag_drop import DragDropMixin
 from .analysis import AnalysisMixin
@@ -31,6 +32,7 @@ class FmodImporterGUI(
     WidgetsMixin,
     PatternSetupMixin,
     DialogsMixin,
+    FolderTreeDialogMixin,
     AssetDialogsMixin,
     DragDropMixin,
     AnalysisMixin,
@@ -3,7 +3,90 @@ Preset Reference Resolver Module
 Handles smart UUID resolution for FMOD project references (folders, banks, buses, assets).
 """
 
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
+
+
+class _PathIndex:
+    """
+    Path, (parent, name) and name lookups over one kind of hierarchical item.
+
+    Works on a snapshot of the items (committed + pending). Paths are built
+    from the parent's memoized path, and each lookup table is built on first
+    use, then kept up to date by add().
+    """
+
+    def __init__(self, items: Dict[str, Dict], root_id: Optional[str],
+                 format_path: Callable[[Tuple[str, ...]], str]):
+        """
+        Args:
+            items: Dictionary of items (id -> data with 'name' and 'parent')
+            root_id: ID of the master item, left out of paths
+            format_path: Builds the path string from the names below the root
+        """
+        self.items = items
+        self.root_id = root_id
+        self.format_path = format_path
+        self._parts = {}
+        self._by_path = None
+        self._by_child = None
+        self._by_name = None
+
+    def path_parts(self, item_id: str) -> Tuple[str, ...]:
+        """Get the names from below the root down to an item."""
+        chain = []
+        visited = set()
+        current_id = item_id
+        while (current_id and current_id in self.items and current_id != self.root_id
+               and current_id not in self._parts and current_id not in visited):
+            visited.add(current_id)
+            chain.append(current_id)
+            current_id = self.items[current_id].get('parent')
+
+        parts = self._parts.get(current_id, ())
+        for chain_id in reversed(chain):
+            parts = parts + (self.items[chain_id].get('name', ''),)
+            self._parts[chain_id] = parts
+        return parts
+
+    def path(self, item_id: str) -> str:
+        """Get the formatted path of an item."""
+        return self.format_path(self.path_parts(item_id))
+
+    def find_path(self, path: str) -> Optional[str]:
+        """Find the first item (in dictionary order) with the given path."""
+        if self._by_path is None:
+            self._by_path = {}
+            for item_id in self.items:
+                self._by_path.setdefault(self.path(item_id), item_id)
+        return self._by_path.get(path)
+
+    def find_child(self, parent_id: Optional[str], name: str) -> Optional[str]:
+        """Find the first child of a parent with the given name."""
+        if self._by_child is None:
+            self._by_child = {}
+            for item_id, item_data in self.items.items():
+                self._by_child.setdefault((item_data.get('parent'), item_data.get('name')), item_id)
+        return self._by_child.get((parent_id, name))
+
+    def find_name(self, name: str) -> Optional[str]:
+        """Find the first item with the given name."""
+        if self._by_name is None:
+            self._by_name = {}
+            for item_id, item_data in self.items.items():
+                self._by_name.setdefault(item_data.get('name'), item_id)
+        return self._by_name.get(name)
+
+    def add(self, item_id: str, item_data: Dict):
+        """Add a newly created item (lookups keep returning earlier matches first)."""
+        if item_id in self.items:
+            return
+        self.items[item_id] = item_data
+        if self._by_path is not None:
+            self._by_path.setdefault(self.path(item_id), item_id)
+        if self._by_child is not None:
+            self._by_child.setdefault((item_data.get('parent'), item_data.get('name')), item_id)
+        if self._by_name is not None:
+            self._by_name.setdefault(item_data.get('name'), item_id)
 
 
 class PresetResolver:
@@ -19,6 +102,11 @@ class PresetResolver:
     - Using UUIDs when they match (most reliable)
     - Falling back to paths when UUIDs differ
     - Auto-creating missing resources to avoid user errors
+
+    A resolver is one resolve session: the project's folders, banks, buses
+    and asset folders are indexed on first use and the indexes are updated
+    with the pending items the resolver creates, so lookups cost O(path
+    length). Call refresh() if the project is changed by other means.
     """
 
     def __init__(self, project):
@@ -29,6 +117,70 @@ class PresetResolver:
             project: FMODProject instance with loaded XML data
         """
         self.project = project
+        self.refresh()
+
+    def refresh(self):
+        """Drop the indexes; they are rebuilt from the project on next use."""
+        self._folders = None
+        self._banks = None
+        self._buses = None
+        self._asset_paths = None
+        self._asset_folders = None
+
+    def _folder_index(self) -> _PathIndex:
+        if self._folders is None:
+            self._folders = _PathIndex(self.project.get_all_event_folders(),
+                                       self.project.workspace.get('masterEventFolder'),
+                                       '/'.join)
+        return self._folders
+
+    def _bank_index(self) -> _PathIndex:
+        if self._banks is None:
+            self._banks = _PathIndex(self.project.get_all_banks(),
+                                     self.project.workspace.get('masterBankFolder'),
+                                     '/'.join)
+        return self._banks
+
+    def _bus_index(self) -> _PathIndex:
+        if self._buses is None:
+            self._buses = _PathIndex(self.project.get_all_buses(),
+                                     self.project._get_master_bus_id(),
+                                     lambda parts: "bus:/" + '/'.join(parts))
+        return self._buses
+
+    def _asset_index(self) -> Dict[str, str]:
+        """Map asset folder paths to IDs (first match wins)."""
+        if self._asset_paths is None:
+            self._asset_folders = self.project.get_all_asset_folders()
+            self._asset_paths = {}
+            for asset_id, asset_data in self._asset_folders.items():
+                self._asset_paths.setdefault(asset_data.get('path'), asset_id)
+        return self._asset_paths
+
+    def get_folder_data(self, folder_id: str) -> Optional[Dict]:
+        """Get an event folder's data (committed or pending)."""
+        if not self.project:
+            return None
+        return self._folder_index().items.get(folder_id)
+
+    def get_bank_data(self, bank_id: str) -> Optional[Dict]:
+        """Get a bank's data (committed or pending)."""
+        if not self.project:
+            return None
+        return self._bank_index().items.get(bank_id)
+
+    def get_bus_data(self, bus_id: str) -> Optional[Dict]:
+        """Get a bus's data (committed or pending)."""
+        if not self.project:
+            return None
+        return self._bus_index().items.get(bus_id)
+
+    def get_asset_folder_data(self, asset_id: str) -> Optional[Dict]:
+        """Get an asset folder's data (committed or pending)."""
+        if not self.project:
+            return None
+        self._asset_index()
+        return self._asset_folders.get(asset_id)
 
     # ==================== FOLDER RESOLUTION ====================
 
@@ -41,7 +193,7 @@ class PresetResolver:
         folder_path = ref.get('path', '')
 
         # Check committed AND pending folders
-        all_folders = self.project.get_all_event_folders()
+        all_folders = self._folder_index().items
 
         # Step 1: Try UUID match
         if folder_id and folder_id in all_folders:
@@ -68,16 +220,7 @@ class PresetResolver:
         if not self.project or not path:
             return None
 
-        all_folders = self.project.get_all_event_folders()
-        
-        # We need to build paths using the pending-aware logic
-        # But get_folder_path() already handles pending folders
-        for folder_id in all_folders:
-            folder_path = self.get_folder_path(folder_id)
-            if folder_path == path:
-                return folder_id
-
-        return None
+        return self._folder_index().find_path(path)
 
     def create_folder_hierarchy(self, full_path: str) -> str:
         """Create nested folder structure (Pending)."""
@@ -87,30 +230,18 @@ class PresetResolver:
         parts = full_path.split('/')
         parts = [p for p in parts if p]
 
-        master_id = self.project.workspace.get('masterEventFolder')
-        current_parent = master_id
-        
-        # Get all folders (including those just created in previous loop iterations)
-        # Note: We re-fetch inside loop or update local cache?
-        # get_all_event_folders returns a copy, so we need to be careful.
-        # However, create_event_folder updates the pending manager immediately.
+        folders = self._folder_index()
+        current_parent = self.project.workspace.get('masterEventFolder')
 
         for part in parts:
-            # Re-fetch all folders to include just-created ones
-            all_folders = self.project.get_all_event_folders()
-            
-            # Find child with this name
-            child_id = None
-            for folder_id, folder_data in all_folders.items():
-                if (folder_data.get('parent') == current_parent and
-                    folder_data.get('name') == part):
-                    child_id = folder_id
-                    break
+            # Find child with this name (including folders created by this session)
+            child_id = folders.find_child(current_parent, part)
 
             # Create if not found
             if not child_id:
                 # Use commit=False (Pending)
                 child_id = self.project.create_event_folder(part, current_parent, commit=False)
+                folders.add(child_id, {'name': part, 'parent': current_parent})
                 print(f"Created pending folder: {part}")
 
             current_parent = child_id
@@ -127,17 +258,17 @@ class PresetResolver:
         bank_id = ref.get('id', '')
         bank_name = ref.get('name', '')
         
-        all_banks = self.project.get_all_banks()
+        banks = self._bank_index()
 
         # Step 1: Try UUID match
-        if bank_id and bank_id in all_banks:
+        if bank_id and bank_id in banks.items:
             return bank_id
 
         # Step 2: Try name match
         if bank_name:
-            for bid, bdata in all_banks.items():
-                if bdata.get('name') == bank_name:
-                    return bid
+            existing_id = banks.find_name(bank_name)
+            if existing_id:
+                return existing_id
 
             # Step 3: Create bank (Pending)
             try:
@@ -145,6 +276,7 @@ class PresetResolver:
                 # Try to create as Bank (not folder) by default for presets?
                 # Usually presets store the Leaf bank.
                 new_id = self.project.create_bank_instance(bank_name, parent_id or None, commit=False)
+                banks.add(new_id, {'name': bank_name, 'parent': parent_id or None, 'type': 'bank'})
                 print(f"Created pending bank: {bank_name}")
                 return new_id
             except Exception as e:
@@ -163,17 +295,17 @@ class PresetResolver:
         bus_id = ref.get('id', '')
         bus_path = ref.get('path', '')
         
-        all_buses = self.project.get_all_buses()
+        buses = self._bus_index()
 
         # Step 1: Try UUID match
-        if bus_id and bus_id in all_buses:
+        if bus_id and bus_id in buses.items:
             return bus_id
 
         # Step 2: Try path match
         if bus_path:
-            for bid in all_buses:
-                if self.get_bus_path(bid) == bus_path:
-                    return bid
+            existing_id = buses.find_path(bus_path)
+            if existing_id:
+                return existing_id
 
             # Step 3: Create bus hierarchy (simplified - just create leaf bus)
             try:
@@ -184,6 +316,7 @@ class PresetResolver:
                 # Check if hierarchy exists? For now, just create at master.
                 # Use commit=False
                 new_id = self.project.create_bus(bus_name, master_bus_id, commit=False)
+                buses.add(new_id, {'name': bus_name, 'parent': master_bus_id})
                 print(f"Created pending bus: {bus_name}")
                 return new_id
             except Exception as e:
@@ -202,17 +335,17 @@ class PresetResolver:
         asset_id = ref.get('id', '')
         asset_path = ref.get('path', '')
         
-        all_assets = self.project.get_all_asset_folders()
+        asset_paths = self._asset_index()
 
         # Step 1: Try UUID match
-        if asset_id and asset_id in all_assets:
+        if asset_id and asset_id in self._asset_folders:
             return asset_id
 
         # Step 2: Try path match
         if asset_path:
-            for aid, adata in all_assets.items():
-                if adata.get('path') == asset_path:
-                    return aid
+            existing_id = asset_paths.get(asset_path)
+            if existing_id:
+                return existing_id
 
             # Step 3: Create asset folder
             try:
@@ -222,6 +355,9 @@ class PresetResolver:
 
                 # Use commit=False
                 new_id = self.project.create_asset_folder(folder_name, parent_path, commit=False)
+                new_path = parent_path + folder_name.replace('\\', '') + '/'
+                self._asset_folders[new_id] = {'path': new_path}
+                asset_paths.setdefault(new_path, new_id)
                 print(f"Created pending asset folder: {folder_name}")
                 return new_id
             except Exception as e:
@@ -237,54 +373,24 @@ class PresetResolver:
         if not self.project or not folder_id:
             return ""
 
-        # Use helper from project that merges both lists
-        all_folders = self.project.get_all_event_folders()
-
-        path_parts = []
-        current_id = folder_id
-        master_id = self.project.workspace.get('masterEventFolder')
-
-        while current_id and current_id in all_folders and current_id != master_id:
-            folder_data = all_folders[current_id]
-            path_parts.insert(0, folder_data.get('name', ''))
-            current_id = folder_data.get('parent')
-
-        return '/'.join(path_parts)
+        return self._folder_index().path(folder_id)
 
     def get_bus_path(self, bus_id: str) -> str:
         """Build full path from bus ID (checking committed and pending)."""
         if not self.project or not bus_id:
             return ""
-            
-        all_buses = self.project.get_all_buses()
-
-        path_parts = []
-        current_id = bus_id
-        master_bus_id = self.project._get_master_bus_id()
-
-        while current_id and current_id in all_buses:
-            bus_data = all_buses[current_id]
-            bus_name = bus_data.get('name', '')
 
-            if current_id == master_bus_id:
-                break
-
-            path_parts.insert(0, bus_name)
-            current_id = bus_data.get('parent')
-
-        return "bus:/" + '/'.join(path_parts)
+        return self._bus_index().path(bus_id)
 
     def get_bank_name_and_parent(self, bank_id: str) -> Tuple[str, str]:
         """Get bank name and parent ID."""
         if not self.project or not bank_id:
             return ("", "")
-            
-        all_banks = self.project.get_all_banks()
-        
-        if bank_id not in all_banks:
+
+        bank_data = self._bank_index().items.get(bank_id)
+        if bank_data is None:
             return ("", "")
 
-        bank_data = all_banks[bank_id]
         return (bank_data.get('name', ''), bank_data.get('parent', ''))
 
     def get_bank_path(self, bank_id: str) -> str:
@@ -292,25 +398,12 @@ class PresetResolver:
         if not self.project or not bank_id:
             return ""
 
-        all_banks = self.project.get_all_banks()
-        if bank_id not in all_banks:
+        banks = self._bank_index()
+        if bank_id not in banks.items:
             return ""
 
-        path_parts = []
-        current_id = bank_id
-        master_bank_id = self.project.workspace.get('masterBankFolder')
-
-        while current_id and current_id in all_banks:
-            bank_data = all_banks[current_id]
-            bank_name = bank_data.get('name', '')
-
-            if current_id == master_bank_id:
-                break
-
-            path_parts.insert(0, bank_name)
-            current_id = bank_data.get('parent')
-
+        path_parts = banks.path_parts(bank_id)
         if not path_parts:
-            return all_banks[bank_id].get('name', '')
+            return banks.items[bank_id].get('name', '')
 
-        return '/'.join(path_parts)
+        return banks.format_path(path_parts)
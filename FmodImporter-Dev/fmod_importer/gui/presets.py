@@ -52,7 +52,8 @@ class PresetsMixin:
         categories = []
 
         for item in presets_dir.iterdir():
-            if item.is_dir():
+            # Hidden folders hold caches (e.g., compiled action vocabularies)
+            if item.is_dir() and not item.name.startswith('.'):
                 categories.append(item.name)
 
         return sorted(categories)
@@ -107,7 +108,7 @@ class PresetsMixin:
 
         # Scan all category folders
         for category_dir in presets_dir.iterdir():
-            if not category_dir.is_dir():
+            if not category_dir.is_dir() or category_dir.name.startswith('.'):
                 continue
 
             category_name = category_dir.name
@@ -515,13 +516,7 @@ class PresetsMixin:
                     resolved_id = resolver.resolve_folder_reference(template_ref)
                     if resolved_id and hasattr(self, 'template_var'):
                         # Check both committed and pending folders
-                        folder_data = self.project.event_folders.get(resolved_id)
-                        if not folder_data and hasattr(self.project, '_pending_event_folders'):
-                            folder_data = self.project._pending_event_folders.get(resolved_id)
-                        # Also check the pending manager directly via project methods if needed
-                        if not folder_data:
-                             all_folders = self.project.get_all_event_folders()
-                             folder_data = all_folders.get(resolved_id)
+                        folder_data = resolver.get_folder_data(resolved_id)
 
                         if folder_data:
                             # Calculate and display full path
@@ -538,8 +533,7 @@ class PresetsMixin:
                 if dest_ref.get('id') or dest_ref.get('path'):
                     resolved_id = resolver.resolve_folder_reference(dest_ref)
                     if resolved_id and hasattr(self, 'dest_var'):
-                        all_folders = self.project.get_all_event_folders()
-                        folder_data = all_folders.get(resolved_id)
+                        folder_data = resolver.get_folder_data(resolved_id)
 
                         if folder_data:
                             # Calculate and display full path
@@ -558,9 +552,7 @@ class PresetsMixin:
                     if resolved_id and hasattr(self, 'bank_var'):
                         # Calculate and display full path
                         bank_path = resolver.get_bank_path(resolved_id)
-                        # Need to get name from all_banks
-                        all_banks = self.project.get_all_banks()
-                        bank_data = all_banks.get(resolved_id, {})
+                        bank_data = resolver.get_bank_data(resolved_id) or {}
                         bank_name = bank_data.get('name', '')
                         
                         self.bank_var.set(bank_path if bank_path else bank_name)
@@ -577,8 +569,7 @@ class PresetsMixin:
                         # Calculate and display full path
                         bus_path = resolver.get_bus_path(resolved_id)
                         
-                        all_buses = self.project.get_all_buses()
-                        bus_data = all_buses.get(resolved_id, {})
+                        bus_data = resolver.get_bus_data(resolved_id) or {}
                         bus_name = bus_data.get('name', '')
                         
                         self.bus_var.set(bus_path if bus_path else bus_name)
@@ -592,8 +583,7 @@ class PresetsMixin:
                 if asset_ref.get('id') or asset_ref.get('path'):
                     resolved_id = resolver.resolve_asset_folder_reference(asset_ref)
                     if resolved_id and hasattr(self, 'asset_var'):
-                        all_assets = self.project.get_all_asset_folders()
-                        asset_data = all_assets.get(resolved_id, {})
+                        asset_data = resolver.get_asset_folder_data(resolved_id) or {}
                         asset_path = asset_data.get('path', '')
                         self.asset_var.set(asset_path)
                         self.selected_asset_id = resolved_id
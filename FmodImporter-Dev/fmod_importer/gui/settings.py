@@ -11,6 +11,7 @@ from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from .themes import ThemeManager
+from ..core.asset_placement import PLACEMENT_STRATEGIES
 
 
 class SettingsMixin:
@@ -96,7 +97,11 @@ class SettingsMixin:
             try:
                 with open(settings_file, 'r') as f:
                     settings = json.load(f)
-                    return settings
+                placement = settings.get('asset_placement', 'copy')
+                if placement not in PLACEMENT_STRATEGIES:
+                    print(f"Warning: Unknown asset placement '{placement}' in settings, using 'copy'")
+                    settings['asset_placement'] = 'copy'
+                return settings
             except Exception as e:
                 print(f"Failed to load settings: {e}")
         return {
@@ -110,7 +115,8 @@ class SettingsMixin:
             'default_event_pattern': '$prefix$feature$action',
             'default_asset_pattern': '',
             'default_event_separator': '',
-            'default_asset_separator': ''
+            'default_asset_separator': '',
+            'asset_placement': 'copy'
         }
 
     def _set_window_redraw(self, enabled: bool):
@@ -146,7 +152,7 @@ class SettingsMixin:
         """Open settings dialog"""
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Settings")
-        settings_window.geometry("600x630")
+        settings_window.geometry("600x670")
         settings_window.transient(self.root)
         settings_window.grab_set()
         self._center_dialog(settings_window)
@@ -423,6 +429,13 @@ class SettingsMixin:
 
         ttk.Button(import_setup_frame, text="Select...", command=browse_bus).grid(row=2, column=2, padx=5)
 
+        # Asset placement strategy (falls back to copy when unsupported)
+        ttk.Label(import_setup_frame, text="Asset Placement:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        placement_combo = ttk.Combobox(import_setup_frame, values=list(PLACEMENT_STRATEGIES),
+                                       state="readonly", width=15)
+        placement_combo.set(current_settings.get('asset_placement', 'copy'))
+        placement_combo.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+
         import_setup_frame.columnconfigure(1, weight=1)
 
         # Save button
@@ -439,7 +452,8 @@ class SettingsMixin:
                 'default_event_pattern': event_pattern_entry.get(),
                 'default_asset_pattern': asset_pattern_entry.get() if asset_pattern_entry.get() != "(Optional)" else '',
                 'default_event_separator': event_sep_entry.get(),
-                'default_asset_separator': asset_sep_entry.get()
+                'default_asset_separator': asset_sep_entry.get(),
+                'asset_placement': placement_combo.get()
             }
             if self.save_settings(new_settings):
                 # Apply theme immediately
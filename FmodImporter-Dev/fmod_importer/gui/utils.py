@@ -283,12 +283,11 @@ class UtilsMixin:
         action_groups = {}  # {action: [file1, file2, ...]}
         failed_files = []
 
-        for media_file in selected_media:
-            basename = Path(media_file).stem
-
-            # Parse the asset to extract the action
-            parsed = parse_pattern.parse_asset_fuzzy(basename, user_values)
+        # Parse the assets to extract the actions
+        parsed_files = parse_pattern.parse_many([Path(media_file).stem for media_file in selected_media],
+                                                user_values)
 
+        for media_file, parsed in zip(selected_media, parsed_files):
             if parsed and 'action' in parsed:
                 action = parsed['action']
                 if action not in action_groups:
@@ -535,6 +534,8 @@ class ProgressDialog:
     """
     Modal progress dialog with indeterminate progress bar.
 
+    The bar switches to determinate mode once update_progress() is called.
+
     Displays an animated progress bar while a long-running operation
     executes in a background thread. Prevents UI freeze by keeping
     the dialog responsive.
@@ -589,9 +590,18 @@ class ProgressDialog:
             mode='indeterminate',
             length=350
         )
-        self.progress.pack(padx=20, pady=(0, 20))
+        self.progress.pack(padx=20, pady=(0, 5))
         self.progress.start(10)  # Animation speed (ms)
 
+        # Detail line (e.g., copy throughput and ETA), empty until used
+        self.detail_label = tk.Label(
+            self.dialog,
+            text="",
+            justify=tk.LEFT,
+            padx=20
+        )
+        self.detail_label.pack(pady=(0, 15))
+
         # Center dialog relative to parent window
         self._center_on_parent(parent)
 
@@ -641,6 +651,23 @@ class ProgressDialog:
         self.message_label.config(text=message)
         self.dialog.update_idletasks()
 
+    def update_progress(self, fraction: float, detail: str = ""):
+        """
+        Switch to a determinate bar and show progress with a detail line.
+
+        IMPORTANT: Must be called from the main tkinter thread only.
+
+        Args:
+            fraction: Completed fraction between 0.0 and 1.0
+            detail: Text shown under the bar (e.g., "12.5 MB/s - ETA 0:42")
+        """
+        if str(self.progress.cget('mode')) != 'determinate':
+            self.progress.stop()
+            self.progress.config(mode='determinate', maximum=100)
+        self.progress['value'] = max(0.0, min(1.0, fraction)) * 100
+        self.detail_label.config(text=detail)
+        self.dialog.update_idletasks()
+
     def close(self):
         """
         Close and destroy the progress dialog.
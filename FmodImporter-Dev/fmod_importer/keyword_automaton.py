@@ -0,0 +1,158 @@
+"""
+Keyword Automaton Module
+Aho-Corasick multi-keyword search, used to find action keywords in names.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List
+
+
+class KeywordAutomaton:
+    """
+    Finds occurrences of many keywords in a text in a single pass.
+
+    Keywords are compiled into an Aho-Corasick automaton (a trie with failure
+    links), so searching costs O(len(text) + occurrences) whatever the number
+    of keywords. Keywords keep the order they were added in; that index is
+    their priority.
+
+    Example:
+        automaton = KeywordAutomaton(['stunloop', 'stun', 'loop'])
+        automaton.last_occurrences('bossstunloop')
+        # -> {0: 4, 1: 4, 2: 8}
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        """
+        Args:
+            keywords: Keywords in priority order (duplicates are ignored)
+        """
+        self.keywords: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._compiled = False
+        self.add(*keywords)
+
+    def add(self, *keywords: str):
+        """
+        Add keywords after the existing ones (lowest priority).
+
+        The automaton is recompiled on the next search.
+
+        Raises:
+            ValueError: If a keyword is empty
+        """
+        for keyword in keywords:
+            if not keyword:
+                raise ValueError("Keywords must not be empty")
+            if keyword not in self._index:
+                self._index[keyword] = len(self.keywords)
+                self.keywords.append(keyword)
+                self._compiled = False
+
+    def _compile(self):
+        """Build the trie, failure links and merged outputs."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Breadth-first: a state's failure link is the longest proper suffix
+        # of its path that is also a trie path; outputs include the link's.
+        # Depth-1 states fail to the root, which the queue starts from.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[next_state] = goto[link].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(output) for output in outputs]
+        self._compiled = True
+
+    def last_occurrences(self, text: str) -> Dict[int, int]:
+        """
+        Find the last occurrence of every keyword in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Dict mapping keyword index to the start position of its last
+            occurrence (same as text.rfind(keyword)), for keywords that occur
+        """
+        if not self._compiled:
+            self._compile()
+        goto, fail, outputs, keywords = self._goto, self._fail, self._outputs, self.keywords
+
+        found: Dict[int, int] = {}
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in outputs[state]:
+                found[index] = end - len(keywords[index])
+        return found
+
+    def to_dict(self) -> Dict:
+        """
+        Get the compiled automaton as JSON-serializable data.
+
+        Returns:
+            Dict with 'keywords', 'goto', 'fail' and 'outputs'
+        """
+        if not self._compiled:
+            self._compile()
+        return {
+            'keywords': self.keywords,
+            'goto': self._goto,
+            'fail': self._fail,
+            'outputs': [list(output) for output in self._outputs]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'KeywordAutomaton':
+        """
+        Restore an automaton saved with to_dict() without recompiling it.
+
+        Args:
+            data: Dict returned by to_dict()
+
+        Returns:
+            The compiled automaton
+
+        Raises:
+            ValueError: If the data is inconsistent
+        """
+        automaton = cls(data['keywords'])
+        goto, fail, outputs = data['goto'], data['fail'], data['outputs']
+        if not (len(goto) == len(fail) == len(outputs)) or not goto:
+            raise ValueError("Inconsistent compiled keyword automaton")
+        automaton._goto = goto
+        automaton._fail = fail
+        automaton._outputs = [tuple(output) for output in outputs]
+        automaton._compiled = True
+        return automaton
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self._index
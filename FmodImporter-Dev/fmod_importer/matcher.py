@@ -4,13 +4,43 @@ Handles intelligent matching between audio files and event templates.
 """
 
 import os
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+from typing import Iterable, List, Dict, Optional, Tuple, TYPE_CHECKING
+
+from .media_scanner import scan_audio_files
+from .similarity import EditDistanceScorer, SimilarityScorer, normalize_suffix, suffix_similarity
 
 if TYPE_CHECKING:
     from .naming import NamingPattern
 
 
+class SuffixIndex:
+    """Finds the first name (in insertion order) whose key ends with a given suffix.
+
+    One lookup table is built per suffix length on first use, so a lookup is a
+    slice-free dict probe instead of an endswith() scan over every name.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            items: (key, name) pairs in priority order, e.g. (normalized name, name)
+        """
+        self._items = list(items)
+        self._tables: Dict[int, Dict[str, str]] = {}
+
+    def first_ending_with(self, suffix: str) -> Optional[str]:
+        """Return the first name whose key ends with suffix (None if there is none)"""
+        length = len(suffix)
+        table = self._tables.get(length)
+        if table is None:
+            table = {}
+            for key, name in self._items:
+                if len(key) >= length:
+                    table.setdefault(key[len(key) - length:], name)
+            self._tables[length] = table
+        return table.get(suffix)
+
+
 class AudioMatcher:
     """Handles intelligent matching between audio files and event templates"""
 
@@ -24,7 +54,7 @@ class AudioMatcher:
             "Strong_Repair" -> "strongrepair"
             "StrongRepair" -> "strongrepair"
         """
-        return s.replace('_', '').replace('-', '').replace(' ', '').lower()
+        return normalize_suffix(s)
 
     @staticmethod
     def get_feature_variants(feature: str) -> List[str]:
@@ -71,46 +101,16 @@ class AudioMatcher:
 
     @staticmethod
     def calculate_similarity(str1: str, str2: str) -> float:
-        """Calculate similarity score between two strings (0.0 to 1.0)"""
-        # Exact match (case sensitive)
-        if str1 == str2:
-            return 1.0
-
-        # Normalized comparison (no underscores, lowercase)
-        norm1 = AudioMatcher.normalize_string(str1)
-        norm2 = AudioMatcher.normalize_string(str2)
-
-        if norm1 == norm2:
-            return 0.95  # High confidence for normalized match (e.g., "Attack_A" == "AttackA")
-
-        # Check if one contains the other
-        if norm1 in norm2:
-            # norm1 is contained in norm2
-            # Special case: if norm2 is just norm1 + single character, likely a variant (e.g., "attack" vs "attacka")
-            if len(norm2) - len(norm1) <= 1:
-                return 0.92  # High confidence for single character difference
-            return min(len(norm1), len(norm2)) / max(len(norm1), len(norm2)) * 0.9
-        elif norm2 in norm1:
-            # norm2 is contained in norm1
-            if len(norm1) - len(norm2) <= 1:
-                return 0.92  # High confidence for single character difference
-            return min(len(norm1), len(norm2)) / max(len(norm1), len(norm2)) * 0.9
-
-        # Levenshtein-like simple ratio
-        max_len = max(len(norm1), len(norm2))
-        if max_len == 0:
-            return 0.0
-
-        # Simple character overlap ratio
-        set1 = set(norm1)
-        set2 = set(norm2)
-        overlap = len(set1 & set2)
-        total = len(set1 | set2)
-
-        return (overlap / total) * 0.7 if total > 0 else 0.0  # 70% max for character overlap
+        """Calculate similarity score between two strings (0.0 to 1.0)
+
+        Exact match 1.0, normalized match 0.95, single extra character 0.92,
+        containment or Damerau-Levenshtein ratio below 0.9 (see suffix_similarity)
+        """
+        return suffix_similarity(str1, str2)
 
     @staticmethod
-    def extract_suffix_from_basename(basename: str, prefix: str, feature: str) -> Optional[str]:
+    def extract_suffix_from_basename(basename: str, prefix: str, feature: str,
+                                     feature_variants: Optional[List[str]] = None) -> Optional[str]:
         """Extract the event suffix from an audio file basename
 
         Tries multiple strategies to extract the suffix:
@@ -123,11 +123,13 @@ class AudioMatcher:
             prefix: Event prefix (e.g., "Mechaflora")
             feature: Feature name - can have spaces, underscores, or be concatenated
                      (e.g., "Strong Repair", "Strong_Repair", "StrongRepair")
+            feature_variants: Precomputed get_feature_variants(feature), if available
 
         Returns the suffix or None if no match found
         """
         # Get all possible variants of the feature name
-        feature_variants = AudioMatcher.get_feature_variants(feature)
+        if feature_variants is None:
+            feature_variants = AudioMatcher.get_feature_variants(feature)
 
         # Strategy 1: Try exact match with each variant
         for variant in feature_variants:
@@ -212,44 +214,10 @@ class AudioMatcher:
 
     @staticmethod
     def collect_audio_files(directory: str, recursive: bool = False) -> List[Dict]:
-        """Collect all audio files from directory"""
-        audio_extensions = {'.wav', '.mp3', '.ogg', '.flac', '.aif', '.aiff'}
+        """Collect all audio files from directory (see media_scanner.scan_audio_files)"""
         files = []
-
-        if recursive:
-            # Recursive scan using os.walk
-            for root, _, filenames in os.walk(directory):
-                for filename in filenames:
-                    ext = Path(filename).suffix.lower()
-                    if ext in audio_extensions:
-                        full_path = Path(root) / filename
-                        base_name = Path(filename).stem
-
-                        files.append({
-                            'path': str(full_path),
-                            'filename': filename,
-                            'basename': base_name
-                        })
-        else:
-            # Non-recursive scan using os.scandir (top-level only)
-            if os.path.exists(directory):
-                try:
-                    with os.scandir(directory) as entries:
-                        for entry in entries:
-                            if entry.is_file():
-                                ext = Path(entry.name).suffix.lower()
-                                if ext in audio_extensions:
-                                    full_path = Path(entry.path)
-                                    base_name = Path(entry.name).stem
-
-                                    files.append({
-                                        'path': str(full_path),
-                                        'filename': entry.name,
-                                        'basename': base_name
-                                    })
-                except OSError as e:
-                    print(f"Error scanning directory {directory}: {e}")
-
+        for batch in scan_audio_files(directory, recursive=recursive):
+            files.extend(batch)
         return files
 
     @staticmethod
@@ -262,9 +230,66 @@ class AudioMatcher:
         normalized_feature = feature.replace(' ', '_')
         return f"{prefix}_{normalized_feature}_{suffix}"
 
+    @staticmethod
+    def extract_suffix_from_event_name(event_name: str, prefix: str, feature: str,
+                                       feature_variants: Optional[List[str]] = None) -> Optional[str]:
+        """Extract the suffix of an expected event name (Prefix_Feature_Suffix)
+
+        Args:
+            event_name: Expected event name (e.g., "Mechaflora_Strong_Repair_Attack")
+            prefix: Event prefix (e.g., "Mechaflora")
+            feature: Feature name, in any separator style
+            feature_variants: Precomputed get_feature_variants(feature), if available
+
+        Returns the suffix or None if the name does not start with prefix and feature
+        (an empty suffix at one step lets the next strategy try)
+        """
+        if feature_variants is None:
+            feature_variants = AudioMatcher.get_feature_variants(feature)
+
+        # Try exact pattern with each variant first
+        for variant in feature_variants:
+            exact_pattern = f"{prefix}_{variant}_"
+            if event_name.startswith(exact_pattern):
+                event_suffix = event_name[len(exact_pattern):]
+                if event_suffix:
+                    return event_suffix
+                break
+
+        # Try partial feature matching
+        prefix_pattern = f"{prefix}_"
+        if not event_name.startswith(prefix_pattern):
+            return None
+        after_prefix = event_name[len(prefix_pattern):]
+
+        # Try each variant
+        for variant in feature_variants:
+            # Split variant into parts
+            variant_parts = variant.replace(' ', '_').split('_')
+            for i in range(len(variant_parts), 0, -1):
+                partial_variant = '_'.join(variant_parts[:i]) + '_'
+                if after_prefix.startswith(partial_variant):
+                    event_suffix = after_prefix[len(partial_variant):]
+                    if event_suffix:
+                        return event_suffix
+                    break
+
+        # If still no match, try normalized matching
+        norm_feature = AudioMatcher.normalize_string(feature)
+        parts = after_prefix.split('_')
+
+        # Try different split points
+        for split_idx in range(1, len(parts)):
+            potential_feature_part = '_'.join(parts[:split_idx])
+            if AudioMatcher.normalize_string(potential_feature_part) == norm_feature:
+                return '_'.join(parts[split_idx:]) or None
+
+        return None
+
     @staticmethod
     def match_files_to_events(audio_files: List[Dict], prefix: str, feature: str,
-                              expected_events: Optional[Dict[str, Dict]] = None) -> Dict[str, List[Dict]]:
+                              expected_events: Optional[Dict[str, Dict]] = None,
+                              scorer: Optional[SimilarityScorer] = None) -> Dict[str, List[Dict]]:
         """Group audio files by their base names to create events with intelligent matching
 
         Args:
@@ -272,84 +297,26 @@ class AudioMatcher:
             prefix: Event prefix (e.g., 'Mechaflora')
             feature: Feature name (e.g., 'Weak_Ranged')
             expected_events: Optional dict of expected event names to match against
+            scorer: Similarity scorer for files without an exact match (EditDistanceScorer by default)
 
         Returns:
             Dictionary mapping event names to their audio files with confidence scores
             Example: {'Mechaflora_Weak_Ranged_Attack': {'files': [file1, file2], 'confidence': 1.0}}
         """
         groups = {}
+        session = MatchSession(prefix, feature, expected_events, scorer)
 
         # If we have expected events, try to match each file to an event
         if expected_events:
             matched_files = set()
 
             for file in audio_files:
-                basename = file['basename']
-                best_match = None
-                best_score = 0.0
-                best_suffix = None
-
                 # Extract suffix from the file
-                extracted_suffix = AudioMatcher.extract_suffix_from_basename(basename, prefix, feature)
-
-                if extracted_suffix:
-                    # Try to match against expected events
-                    for event_name in expected_events.keys():
-                        # Extract the suffix from the expected event name
-                        # Expected format: Prefix_Feature_Suffix
-                        # Need to remove Prefix_Feature_ to get the suffix
-
-                        # Get all possible variants of the feature name
-                        feature_variants = AudioMatcher.get_feature_variants(feature)
-                        event_suffix = None
-
-                        # Try exact pattern with each variant first
-                        for variant in feature_variants:
-                            exact_pattern = f"{prefix}_{variant}_"
-                            if event_name.startswith(exact_pattern):
-                                event_suffix = event_name[len(exact_pattern):]
-                                break
-
-                        if not event_suffix:
-                            # Try partial feature matching
-                            prefix_pattern = f"{prefix}_"
-                            if event_name.startswith(prefix_pattern):
-                                after_prefix = event_name[len(prefix_pattern):]
-
-                                # Try each variant
-                                for variant in feature_variants:
-                                    # Split variant into parts
-                                    variant_parts = variant.replace(' ', '_').split('_')
-                                    for i in range(len(variant_parts), 0, -1):
-                                        partial_variant = '_'.join(variant_parts[:i]) + '_'
-                                        if after_prefix.startswith(partial_variant):
-                                            event_suffix = after_prefix[len(partial_variant):]
-                                            break
-                                    if event_suffix:
-                                        break
-
-                                # If still no match, try normalized matching
-                                if not event_suffix:
-                                    norm_feature = AudioMatcher.normalize_string(feature)
-                                    parts = after_prefix.split('_')
-
-                                    # Try different split points
-                                    for split_idx in range(1, len(parts)):
-                                        potential_feature_part = '_'.join(parts[:split_idx])
-                                        norm_potential = AudioMatcher.normalize_string(potential_feature_part)
-
-                                        if norm_potential == norm_feature:
-                                            event_suffix = '_'.join(parts[split_idx:])
-                                            break
-
-                        if event_suffix:
-                            # Calculate similarity between suffixes
-                            score = AudioMatcher.calculate_similarity(extracted_suffix, event_suffix)
-
-                            if score > best_score and score >= 0.7:  # Minimum 70% confidence
-                                best_score = score
-                                best_match = event_name
-                                best_suffix = event_suffix
+                extracted_suffix = session.extract_suffix(file['basename'])
+                if not extracted_suffix:
+                    continue
+
+                best_match, best_score = session.best_match(extracted_suffix)
 
                 # If we found a good match, assign it
                 if best_match:
@@ -366,8 +333,7 @@ class AudioMatcher:
             if expected_events and file['filename'] in matched_files:
                 continue  # Already matched
 
-            basename = file['basename']
-            extracted_suffix = AudioMatcher.extract_suffix_from_basename(basename, prefix, feature)
+            extracted_suffix = session.extract_suffix(file['basename'])
 
             if extracted_suffix:
                 # Normalize feature name for event creation (replace spaces with underscores)
@@ -414,23 +380,23 @@ class AudioMatcher:
 
         # Store templates for generic matching
         # We'll match by checking if template name ends with the file's action (normalized)
-        template_names = list(expected_events.keys()) if expected_events else []
         expected_normalized = {}  # For fuzzy matching by normalized event name
+        template_suffixes = None  # Normalized template name suffix -> first template
 
         if expected_events:
-            for exp_name in expected_events.keys():
+            normalized_names = [(normalize_for_matching(exp_name), exp_name)
+                                for exp_name in expected_events.keys()]
+            for norm_name, exp_name in normalized_names:
                 # Store normalized version for fuzzy matching
-                norm_name = normalize_for_matching(exp_name)
                 expected_normalized[norm_name] = exp_name
+            template_suffixes = SuffixIndex(normalized_names)
 
-        for file in audio_files:
-            basename = file['basename']
-
-            # Parse the asset file using fuzzy action extraction
-            # This extracts action first (like "Alert"), then deduces feature as everything between prefix and action
-            # Allows matching even if user enters "StrongRepair" but file has "Strong_Repair"
-            parsed = parse_pattern.parse_asset_fuzzy(basename, user_values)
+        # Parse all asset files using fuzzy action extraction
+        # This extracts action first (like "Alert"), then deduces feature as everything between prefix and action
+        # Allows matching even if user enters "StrongRepair" but file has "Strong_Repair"
+        parsed_files = parse_pattern.parse_many([file['basename'] for file in audio_files], user_values)
 
+        for file, parsed in zip(audio_files, parsed_files):
             if not parsed:
                 unmatched.append(file)
                 continue
@@ -460,18 +426,16 @@ class AudioMatcher:
             # This handles cases like:
             # - File action: "Stun_Loop" (normalized: "stunloop")
             # - Template: "PrefixFeatureNameStunLoop" (normalized ends with "stunloop")
-            if not from_template and template_names and 'action' in parsed:
+            if not from_template and template_suffixes is not None and 'action' in parsed:
                 file_action = parsed.get('action', '')
                 file_action_normalized = normalize_for_matching(file_action)
 
-                for template_name in template_names:
-                    template_normalized = normalize_for_matching(template_name)
-                    # Check if template ends with the file's action (normalized)
-                    if template_normalized.endswith(file_action_normalized):
-                        matched_template_name = template_name
-                        from_template = True
-                        confidence = 0.92  # Good confidence for suffix match
-                        break
+                # First template (in order) whose normalized name ends with the action
+                template_name = template_suffixes.first_ending_with(file_action_normalized)
+                if template_name is not None:
+                    matched_template_name = template_name
+                    from_template = True
+                    confidence = 0.92  # Good confidence for suffix match
 
             # Always use constructed event_name with user's prefix/feature
             # The template is only for matching and copying properties, never for naming
@@ -492,3 +456,104 @@ class AudioMatcher:
                 groups[final_event_name]['confidence'] = (current_conf + confidence) / 2
 
         return groups, unmatched
+
+
+class MatchSession:
+    """Expected-event suffixes of one match_files_to_events call, computed once.
+
+    Feature variants and event suffixes do not depend on the file being
+    matched, so they are derived once and indexed by exact and normalized
+    suffix. Most files then resolve with a dict lookup; only files without an
+    exact, normalized or one-character match go through the scorer's batch
+    match against every event suffix.
+    """
+
+    MIN_SCORE = 0.7  # Minimum similarity for a match
+
+    def __init__(self, prefix: str, feature: str, expected_events: Optional[Dict[str, Dict]] = None,
+                 scorer: Optional[SimilarityScorer] = None):
+        """
+        Args:
+            prefix: Event prefix (e.g., 'Mechaflora')
+            feature: Feature name (e.g., 'Weak_Ranged')
+            expected_events: Optional dict of expected event names to match against
+            scorer: Similarity scorer (EditDistanceScorer by default)
+        """
+        self.prefix = prefix
+        self.feature = feature
+        self.scorer = scorer if scorer is not None else EditDistanceScorer()
+        self.feature_variants = AudioMatcher.get_feature_variants(feature)
+
+        # (event name, suffix) in expected_events order, for events with a suffix
+        self.event_suffixes: List[Tuple[str, str]] = []
+        for event_name in (expected_events or {}):
+            event_suffix = AudioMatcher.extract_suffix_from_event_name(
+                event_name, prefix, feature, self.feature_variants
+            )
+            if event_suffix:
+                self.event_suffixes.append((event_name, event_suffix))
+        self._suffixes = [event_suffix for _, event_suffix in self.event_suffixes]
+
+        # First event position per exact suffix (score 1.0), per normalized
+        # suffix (0.95) and per normalized suffix minus its first or last
+        # character (0.92 when the file's suffix is contained in it)
+        self._exact: Dict[str, int] = {}
+        self._normalized: Dict[str, int] = {}
+        self._trimmed: Dict[str, int] = {}
+        for position, (_, event_suffix) in enumerate(self.event_suffixes):
+            norm = AudioMatcher.normalize_string(event_suffix)
+            self._exact.setdefault(event_suffix, position)
+            self._normalized.setdefault(norm, position)
+            if norm:
+                self._trimmed.setdefault(norm[1:], position)
+                self._trimmed.setdefault(norm[:-1], position)
+
+    def extract_suffix(self, basename: str) -> Optional[str]:
+        """Extract the event suffix of an audio file basename (see extract_suffix_from_basename)"""
+        return AudioMatcher.extract_suffix_from_basename(
+            basename, self.prefix, self.feature, self.feature_variants
+        )
+
+    def _best_by_similarity(self, extracted_suffix: str) -> Tuple[Optional[str], float]:
+        position, score = self.scorer.best_match(extracted_suffix, self._suffixes, self.MIN_SCORE)
+        if position is None:
+            return None, 0.0
+        return self.event_suffixes[position][0], score
+
+    def best_match(self, extracted_suffix: str) -> Tuple[Optional[str], float]:
+        """
+        Find the expected event whose suffix is most similar to a file's suffix.
+
+        Returns the same event as scoring every expected event with the scorer
+        and keeping the first highest score (>= 0.7).
+
+        Args:
+            extracted_suffix: Suffix extracted from the file name
+
+        Returns:
+            Tuple of (event name or None, similarity score)
+        """
+        if not self.event_suffixes:
+            return None, 0.0
+        if not self.scorer.tiered:
+            return self._best_by_similarity(extracted_suffix)
+
+        position = self._exact.get(extracted_suffix)
+        if position is not None:
+            return self.event_suffixes[position][0], 1.0
+
+        norm = AudioMatcher.normalize_string(extracted_suffix)
+        position = self._normalized.get(norm)
+        if position is not None:
+            return self.event_suffixes[position][0], 0.95
+
+        # One character longer or shorter, with one suffix containing the other
+        candidates = [self._trimmed.get(norm)]
+        if norm:
+            candidates += [self._normalized.get(norm[1:]), self._normalized.get(norm[:-1])]
+        candidates = [c for c in candidates if c is not None]
+        if candidates:
+            return self.event_suffixes[min(candidates)][0], 0.92
+
+        return self._best_by_similarity(extracted_suffix)
+
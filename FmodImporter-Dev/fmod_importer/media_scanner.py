@@ -0,0 +1,334 @@
+"""
+Media Scanner Module
+Parallel, streaming discovery of audio files in a media directory, with an
+optional persistent cache for incremental re-scans.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .core.metadata_cache import project_cache_path
+
+AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.ogg', '.flac', '.aif', '.aiff'})
+
+# Bump whenever the media scan cache layout changes
+MEDIA_CACHE_VERSION = 1
+
+
+def _split_extension(name: str) -> Tuple[str, str]:
+    """Split a filename into (stem, lowercase extension) like Path.stem/suffix."""
+    dot = name.rfind('.')
+    if dot <= 0 or dot == len(name) - 1:
+        return name, ''
+    return name[:dot], name[dot:].lower()
+
+
+def _join(directory: str, name: str) -> str:
+    return name if directory == '.' else os.path.join(directory, name)
+
+
+def _scan_one(directory: str, recursive: bool, extensions) -> Tuple[List[str], List[Dict]]:
+    """
+    List one directory.
+
+    Returns:
+        Tuple of (subdirectories to descend into, audio file dicts)
+    """
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if recursive:
+                        # Same rules as os.walk: symlinked directories are listed, not followed
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(_join(directory, name))
+                            continue
+                    elif not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                stem, ext = _split_extension(name)
+                if ext in extensions:
+                    files.append({
+                        'path': _join(directory, name),
+                        'filename': name,
+                        'basename': stem
+                    })
+    except OSError as e:
+        if not recursive:
+            print(f"Error scanning directory {directory}: {e}")
+    return subdirs, files
+
+
+def _walk(root: str, lister: Callable[[str], Tuple[List[str], List[Dict]]],
+          workers: int, batch_size: int) -> Iterator[List[Dict]]:
+    """
+    Run a directory lister over a tree on a thread pool, yielding files in walk order.
+
+    Args:
+        root: Top directory
+        lister: Callable returning (subdirectories, file dicts) for one directory
+        workers: Number of threads listing directories
+        batch_size: Maximum number of files per batch
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        pending = {executor.submit(lister, root): root}
+        listed = {}  # Directory -> (subdirs, files), finished but not yet emitted
+        to_emit = [root]  # Stack of directories in walk order
+        batch = []
+
+        while to_emit:
+            # Emit every directory whose turn has come and whose listing is done
+            while to_emit and to_emit[-1] in listed:
+                subdirs, files = listed.pop(to_emit.pop())
+                to_emit.extend(reversed(subdirs))
+                for file_info in files:
+                    batch.append(file_info)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+            if not to_emit:
+                break
+
+            # About to block: hand over what we have so consumers can start
+            if batch:
+                yield batch
+                batch = []
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                subdirs, files = future.result()
+                listed[path] = (subdirs, files)
+                for subdir in subdirs:
+                    pending[executor.submit(lister, subdir)] = subdir
+
+        if batch:
+            yield batch
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scan_audio_files(directory: str, recursive: bool = False, workers: int = 8,
+                     batch_size: int = 500,
+                     extensions=AUDIO_EXTENSIONS) -> Iterator[List[Dict]]:
+    """
+    Scan a directory for audio files, yielding them in batches as they are found.
+
+    Subdirectories are listed concurrently on a thread pool (one os.scandir per
+    directory), which hides the per-directory latency of network shares.
+    Files are still yielded in os.walk order (top-down, directory by directory),
+    so the concatenated batches equal a sequential walk.
+
+    Args:
+        directory: Media directory to scan
+        recursive: Whether to descend into subdirectories
+        workers: Number of threads listing directories
+        batch_size: Maximum number of files per batch
+        extensions: Lowercase extensions (with dot) to collect
+
+    Yields:
+        Lists of dicts with 'path', 'filename' and 'basename'
+    """
+    if not os.path.exists(directory):
+        return
+    root = str(Path(directory))
+
+    if not recursive:
+        _, files = _scan_one(root, False, extensions)
+        for start in range(0, len(files), batch_size):
+            yield files[start:start + batch_size]
+        return
+
+    yield from _walk(root, lambda path: _scan_one(path, True, extensions), workers, batch_size)
+
+
+class MediaScanDiff(NamedTuple):
+    """Files that changed since the previous scan (paths as in the file dicts)."""
+    added: List[str]
+    removed: List[str]
+    modified: List[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+class MediaScanCache:
+    """
+    Persistent media directory listing for incremental re-scans.
+
+    Stores each directory's modification time with its subdirectories and
+    audio files. A directory whose mtime did not change is not listed again,
+    so a re-scan of an unchanged library costs one stat per directory.
+    """
+
+    # Directory mtimes this close to the scan time are not trusted (coarse
+    # filesystem timestamps could hide a change made in the same tick)
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, directory: str, recursive: bool = False, cache_file: Optional[Path] = None):
+        """
+        Initialize the cache and load the previous listing from disk.
+
+        Args:
+            directory: Media directory
+            recursive: Whether scans descend into subdirectories
+            cache_file: Path of the JSON cache file (None keeps it in memory only)
+        """
+        self.directory = directory
+        self.recursive = recursive
+        self.cache_file = cache_file
+        self._dirs: Dict[str, Dict] = {}
+        self._listings: Dict[str, Tuple] = {}  # Directory -> (entry, subdirs, files) built from it
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_directory(cls, directory: str, recursive: bool = False) -> 'MediaScanCache':
+        """Get the scan cache of a media directory, stored in the user cache directory."""
+        suffix = "_media_recursive" if recursive else "_media"
+        return cls(directory, recursive, project_cache_path(Path(directory), suffix))
+
+    def _load(self):
+        """Load the cache file, discarding it if missing, corrupt or outdated."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable media scan cache {self.cache_file}: {e}")
+            return
+
+        if data.get('version') == MEDIA_CACHE_VERSION and data.get('root') == str(Path(self.directory)):
+            self._dirs = data.get('dirs', {})
+
+    def _list(self, directory: str, previous: Dict[str, Dict], current: Dict[str, Dict],
+              detect_modified: bool) -> Tuple[List[str], List[Dict]]:
+        """Directory lister for _walk: reuse the cached listing if the mtime is unchanged."""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return [], []
+
+        entry = previous.get(directory)
+        if entry is None or entry['mtime'] != mtime:
+            subdirs, files = _scan_one(directory, self.recursive, AUDIO_EXTENSIONS)
+            records = []
+            for file_info in files:
+                try:
+                    stat = os.stat(file_info['path'])
+                    records.append([file_info['filename'], stat.st_mtime_ns, stat.st_size])
+                except OSError:
+                    records.append([file_info['filename'], None, None])
+            racy = time.time_ns() - mtime < self.RACY_WINDOW_NS
+            entry = {
+                'mtime': None if racy else mtime,
+                'subdirs': [os.path.basename(d) for d in subdirs],
+                'files': records
+            }
+        elif detect_modified:
+            records = []
+            for name, _, _ in entry['files']:
+                try:
+                    stat = os.stat(_join(directory, name))
+                    records.append([name, stat.st_mtime_ns, stat.st_size])
+                except OSError:
+                    records.append([name, None, None])
+            entry = dict(entry, files=records)
+
+        current[directory] = entry
+
+        # Reuse the listing built from this very entry by the previous scan; callers
+        # get copies so mutating a result cannot corrupt the next re-scan
+        listing = self._listings.get(directory)
+        if listing is None or listing[0] is not entry:
+            files = []
+            for name, _, _ in entry['files']:
+                stem, _ = _split_extension(name)
+                files.append({'path': _join(directory, name), 'filename': name, 'basename': stem})
+            listing = (entry, [_join(directory, name) for name in entry['subdirs']], files)
+            self._listings[directory] = listing
+        return list(listing[1]), [dict(file_info) for file_info in listing[2]]
+
+    @staticmethod
+    def _signatures(dirs: Dict[str, Dict]) -> Dict[str, Tuple]:
+        return {
+            _join(directory, name): (mtime, size)
+            for directory, entry in dirs.items()
+            for name, mtime, size in entry['files']
+        }
+
+    def scan(self, detect_modified: bool = False, workers: int = 8,
+             batch_size: int = 500) -> Tuple[List[Dict], MediaScanDiff]:
+        """
+        Scan the media directory, re-listing only directories that changed.
+
+        Args:
+            detect_modified: Also stat files in unchanged directories to detect
+                             modified content (new or re-listed directories are
+                             always checked)
+            workers: Number of threads listing directories
+            batch_size: Batch size of the underlying walk
+
+        Returns:
+            Tuple of (file dicts in os.walk order, diff against the previous scan)
+        """
+        previous = self._dirs
+        current: Dict[str, Dict] = {}
+        files = []
+
+        if os.path.exists(self.directory):
+            root = str(Path(self.directory))
+
+            def lister(path):
+                return self._list(path, previous, current, detect_modified)
+
+            for batch in _walk(root, lister, workers if self.recursive else 1, batch_size):
+                files.extend(batch)
+
+        # Only directories that were re-listed (or disappeared) can contribute to the diff
+        changed = [d for d, entry in current.items() if entry is not previous.get(d)]
+        changed += [d for d in previous if d not in current]
+        old = self._signatures({d: previous[d] for d in changed if d in previous})
+        new = self._signatures({d: current[d] for d in changed if d in current})
+        diff = MediaScanDiff(
+            added=[path for path in new if path not in old],
+            removed=[path for path in old if path not in new],
+            modified=[path for path, sig in new.items() if path in old and old[path] != sig]
+        )
+
+        if changed:
+            self._dirty = True
+        for directory in changed:
+            if directory not in current:
+                self._listings.pop(directory, None)
+        self._dirs = current
+        return files, diff
+
+    def save(self):
+        """Write the cache to disk if anything changed (atomic replace)."""
+        if self.cache_file is None or not self._dirty:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': MEDIA_CACHE_VERSION, 'root': str(Path(self.directory)),
+                           'dirs': self._dirs}, f, separators=(',', ':'))
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: Failed to save media scan cache {self.cache_file}: {e}")
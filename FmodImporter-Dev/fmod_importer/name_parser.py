@@ -0,0 +1,194 @@
+"""
+Name Parser Module
+Batch generic action extraction used by NamingPattern.parse_many().
+
+GenericNameParser holds the per prefix/feature state, so each name only
+costs the per-name work; parse_names() can spread very large lists over a
+process pool.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence
+
+# Below this many names, process start-up costs more than it saves
+PARALLEL_MIN_NAMES = 20000
+
+# Separators between the words of a file name
+NAME_SEPARATORS = re.compile(r'[-_ ]+')
+
+# Pattern to detect iterator at end of filename (_01, _02, _1, _2, etc.)
+ITERATOR_PATTERN = re.compile(r'[_]?\d+$')
+
+
+def normalize_for_comparison(s: str) -> str:
+    """
+    Normalize a string for comparison.
+
+    Removes underscores, spaces, and converts to lowercase.
+    This allows matching between different naming conventions:
+    - "Strong_Repair" -> "strongrepair"
+    - "StrongRepair" -> "strongrepair"
+
+    Args:
+        s: String to normalize
+
+    Returns:
+        Normalized string
+    """
+    return s.replace('_', '').replace(' ', '').lower()
+
+
+class GenericNameParser:
+    """
+    Generic action extraction for one prefix/feature pair.
+
+    Holds everything that only depends on the user's values (lowercased prefix
+    regex, normalized feature), so parsing a name only does the per-name work.
+    Used by NamingPattern.parse_asset_generic() and parse_many().
+    """
+
+    def __init__(self, prefix: str, feature: str, iterator_pattern: re.Pattern):
+        """
+        Args:
+            prefix: Known prefix value
+            feature: Known feature value
+            iterator_pattern: Regex matching the iterator suffix to strip
+        """
+        self.prefix = prefix
+        self.feature = feature
+        self.iterator_pattern = iterator_pattern
+        self.prefix_regex = re.compile(re.escape(prefix.lower()) + '([_-]?)')
+        self.feature_normalized = normalize_for_comparison(feature)
+
+    def _strip_iterator(self, name: str) -> str:
+        """Strip the iterator suffix, without a regex search for the default pattern."""
+        if self.iterator_pattern is not ITERATOR_PATTERN or name.endswith('\n'):
+            return self.iterator_pattern.sub('', name)
+
+        # Same as ITERATOR_PATTERN: trailing decimal digits and one underscore before them
+        end = len(name)
+        while end and name[end - 1].isdecimal():
+            end -= 1
+        if end == len(name):
+            return name
+        if end and name[end - 1] == '_':
+            end -= 1
+        return name[:end]
+
+    def extract_action(self, name: str) -> Optional[str]:
+        """Extract the action of a name (see NamingPattern.extract_action_generic)."""
+        # Strip extension if present
+        if '.' in name:
+            name = os.path.splitext(name)[0]
+
+        # Strip iterator suffix
+        name = self._strip_iterator(name)
+
+        # Remove prefix (with or without separator)
+        prefix_match = self.prefix_regex.match(name.lower())
+        if not prefix_match:
+            return None
+        remaining = name[len(self.prefix) + len(prefix_match.group(1)):]
+
+        if not remaining:
+            return None
+
+        # Strategy 1: Try with separators (file pattern: Strong_Repair_Stun_Loop)
+        parts = [p for p in NAME_SEPARATORS.split(remaining) if p]
+        feature_normalized = self.feature_normalized
+
+        # Try to find where feature ends and action begins. The normalized
+        # candidate is the lowercased concatenation of the leading parts, and
+        # it only grows, so stop once it is longer than the feature.
+        candidate_feature = ''
+        for i, part in enumerate(parts, 1):
+            candidate_feature += part
+            candidate_normalized = candidate_feature.lower()
+            if candidate_normalized == feature_normalized:
+                # Found feature boundary! Action is what remains
+                action_parts = parts[i:]
+                if action_parts:
+                    return '_'.join(action_parts)  # Preserve original separators
+                break
+            if len(candidate_normalized) > len(feature_normalized):
+                break
+
+        # Strategy 2: Try without separators (CamelCase: FeatureNameStunLoop)
+        remaining_normalized = normalize_for_comparison(remaining)
+        if remaining_normalized.startswith(feature_normalized):
+            # Feature found at start of remaining - action is what follows
+            # Need to find the boundary in the original string
+
+            # Count characters consumed by feature in normalized form
+            feature_len = len(feature_normalized)
+
+            # Find where action starts in original 'remaining' string
+            # by tracking normalized character consumption
+            norm_pos = 0
+            orig_pos = 0
+
+            while norm_pos < feature_len and orig_pos < len(remaining):
+                char = remaining[orig_pos]
+                # Skip separators (they're removed in normalization)
+                if char in '_- ':
+                    orig_pos += 1
+                    continue
+                norm_pos += 1
+                orig_pos += 1
+
+            # Action is everything after the feature
+            action = remaining[orig_pos:].lstrip('_- ')
+            if action:
+                return action
+
+        return None
+
+    def parse(self, asset_name: str) -> Optional[Dict[str, str]]:
+        """Parse one asset name (see NamingPattern.parse_asset_generic)."""
+        action = self.extract_action(asset_name)
+        if not action:
+            return None
+
+        return {
+            'prefix': self.prefix,
+            'feature': self.feature,  # Use user's feature for event building
+            'action': action
+        }
+
+    def parse_all(self, asset_names: Sequence[str]) -> List[Optional[Dict[str, str]]]:
+        """Parse a list of asset names."""
+        parse = self.parse
+        return [parse(asset_name) for asset_name in asset_names]
+
+
+def parse_names(parser: GenericNameParser, basenames: Sequence[str],
+                workers: int = 1) -> List[Optional[Dict[str, str]]]:
+    """
+    Parse many asset names with one parser.
+
+    Args:
+        parser: Parser of the user's prefix/feature pair
+        basenames: Asset filenames (with or without extension)
+        workers: Number of processes (1 = serial; lists shorter than
+                 PARALLEL_MIN_NAMES are always parsed serially)
+
+    Returns:
+        List of parse results (dict or None), in the same order as basenames
+    """
+    if workers > 1 and len(basenames) >= PARALLEL_MIN_NAMES:
+        chunk_size = -(-len(basenames) // (workers * 4))
+        chunks = [basenames[i:i + chunk_size] for i in range(0, len(basenames), chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = []
+                for chunk_results in pool.map(GenericNameParser.parse_all, repeat(parser), chunks):
+                    results.extend(chunk_results)
+                return results
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Warning: Parallel name parsing unavailable, parsing serially: {e}")
+
+    return parser.parse_all(basenames)
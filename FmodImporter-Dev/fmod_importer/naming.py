@@ -5,25 +5,10 @@ Handles pattern-based parsing and building of event names.
 
 import os
 import re
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, List, Dict, Optional, Sequence, Tuple, Union
 
-
-def normalize_for_comparison(s: str) -> str:
-    """
-    Normalize a string for comparison.
-
-    Removes underscores, spaces, and converts to lowercase.
-    This allows matching between different naming conventions:
-    - "Strong_Repair" -> "strongrepair"
-    - "StrongRepair" -> "strongrepair"
-
-    Args:
-        s: String to normalize
-
-    Returns:
-        Normalized string
-    """
-    return s.replace('_', '').replace(' ', '').lower()
+from .keyword_automaton import KeywordAutomaton
+from .name_parser import ITERATOR_PATTERN, GenericNameParser, normalize_for_comparison, parse_names
 
 
 def format_template_name(placeholder: str, prefix: str, feature: str) -> str:
@@ -95,9 +80,35 @@ class NamingPattern:
     OPTIONAL_TAGS = {'$variation'}
 
     # Pattern to detect iterator at end of filename (_01, _02, _1, _2, etc.)
-    ITERATOR_PATTERN = re.compile(r'[_]?\d+$')
-
-    def __init__(self, pattern: str, separator: str = None):
+    ITERATOR_PATTERN = ITERATOR_PATTERN
+
+    # Common action keywords for extract_action_fuzzy (case-insensitive), in
+    # priority order. Only base actions - suffixes are captured separately
+    ACTION_KEYWORDS = (
+        # Multi-word actions (must come first)
+        'StunLoop', 'StunEnd', 'VFXHeal', 'StunRecover',
+        # Basic actions
+        'Alert', 'Ambush', 'Attack', 'Idle', 'Walk', 'Run', 'Jump', 'Die', 'Death',
+        'Hit', 'Damage', 'Heal', 'Cast', 'Shoot', 'Fire', 'Reload',
+        'Open', 'Close', 'Start', 'Stop', 'Loop', 'End', 'Stun',
+        'Spawn', 'Despawn', 'Appear', 'Disappear',
+        'Victory', 'Defeat', 'Win', 'Lose',
+        'Footstep', 'Land', 'Fall', 'Slide',
+        'Swing', 'Block', 'Parry', 'Dodge',
+        'Pickup', 'Drop', 'Use', 'Equip',
+        'Charge', 'Release', 'Hold',
+        'Enter', 'Exit', 'Transition', 'Recover', 'VFX'
+    )
+
+    # ACTION_KEYWORDS compiled once, shared by patterns without custom keywords
+    ACTION_AUTOMATON = KeywordAutomaton(keyword.lower() for keyword in ACTION_KEYWORDS)
+
+    # Suffix after an action keyword: _A, _B, _1, _2, A, B, 1, 2, etc.
+    # But not if followed by more letters (like "Idle" in "IdleAnimation")
+    ACTION_SUFFIX_PATTERN = re.compile(r'^([_]?[A-Za-z0-9])(?:[_]|$|\.)')
+
+    def __init__(self, pattern: str, separator: str = None,
+                 action_keywords: Union[Iterable[str], KeywordAutomaton, None] = None):
         """
         Initialize with a pattern string.
 
@@ -105,6 +116,10 @@ class NamingPattern:
             pattern: Pattern string like "$prefix$feature$action"
             separator: Optional explicit separator. If None, auto-detect from pattern.
                       Can be empty string for CamelCase mode.
+            action_keywords: Optional action keywords for extract_action_fuzzy,
+                             in priority order, or an already compiled
+                             KeywordAutomaton of lowercase keywords (e.g., from
+                             VocabularyCache.load). Defaults to ACTION_KEYWORDS
         """
         self.pattern = pattern
         self.explicit_separator = separator  # Store user's explicit choice
@@ -117,6 +132,14 @@ class NamingPattern:
 
         self.tags = self._extract_tags()
         self._regex_cache = {}
+        self._parser_cache = {}
+
+        if action_keywords is None:
+            self.action_automaton = self.ACTION_AUTOMATON
+        elif isinstance(action_keywords, KeywordAutomaton):
+            self.action_automaton = action_keywords
+        else:
+            self.action_automaton = KeywordAutomaton(keyword.lower() for keyword in action_keywords)
 
     def _extract_tags(self) -> List[str]:
         """Extract tags from pattern in order of appearance."""
@@ -365,74 +388,7 @@ class NamingPattern:
             name="PrefixFeatureNameStunLoop", prefix="Prefix", feature="FeatureName"
             -> "StunLoop"
         """
-        # Strip extension if present
-        if '.' in name:
-            name = os.path.splitext(name)[0]
-
-        # Strip iterator suffix
-        name = self._strip_iterator(name)
-
-        name_lower = name.lower()
-        prefix_lower = prefix.lower()
-        feature_normalized = normalize_for_comparison(feature)
-
-        # Remove prefix (with or without separator)
-        if name_lower.startswith(prefix_lower + '_'):
-            remaining = name[len(prefix) + 1:]  # +1 for separator
-        elif name_lower.startswith(prefix_lower + '-'):
-            remaining = name[len(prefix) + 1:]  # +1 for separator
-        elif name_lower.startswith(prefix_lower):
-            remaining = name[len(prefix):]
-        else:
-            return None
-
-        if not remaining:
-            return None
-
-        # Strategy 1: Try with separators (file pattern: Strong_Repair_Stun_Loop)
-        parts = remaining.replace('-', '_').replace(' ', '_').split('_')
-        parts = [p for p in parts if p]  # Remove empty parts
-
-        if parts:
-            # Try to find where feature ends and action begins
-            for i in range(1, len(parts) + 1):
-                candidate_feature = '_'.join(parts[:i])
-                if normalize_for_comparison(candidate_feature) == feature_normalized:
-                    # Found feature boundary! Action is what remains
-                    action_parts = parts[i:]
-                    if action_parts:
-                        return '_'.join(action_parts)  # Preserve original separators
-                    break
-
-        # Strategy 2: Try without separators (CamelCase: FeatureNameStunLoop)
-        remaining_normalized = normalize_for_comparison(remaining)
-        if remaining_normalized.startswith(feature_normalized):
-            # Feature found at start of remaining - action is what follows
-            # Need to find the boundary in the original string
-
-            # Count characters consumed by feature in normalized form
-            feature_len = len(feature_normalized)
-
-            # Find where action starts in original 'remaining' string
-            # by tracking normalized character consumption
-            norm_pos = 0
-            orig_pos = 0
-
-            while norm_pos < feature_len and orig_pos < len(remaining):
-                char = remaining[orig_pos]
-                # Skip separators (they're removed in normalization)
-                if char in '_- ':
-                    orig_pos += 1
-                    continue
-                norm_pos += 1
-                orig_pos += 1
-
-            # Action is everything after the feature
-            action = remaining[orig_pos:].lstrip('_- ')
-            if action:
-                return action
-
-        return None
+        return self._generic_parser(prefix, feature).extract_action(name)
 
     def parse_asset_generic(self, asset_name: str, user_values: Dict[str, str]) -> Optional[Dict[str, str]]:
         """
@@ -450,18 +406,8 @@ class NamingPattern:
         Returns:
             Dict of extracted components or None if no match
         """
-        prefix = user_values.get('prefix', '')
-        feature = user_values.get('feature', '')
-
-        action = self.extract_action_generic(asset_name, prefix, feature)
-        if not action:
-            return None
-
-        return {
-            'prefix': prefix,
-            'feature': feature,  # Use user's feature for event building
-            'action': action
-        }
+        return self._generic_parser(user_values.get('prefix', ''),
+                                    user_values.get('feature', '')).parse(asset_name)
 
     def parse_asset_fuzzy(self, asset_name: str, user_values: Dict[str, str]) -> Optional[Dict[str, str]]:
         """
@@ -478,6 +424,36 @@ class NamingPattern:
         """
         return self.parse_asset_generic(asset_name, user_values)
 
+    def _generic_parser(self, prefix: str, feature: str) -> 'GenericNameParser':
+        """Get the (cached) generic parser for a prefix/feature pair."""
+        key = (prefix, feature)
+        parser = self._parser_cache.get(key)
+        if parser is None:
+            parser = GenericNameParser(prefix, feature, self.ITERATOR_PATTERN)
+            self._parser_cache[key] = parser
+        return parser
+
+    def parse_many(self, basenames: Sequence[str], user_values: Dict[str, str],
+                   workers: int = 1) -> List[Optional[Dict[str, str]]]:
+        """
+        Parse many asset names at once with generic action extraction.
+
+        Same results as calling parse_asset_fuzzy() on each name, but the
+        prefix/feature state is computed once for the whole list. Very large
+        lists can be split into chunks parsed by a process pool.
+
+        Args:
+            basenames: Asset filenames (with or without extension)
+            user_values: Dict with 'prefix' and 'feature' values from user input
+            workers: Number of processes (1 = serial; lists shorter than
+                     name_parser.PARALLEL_MIN_NAMES are always parsed serially)
+
+        Returns:
+            List of parse results (dict or None), in the same order as basenames
+        """
+        parser = self._generic_parser(user_values.get('prefix', ''), user_values.get('feature', ''))
+        return parse_names(parser, basenames, workers)
+
     def build(self, **components) -> str:
         """
         Build an event name from components.
@@ -518,7 +494,10 @@ class NamingPattern:
         This is useful for template names that don't follow the exact pattern
         (e.g., "PrefixCharacterNameAlert" without underscores).
 
-        Looks for common action keywords and captures any suffix (A, B, C, 1, 2, etc.)
+        Looks for action keywords (ACTION_KEYWORDS unless the pattern has its own)
+        and captures any suffix (A, B, C, 1, 2, etc.). All keywords are searched
+        in a single pass over the name; the first keyword in priority order whose
+        last occurrence sits on a word boundary wins.
 
         Args:
             name: Name to extract action from (e.g., "PrefixCharacterNameAlert")
@@ -532,38 +511,19 @@ class NamingPattern:
             "Mechaflora_Strong_Repair_Attack_1" -> "Attack_1"
             "PrefixFeatureNameAlert" -> "Alert"
         """
-        # Common action keywords to look for (case-insensitive)
-        # Only base actions - suffixes will be captured separately
-        common_actions = [
-            # Multi-word actions (must come first)
-            'StunLoop', 'StunEnd', 'VFXHeal', 'StunRecover',
-            # Basic actions
-            'Alert', 'Ambush', 'Attack', 'Idle', 'Walk', 'Run', 'Jump', 'Die', 'Death',
-            'Hit', 'Damage', 'Heal', 'Cast', 'Shoot', 'Fire', 'Reload',
-            'Open', 'Close', 'Start', 'Stop', 'Loop', 'End', 'Stun',
-            'Spawn', 'Despawn', 'Appear', 'Disappear',
-            'Victory', 'Defeat', 'Win', 'Lose',
-            'Footstep', 'Land', 'Fall', 'Slide',
-            'Swing', 'Block', 'Parry', 'Dodge',
-            'Pickup', 'Drop', 'Use', 'Equip',
-            'Charge', 'Release', 'Hold',
-            'Enter', 'Exit', 'Transition', 'Recover', 'VFX'
-        ]
-
         # Normalize the name for matching
         name_lower = name.lower()
 
-        # Try to find action keywords
-        for base_action in common_actions:
-            action_lower = base_action.lower()
+        # Last occurrence of every action keyword, found in one pass
+        occurrences = self.action_automaton.last_occurrences(name_lower)
+        keywords = self.action_automaton.keywords
 
-            # Find the position of the action in the name
-            pos = name_lower.rfind(action_lower)
-            if pos == -1:
-                continue
+        # Try action keywords in priority order
+        for index in sorted(occurrences):
+            pos = occurrences[index]
 
             # Get what comes after the base action
-            action_end = pos + len(action_lower)
+            action_end = pos + len(keywords[index])
             remaining = name[action_end:]
 
             # Check if this is a valid action position
@@ -586,8 +546,7 @@ class NamingPattern:
                     continue
 
             # Capture suffix pattern: _A, _B, _1, _2, A, B, 1, 2, etc.
-            # But not if followed by more letters (like "Idle" in "IdleAnimation")
-            suffix_match = re.match(r'^([_]?[A-Za-z0-9])(?:[_]|$|\.)', remaining)
+            suffix_match = self.ACTION_SUFFIX_PATTERN.match(remaining)
             if suffix_match:
                 # Has a suffix (letter or number)
                 suffix = suffix_match.group(1)
@@ -6,13 +6,13 @@ Handles FMOD Studio project XML manipulation and metadata management.
 import os
 import json
 import uuid
-import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from xml.dom import minidom
 import wave
 
-from .core.xml_loader import XMLLoader
+from .core.xml_loader import XMLLoader, read_serialization_model
+from .core.metadata_cache import MetadataCache
 from .core.xml_writer import write_pretty_xml
 from .core.pending_folder_manager import PendingFolderManager
 from .core.bus_manager import BusManager
@@ -20,13 +20,26 @@ from .core.bank_manager import BankManager
 from .core.event_folder_manager import EventFolderManager
 from .core.asset_folder_manager import AssetFolderManager
 from .core.event_creator import EventCreator
+from .core.event_index import EventIndex
+from .core.folder_tree import FolderTree
+from .core.batch_importer import BatchImporter
+from .core.asset_index import AssetIndex, FileHashCache
+from .core.asset_placement import COPY
 from .core.audio_file_manager import AudioFileManager
 
 
 class FMODProject:
     """Represents a FMOD Studio project and handles XML manipulation"""
 
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, loader_workers: Optional[int] = None):
+        """
+        Load a FMOD Studio project.
+
+        Args:
+            project_path: Path to the .fspro file
+            loader_workers: Processes used to parse metadata XML on cold loads
+                            (None = one per CPU core, 1 = serial)
+        """
         self.project_path = Path(project_path)
         self.metadata_path = self.project_path.parent / "Metadata"
 
@@ -34,18 +47,27 @@ class FMODProject:
             raise ValueError(f"Metadata folder not found: {self.metadata_path}")
 
         # Initialize managers
-        self._xml_loader = XMLLoader(self.metadata_path)
+        # Persistent index: unchanged XML files are not re-parsed on startup
+        self._metadata_cache = MetadataCache.for_project(self.project_path)
+        if loader_workers is None:
+            loader_workers = os.cpu_count() or 1
+        self._xml_loader = XMLLoader(self.metadata_path, cache=self._metadata_cache,
+                                     workers=loader_workers)
         self._pending_manager = PendingFolderManager()
 
         # Load only minimal data needed for UI at startup
+        self._workspace_mtime = self._get_workspace_mtime()
         self.workspace = self._xml_loader.load_workspace()
+        self._serialization_model = self.workspace['serializationModel']
         self.event_folders = self._xml_loader.load_event_folders()
+        self._folder_tree = None
 
         # OPTIMIZATION: Lazy load everything else
         self._banks = None
         self._buses = None
         self._asset_folders = None
-        self._events_by_folder = None
+        self._events = None
+        self._asset_index = None
 
 
     @property
@@ -69,16 +91,54 @@ class FMODProject:
             self._asset_folders = self._xml_loader.load_asset_folders()
         return self._asset_folders
 
+    @property
+    def events(self) -> EventIndex:
+        """Lazy load the event index on first access"""
+        if self._events is None:
+            self._events = self._xml_loader.load_events()
+        return self._events
+
+    @property
+    def asset_index(self) -> AssetIndex:
+        """Lazy load the audio asset index (AudioFile objects + content hashes)"""
+        if self._asset_index is None:
+            self._asset_index = AssetIndex(
+                self.project_path.parent / "Assets",
+                self._xml_loader.load_audio_files(),
+                FileHashCache.for_project(self.project_path)
+            )
+        return self._asset_index
+
+    @property
+    def folder_tree(self) -> FolderTree:
+        """
+        Parent -> children index of all event folders (committed + pending).
+
+        Built on first access, then kept up to date by create_event_folder,
+        delete_folder and clear_pending_folders (committing keeps folder IDs).
+        """
+        if self._folder_tree is None:
+            self._folder_tree = FolderTree(self.get_all_event_folders())
+        return self._folder_tree
+
+    def get_child_folders(self, folder_id: str) -> List[str]:
+        """Get the IDs of the direct child event folders (committed + pending)"""
+        return self.folder_tree.children(folder_id)
+
+    def get_subfolder_ids(self, folder_id: str) -> set:
+        """Get the IDs of every event folder below a folder (committed + pending)"""
+        return self.folder_tree.descendants(folder_id)
+
     def get_events_in_folder(self, folder_id: str) -> List[Dict]:
         """Get all events in a specific folder (delegates to EventFolderManager)"""
         return EventFolderManager.get_events_in_folder(
-            folder_id, self.event_folders, self.metadata_path
+            folder_id, self.event_folders, self.events, self.folder_tree
         )
 
     def get_bus_from_template_events(self, folder_id: str) -> Tuple[Optional[str], bool, set]:
         """Analyze bus routing in template folder events (delegates to EventFolderManager)"""
         return EventFolderManager.get_bus_from_template_events(
-            folder_id, self.event_folders, self.metadata_path
+            folder_id, self.event_folders, self.events, self.folder_tree
         )
 
     def _get_master_bus_id(self) -> Optional[str]:
@@ -88,14 +148,17 @@ class FMODProject:
     def get_folder_hierarchy(self) -> List[Tuple[str, str, int]]:
         """Get event folders as a hierarchical list (delegates to EventFolderManager)"""
         master_id = self.workspace['masterEventFolder']
-        return EventFolderManager.get_hierarchy(master_id, self.event_folders)
+        return EventFolderManager.get_hierarchy(master_id, self.event_folders, self.folder_tree)
 
     def create_event_folder(self, name: str, parent_id: str, commit: bool = True) -> str:
         """Create a new event folder (delegates to EventFolderManager)"""
-        return EventFolderManager.create(
+        folder_id = EventFolderManager.create(
             name, parent_id, commit, self.metadata_path,
             self.event_folders, self._pending_manager
         )
+        if self._folder_tree is not None:
+            self._folder_tree.add(folder_id, parent_id)
+        return folder_id
 
     def create_bank(self, name: str, parent_id: str = None, commit: bool = True) -> str:
         """Create a new bank folder (delegates to BankManager) - DEPRECATED, use create_bank_folder()"""
@@ -154,8 +217,11 @@ class FMODProject:
         BusManager.delete(bus_id, self.buses, self.metadata_path)
 
     def delete_folder(self, folder_id: str):
-        """Delete an event folder (delegates to EventFolderManager)"""
-        EventFolderManager.delete(folder_id, self.event_folders, self.metadata_path)
+        """Delete an event folder, committed or pending (delegates to EventFolderManager)"""
+        if not self._pending_manager.remove_event_folder(folder_id):
+            EventFolderManager.delete(folder_id, self.event_folders, self.metadata_path)
+        if self._folder_tree is not None:
+            self._folder_tree.remove(folder_id)
 
     def commit_pending_folders(self) -> Tuple[int, int, int, int]:
         """
@@ -180,6 +246,9 @@ class FMODProject:
         Returns:
             Number of pending folders cleared
         """
+        if self._folder_tree is not None:
+            for folder_id in self._pending_manager.get_pending_event_folder_ids():
+                self._folder_tree.remove(folder_id)
         return self._pending_manager.clear_all()
 
     def get_all_event_folders(self) -> Dict[str, Dict]:
@@ -213,7 +282,8 @@ class FMODProject:
             template_event_id, new_name, dest_folder_id, bank_id, bus_id,
             audio_files, audio_asset_folder, self.metadata_path,
             self.project_path, self.workspace,
-            serialization_model=model
+            serialization_model=model,
+            event_index=self._events
         )
 
     def create_event_from_scratch(self, new_name: str, dest_folder_id: str,
@@ -227,8 +297,27 @@ class FMODProject:
             new_name, dest_folder_id, bank_id, bus_id,
             audio_files, audio_asset_folder, self.metadata_path,
             self.project_path, self.workspace,
-            serialization_model=model
+            serialization_model=model,
+            event_index=self._events
+        )
+
+    def import_events(self, events_to_process: List[Dict], dest_folder_id: str,
+                      bank_id: str, bus_id: str, audio_asset_folder: str,
+                      progress_callback: Optional[Callable[[str], None]] = None,
+                      copy_progress_callback: Optional[Callable] = None,
+                      placement: str = COPY) -> Dict:
+        """Import a batch of events with a single write phase (delegates to BatchImporter)"""
+        importer = BatchImporter(
+            self.metadata_path, self.project_path, self.workspace,
+            dest_folder_id, bank_id, bus_id, audio_asset_folder,
+            serialization_model=self.get_serialization_model_string(),
+            event_index=self._events,
+            asset_index=self.asset_index,
+            progress_callback=progress_callback,
+            copy_progress_callback=copy_progress_callback,
+            placement=placement
         )
+        return importer.run(events_to_process)
 
     def create_audio_file(self, audio_file_path: str, asset_relative_path: str) -> str:
         """Create an AudioFile XML entry (delegates to AudioFileManager)"""
@@ -237,6 +326,40 @@ class FMODProject:
             self.metadata_path, self.workspace
         )
 
+    def _get_workspace_mtime(self) -> Optional[int]:
+        """Get the modification time of Workspace.xml (None if missing)"""
+        try:
+            return (self.metadata_path / "Workspace.xml").stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def serialization_model(self) -> Optional[str]:
+        """
+        Serialization model captured from Workspace.xml.
+
+        Cached at load time and re-read only when the file's mtime changes.
+        """
+        mtime = self._get_workspace_mtime()
+        if mtime != self._workspace_mtime:
+            self._workspace_mtime = mtime
+            try:
+                self._serialization_model = read_serialization_model(
+                    self.metadata_path / "Workspace.xml"
+                )
+            except Exception:
+                self._serialization_model = None
+        return self._serialization_model
+
+    @property
+    def project_version(self) -> Optional[str]:
+        """FMOD Studio version derived from the serialization model"""
+        model = self.serialization_model
+        if model:
+            # Format: "Studio.02.03.00" -> "2.03.00"
+            return model.replace('Studio.', '')
+        return None
+
     def get_project_version(self) -> Optional[str]:
         """
         Extract FMOD Studio version from project metadata.
@@ -244,23 +367,7 @@ class FMODProject:
         Returns:
             Version string (e.g., "2.03.00") or None if not found
         """
-        try:
-            workspace_file = self.metadata_path / "Workspace.xml"
-            if not workspace_file.exists():
-                return None
-
-            tree = ET.parse(workspace_file)
-            root = tree.getroot()
-            serialization_model = root.get('serializationModel')
-
-            if serialization_model:
-                # Format: "Studio.02.03.00" -> "2.03.00"
-                version = serialization_model.replace('Studio.', '')
-                return version
-
-            return None
-        except Exception:
-            return None
+        return self.project_version
 
     def get_serialization_model_string(self) -> str:
         """
@@ -269,17 +376,7 @@ class FMODProject:
         Returns:
             String like "Studio.02.03.00" or default "Studio.02.02.00"
         """
-        try:
-            workspace_file = self.metadata_path / "Workspace.xml"
-            if not workspace_file.exists():
-                return "Studio.02.02.00"
-
-            tree = ET.parse(workspace_file)
-            root = tree.getroot()
-            model = root.get('serializationModel')
-            return model if model else "Studio.02.02.00"
-        except Exception:
-            return "Studio.02.02.00"
+        return self.serialization_model or "Studio.02.02.00"
 
     def get_executable_version(self, exe_path: str) -> Optional[str]:
         """
@@ -0,0 +1,280 @@
+"""
+Similarity Module
+Edit-distance scoring of event suffixes for audio file matching.
+"""
+
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Weight of the edit-distance tier, kept below the 0.92 "single character
+# variant" tier so that a typo never outranks a contained suffix
+EDIT_WEIGHT = 0.9
+
+
+def normalize_suffix(s: str) -> str:
+    """Normalize a suffix for comparison (no underscores, dashes or spaces, lowercase)"""
+    return s.replace('_', '').replace('-', '').replace(' ', '').lower()
+
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None,
+                  transpositions: bool = False) -> int:
+    """
+    Compute the Levenshtein distance between two strings.
+
+    With max_distance, only the diagonal band of width 2 * max_distance + 1 is
+    computed and the computation stops as soon as a whole row exceeds it.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest (None for no bound)
+        transpositions: Count swapping two adjacent characters as one edit
+                        (optimal string alignment / restricted Damerau-Levenshtein)
+
+    Returns:
+        The distance, or max_distance + 1 if it is larger than max_distance
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    len_a, len_b = len(a), len(b)
+
+    limit = len_a if max_distance is None else max_distance
+    if len_a - len_b > limit:
+        return limit + 1
+    if len_b == 0:
+        return len_a
+
+    # Cells are capped at limit + 1, which stands for "more than limit"
+    over = limit + 1
+    previous2 = None
+    previous = [j if j <= limit else over for j in range(len_b + 1)]
+
+    for i in range(1, len_a + 1):
+        current = [over] * (len_b + 1)
+        if i <= limit:
+            current[0] = i
+        row_min = current[0]
+        char_a = a[i - 1]
+
+        for j in range(max(1, i - limit), min(len_b, i + limit) + 1):
+            char_b = b[j - 1]
+            value = previous[j - 1] + (char_a != char_b)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (transpositions and i > 1 and j > 1 and char_a == b[j - 2]
+                    and a[i - 2] == char_b and previous2[j - 2] + 1 < value):
+                value = previous2[j - 2] + 1
+            if value > over:
+                value = over
+            current[j] = value
+            if value < row_min:
+                row_min = value
+
+        # Every later cell is at least one row minimum away
+        if row_min > limit:
+            return over
+        previous2, previous = previous, current
+
+    return previous[len_b]
+
+
+def edit_similarity(a: str, b: str, transpositions: bool = True) -> float:
+    """
+    Edit-distance similarity ratio: 1 - distance / length of the longer string.
+
+    Args:
+        a: First string
+        b: Second string
+        transpositions: Count adjacent swaps as one edit
+
+    Returns:
+        Ratio between 0.0 and 1.0 (1.0 for two empty strings)
+    """
+    max_len = max(len(a), len(b))
+    if max_len == 0:
+        return 1.0
+    return 1.0 - edit_distance(a, b, transpositions=transpositions) / max_len
+
+
+def _tiered_similarity(str1: str, str2: str, norm1: str, norm2: str,
+                       min_score: float) -> float:
+    """suffix_similarity on pre-normalized strings"""
+    if str1 == str2:
+        return 1.0
+    if norm1 == norm2:
+        return 0.95
+
+    len1, len2 = len(norm1), len(norm2)
+    if len1 <= len2 and norm1 in norm2 or len2 < len1 and norm2 in norm1:
+        # One suffix contains the other: a one-character longer one is
+        # likely a variant (e.g., "attack" vs "attacka")
+        if abs(len1 - len2) <= 1:
+            return 0.92
+        return min(len1, len2) / max(len1, len2) * 0.9
+
+    max_len = max(len1, len2)
+    if max_len == 0:
+        return 0.0
+
+    # Largest distance that can still reach min_score (one extra edit of
+    # headroom against rounding; the exact score is checked by the caller)
+    ratio_needed = min_score / EDIT_WEIGHT
+    max_distance = max_len if ratio_needed <= 0.0 else int(max_len * (1.0 - ratio_needed)) + 1
+    distance = edit_distance(norm1, norm2, max_distance, transpositions=True)
+    if distance > max_distance:
+        return 0.0
+    return (1.0 - distance / max_len) * EDIT_WEIGHT
+
+
+def suffix_similarity(str1: str, str2: str, min_score: float = 0.0) -> float:
+    """
+    Calculate the similarity score between two event suffixes (0.0 to 1.0).
+
+    Tiers, from best to worst:
+        1.0   identical
+        0.95  identical once normalized ("Attack_A" vs "AttackA")
+        0.92  one contains the other with a single extra character
+        <0.9  one contains the other (length ratio x 0.9)
+        <0.9  Damerau-Levenshtein ratio of the normalized suffixes x 0.9
+
+    Args:
+        str1: First suffix
+        str2: Second suffix
+        min_score: Scores below this value are not needed: the edit distance is
+                   bounded accordingly and 0.0 may be returned instead
+
+    Returns:
+        Similarity score (exact whenever it is >= min_score)
+    """
+    return _tiered_similarity(str1, str2, normalize_suffix(str1), normalize_suffix(str2), min_score)
+
+
+class SimilarityScorer:
+    """Scores a file suffix against candidate event suffixes with a pairwise function.
+
+    Subclass it, or wrap any (str, str) -> float function, to plug a different
+    similarity into AudioMatcher.match_files_to_events.
+    """
+
+    # Whether scores follow the suffix_similarity tiers, which lets a
+    # MatchSession resolve exact, normalized and one-character matches by index
+    tiered = False
+
+    def __init__(self, func: Callable[[str, str], float]):
+        """
+        Args:
+            func: Pairwise similarity function returning 0.0 to 1.0
+        """
+        self.func = func
+
+    def score(self, str1: str, str2: str) -> float:
+        """Score one pair of suffixes"""
+        return self.func(str1, str2)
+
+    def score_many(self, query: str, candidates: Sequence[str]) -> List[float]:
+        """Score one suffix against every candidate suffix"""
+        return [self.score(query, candidate) for candidate in candidates]
+
+    def best_match(self, query: str, candidates: Sequence[str],
+                   min_score: float = 0.7) -> Tuple[Optional[int], float]:
+        """
+        Find the most similar candidate.
+
+        Args:
+            query: Suffix to match
+            candidates: Candidate suffixes, in priority order
+            min_score: Minimum score for a match
+
+        Returns:
+            Tuple of (index of the first candidate with the highest score >=
+            min_score or None, its score or 0.0)
+        """
+        best_index = None
+        best_score = 0.0
+        for index, candidate in enumerate(candidates):
+            score = self.score(query, candidate)
+            if score > best_score and score >= min_score:
+                best_score = score
+                best_index = index
+        return best_index, best_score
+
+
+class EditDistanceScorer(SimilarityScorer):
+    """Default scorer: suffix_similarity, with batch matching against many candidates.
+
+    best_match normalizes the candidates once per candidate list and skips
+    every candidate whose length or character counts rule out beating the
+    best score so far; the remaining ones run a banded edit distance bounded
+    by that score.
+    """
+
+    tiered = True
+
+    def __init__(self):
+        super().__init__(suffix_similarity)
+        self._candidates = None
+        self._prepared: List[Tuple[str, int, Dict[str, int]]] = []
+
+    def _prepare(self, candidates: Sequence[str]) -> List[Tuple[str, int, Dict[str, int]]]:
+        if candidates is not self._candidates:
+            self._prepared = []
+            for candidate in candidates:
+                norm = normalize_suffix(candidate)
+                self._prepared.append((norm, len(norm), Counter(norm)))
+            self._candidates = candidates
+        return self._prepared
+
+    @staticmethod
+    def _count_distance(counts1: Dict[str, int], counts2: Dict[str, int]) -> int:
+        """Lower bound of the edit distance from character counts alone"""
+        missing = extra = 0
+        for char, count in counts1.items():
+            other = counts2.get(char, 0)
+            if count > other:
+                extra += count - other
+        for char, count in counts2.items():
+            other = counts1.get(char, 0)
+            if count > other:
+                missing += count - other
+        return max(missing, extra)
+
+    def best_match(self, query: str, candidates: Sequence[str],
+                   min_score: float = 0.7) -> Tuple[Optional[int], float]:
+        prepared = self._prepare(candidates)
+        norm_query = normalize_suffix(query)
+        query_len = len(norm_query)
+        query_counts = Counter(norm_query)
+
+        best_index = None
+        best_score = 0.0
+        for index, (norm, length, counts) in enumerate(prepared):
+            # Upper bound of the score from the lengths alone
+            if norm == norm_query:
+                bound = 1.0
+            elif abs(length - query_len) <= 1:
+                bound = 0.92
+            else:
+                bound = min(length, query_len) / max(length, query_len) * 0.9
+            if bound <= best_score or bound < min_score:
+                continue
+
+            # Containment with a single extra character implies at most one
+            # unmatched character, so larger count differences bound the score
+            count_distance = self._count_distance(query_counts, counts)
+            if count_distance > 1:
+                bound = min(bound, (1.0 - count_distance / max(length, query_len)) * EDIT_WEIGHT)
+                if bound <= best_score or bound < min_score:
+                    continue
+
+            score = _tiered_similarity(query, candidates[index], norm_query, norm,
+                                       max(min_score, best_score))
+            if score > best_score and score >= min_score:
+                best_score = score
+                best_index = index
+                if score == 1.0:
+                    break
+        return best_index, best_score
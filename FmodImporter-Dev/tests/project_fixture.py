@@ -0,0 +1,120 @@
+"""Helpers to build a minimal FMOD project Metadata tree for tests."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from fmod_importer.project import FMODProject
+from fmod_importer.core.metadata_cache import MetadataCache
+
+MASTER_EVENT_FOLDER = '{00000000-0000-0000-0000-00000000e000}'
+MASTER_BANK_FOLDER = '{00000000-0000-0000-0000-00000000b000}'
+MASTER_ASSET_FOLDER = '{00000000-0000-0000-0000-00000000a000}'
+MASTER_BUS = '{00000000-0000-0000-0000-00000000c000}'
+
+
+def _write(path: Path, body: str, model: str = "Studio.02.02.00"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<objects serializationModel="{model}">\n{body}</objects>\n',
+        encoding='utf-8'
+    )
+
+
+def _object(cls: str, obj_id: str, props: dict = None, rels: dict = None) -> str:
+    lines = [f'\t<object class="{cls}" id="{obj_id}">']
+    for name, value in (props or {}).items():
+        lines.append(f'\t\t<property name="{name}">\n\t\t\t<value>{value}</value>\n\t\t</property>')
+    for name, dest in (rels or {}).items():
+        lines.append(f'\t\t<relationship name="{name}">\n\t\t\t<destination>{dest}</destination>\n\t\t</relationship>')
+    lines.append('\t</object>\n')
+    return '\n'.join(lines)
+
+
+def write_workspace(metadata: Path, model: str = "Studio.02.02.00"):
+    _write(metadata / "Workspace.xml", _object('Workspace', '{workspace}', rels={
+        'masterEventFolder': MASTER_EVENT_FOLDER,
+        'masterBankFolder': MASTER_BANK_FOLDER,
+        'masterAssetFolder': MASTER_ASSET_FOLDER,
+    }), model=model)
+
+
+def write_event_folder(metadata: Path, folder_id: str, name: str, parent: str = None):
+    if parent is None:
+        body = _object('MasterEventFolder', folder_id, {'name': name})
+    else:
+        body = _object('EventFolder', folder_id, {'name': name}, {'folder': parent})
+    _write(metadata / "EventFolder" / f"{folder_id}.xml", body)
+
+
+def write_bank(metadata: Path, bank_id: str, name: str):
+    _write(metadata / "Bank" / f"{bank_id}.xml",
+           _object('Bank', bank_id, {'name': name}, {'folder': MASTER_BANK_FOLDER}))
+
+
+def write_bus(metadata: Path, bus_id: str, name: str, parent: str = MASTER_BUS):
+    _write(metadata / "Group" / f"{bus_id}.xml",
+           _object('MixerGroup', bus_id, {'name': name}, {'output': parent}))
+
+
+def write_master_bus(metadata: Path):
+    _write(metadata / "Master.xml", _object('MixerMaster', MASTER_BUS, {'name': 'Master Bus'}))
+
+
+def write_asset_folder(metadata: Path, asset_id: str, path: str):
+    _write(metadata / "Asset" / f"{asset_id}.xml",
+           _object('EncodableAsset', asset_id, {'assetPath': path},
+                   {'masterAssetFolder': MASTER_ASSET_FOLDER}))
+
+
+def write_event(metadata: Path, event_id: str, name: str, folder_id: str, bus_id: str = MASTER_BUS):
+    mixer_input_id = event_id[:-2] + 'f}'
+    body = (_object('Event', event_id, {'name': name},
+                    {'folder': folder_id, 'mixerInput': mixer_input_id}) +
+            _object('MixerInput', mixer_input_id, rels={'output': bus_id}))
+    _write(metadata / "Event" / f"{event_id}.xml", body)
+
+
+def make_project(root: Path) -> Path:
+    """
+    Create a small project with a folder tree, a bank, buses and an asset folder.
+
+    Returns:
+        Path to the (empty) .fspro file
+    """
+    metadata = root / "Metadata"
+    write_workspace(metadata)
+    write_event_folder(metadata, MASTER_EVENT_FOLDER, 'Master')
+    write_event_folder(metadata, '{folder-a}', 'Characters', MASTER_EVENT_FOLDER)
+    write_event_folder(metadata, '{folder-b}', 'Boss', '{folder-a}')
+    write_bank(metadata, '{bank-1}', 'SFX')
+    write_master_bus(metadata)
+    write_bus(metadata, '{bus-1}', 'Creatures')
+    write_asset_folder(metadata, '{asset-1}', 'Characters/')
+
+    project_file = root / "Test.fspro"
+    project_file.write_text('', encoding='utf-8')
+    return project_file
+
+
+class ProjectTestCase(unittest.TestCase):
+    """Test case loading the make_project() project from a temporary directory."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_file = make_project(Path(self.test_dir))
+        self.metadata_path = Path(self.test_dir) / "Metadata"
+
+        # Keep the metadata index inside the test directory
+        cache = MetadataCache(Path(self.test_dir) / "cache.json")
+        patcher = mock.patch.object(MetadataCache, 'for_project', return_value=cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.project = FMODProject(str(self.project_file), loader_workers=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
@@ -0,0 +1,108 @@
+import unittest
+import tempfile
+import shutil
+import os
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.action_vocabulary import (
+    PROJECT_VOCABULARY_FILE, VocabularyCache, find_vocabulary_file, read_vocabulary
+)
+from fmod_importer.keyword_automaton import KeywordAutomaton
+from fmod_importer.naming import NamingPattern
+
+
+class TestActionVocabulary(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.cache_dir = self.test_dir / "presets" / ".action_vocabularies"
+        self.vocabulary = self.test_dir / "Boss.actions.txt"
+        self.vocabulary.write_text("# Studio verbs\nGrappleStart\n\n  Grapple \nGrapple\nOverheat\n",
+                                   encoding='utf-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_read_vocabulary(self):
+        """Test that comments, blank lines and duplicates are skipped"""
+        self.assertEqual(read_vocabulary(self.vocabulary), ['GrappleStart', 'Grapple', 'Overheat'])
+
+    def test_find_vocabulary_file(self):
+        """Test that a preset's vocabulary wins over the project's"""
+        project_dir = self.test_dir / "project"
+        project_dir.mkdir()
+        project_vocabulary = project_dir / PROJECT_VOCABULARY_FILE
+        project_vocabulary.write_text("Overheat\n", encoding='utf-8')
+
+        self.assertEqual(find_vocabulary_file(self.test_dir / "Boss.json", project_dir / "Game.fspro"),
+                         self.vocabulary)
+        self.assertEqual(find_vocabulary_file(self.test_dir / "Other.json", project_dir / "Game.fspro"),
+                         project_vocabulary)
+        self.assertIsNone(find_vocabulary_file(self.test_dir / "Other.json"))
+
+    def test_loaded_vocabulary_extends_pattern(self):
+        """Test that vocabulary actions are found before the built-in keywords"""
+        automaton = VocabularyCache(self.cache_dir).load(self.vocabulary)
+        pattern = NamingPattern("$prefix_$feature_$action", action_keywords=automaton)
+
+        self.assertIs(pattern.action_automaton, automaton)
+        self.assertEqual(pattern.extract_action_fuzzy("MechafloraBossGrappleStartA"), "GrappleStartA")
+        self.assertEqual(pattern.extract_action_fuzzy("Mechaflora_Boss_Overheat"), "Overheat")
+        self.assertEqual(pattern.extract_action_fuzzy("Mechaflora_Boss_Attack_B"), "Attack_B")
+        self.assertIsNone(NamingPattern("$prefix_$action").extract_action_fuzzy("Mechaflora_Boss_Overheat"))
+
+    def test_compiled_cache_reused_by_content_hash(self):
+        """Test that a second session loads the compiled automaton instead of compiling"""
+        first = VocabularyCache(self.cache_dir).load(self.vocabulary)
+        cache_files = list(self.cache_dir.glob('*.json'))
+        self.assertEqual(len(cache_files), 1)
+
+        with mock.patch.object(KeywordAutomaton, '_compile', side_effect=AssertionError("recompiled")):
+            second = VocabularyCache(self.cache_dir).load(self.vocabulary)
+            self.assertEqual(second.last_occurrences('grapplestart'), first.last_occurrences('grapplestart'))
+        self.assertEqual(second.keywords, first.keywords)
+
+        # Same session: served from memory
+        cache = VocabularyCache(self.cache_dir)
+        self.assertIs(cache.load(self.vocabulary), cache.load(self.vocabulary))
+
+        # Edited vocabulary: new entry
+        self.vocabulary.write_text("Overheat\nVent\n", encoding='utf-8')
+        edited = VocabularyCache(self.cache_dir).load(self.vocabulary)
+        self.assertEqual(edited.keywords[:2], ['overheat', 'vent'])
+        self.assertEqual(len(list(self.cache_dir.glob('*.json'))), 2)
+
+    def test_old_cache_entries_are_pruned(self):
+        """Test that only the most recently used compiled entries are kept on disk"""
+        hashes = []
+        with mock.patch.object(VocabularyCache, 'MAX_CACHE_FILES', 2):
+            for i in range(4):
+                text = f"Vent{i}\n"
+                self.vocabulary.write_text(text, encoding='utf-8')
+                VocabularyCache(self.cache_dir).load(self.vocabulary)
+                hashes.append(VocabularyCache._content_hash(text, NamingPattern.ACTION_KEYWORDS))
+
+                # Explicit mtimes, so the order does not depend on timestamp resolution
+                for age, content_hash in enumerate(hashes):
+                    cache_file = self.cache_dir / f"{content_hash}.json"
+                    if cache_file.exists():
+                        os.utime(cache_file, (age, age))
+
+        self.assertEqual({path.stem for path in self.cache_dir.glob('*.json')}, set(hashes[-2:]))
+
+    def test_corrupt_cache_ignored(self):
+        """Test that an unreadable cache file is recompiled"""
+        VocabularyCache(self.cache_dir).load(self.vocabulary)
+        cache_file = next(self.cache_dir.glob('*.json'))
+        cache_file.write_text('{"version": 1, "automaton": {"keywords": []}}', encoding='utf-8')
+
+        automaton = VocabularyCache(self.cache_dir).load(self.vocabulary)
+        self.assertEqual(automaton.keywords[0], 'grapplestart')
+
+
+if __name__ == '__main__':
+    unittest.main()
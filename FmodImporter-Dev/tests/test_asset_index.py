@@ -0,0 +1,109 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core import asset_index
+from fmod_importer.core.asset_index import AssetIndex, FileHashCache
+from fmod_importer.core.batch_importer import BatchImporter
+from fmod_importer.core.xml_loader import XMLLoader
+from tests.project_fixture import make_project
+from tests.test_batch_importer import write_wav
+
+
+class TestAssetIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.project_file = make_project(self.test_dir)
+        self.metadata_path = self.test_dir / "Metadata"
+        self.assets_path = self.test_dir / "Assets"
+
+        self.media = self.test_dir / "media"
+        write_wav(self.media / "Dog_Bark.wav")
+        self.hash_cache = FileHashCache()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _import(self, events):
+        loader = XMLLoader(self.metadata_path)
+        index = AssetIndex(self.assets_path, loader.load_audio_files(), self.hash_cache)
+        importer = BatchImporter(
+            self.metadata_path, self.project_file, loader.load_workspace(),
+            '{folder-a}', '{bank-1}', '{bus-1}', 'Characters/', asset_index=index
+        )
+        return importer.run(events)
+
+    def _audio_file_count(self):
+        return len(list((self.metadata_path / "AudioFile").glob("*.xml")))
+
+    def _event(self, name, *files):
+        return {'name': name, 'template_id': None,
+                'audio_files': [str(self.media / f) for f in files]}
+
+    def test_identical_reimport_reuses_audio_file(self):
+        """Test that re-importing identical media neither copies nor duplicates it"""
+        self._import([self._event('Dog_Bark', 'Dog_Bark.wav')])
+        self.assertEqual(self._audio_file_count(), 1)
+
+        with mock.patch('shutil.copy2') as copy:
+            results = self._import([self._event('Dog_Bark_Again', 'Dog_Bark.wav')])
+
+        copy.assert_not_called()
+        self.assertEqual(results['success'], 1)
+        self.assertEqual(results['reused_audio_files'], 1)
+        self.assertEqual(results['skipped_copies'], 1)
+        self.assertEqual(self._audio_file_count(), 1)
+
+    def test_changed_media_gets_new_audio_file(self):
+        """Test that media with the same name but new content is copied again"""
+        self._import([self._event('Dog_Bark', 'Dog_Bark.wav')])
+        write_wav(self.media / "Dog_Bark.wav", frames=9600)
+
+        results = self._import([self._event('Dog_Bark_Again', 'Dog_Bark.wav')])
+
+        self.assertEqual(results['reused_audio_files'], 0)
+        self.assertEqual(results['skipped_copies'], 0)
+        self.assertEqual(self._audio_file_count(), 2)
+        self.assertEqual((self.assets_path / "Characters" / "Dog_Bark.wav").read_bytes(),
+                         (self.media / "Dog_Bark.wav").read_bytes())
+
+    def test_duplicate_within_batch_is_reused(self):
+        """Test that two events sharing a file in one import share its AudioFile"""
+        results = self._import([self._event('Dog_Bark', 'Dog_Bark.wav'),
+                                self._event('Dog_Bark_Copy', 'Dog_Bark.wav')])
+
+        self.assertEqual(results['success'], 2)
+        self.assertEqual(results['reused_audio_files'], 1)
+        self.assertEqual(self._audio_file_count(), 1)
+
+    def test_hash_cache_avoids_rehashing(self):
+        """Test that unchanged files are hashed only once across imports"""
+        with mock.patch.object(asset_index, 'file_digest', wraps=asset_index.file_digest) as digest:
+            self._import([self._event('Dog_Bark', 'Dog_Bark.wav')])
+            self._import([self._event('Dog_Bark_2', 'Dog_Bark.wav')])
+            first_calls = digest.call_count
+            self._import([self._event('Dog_Bark_3', 'Dog_Bark.wav')])
+
+        self.assertEqual(first_calls, 2)  # Source and asset file
+        self.assertEqual(digest.call_count, first_calls)
+
+    def test_hash_cache_persists(self):
+        """Test that the digest cache round-trips through its file"""
+        cache_file = self.test_dir / "cache" / "hashes.json"
+        cache = FileHashCache(cache_file)
+        expected = cache.digest(self.media / "Dog_Bark.wav")
+        cache.save()
+
+        with mock.patch.object(asset_index, 'file_digest') as digest:
+            self.assertEqual(FileHashCache(cache_file).digest(self.media / "Dog_Bark.wav"), expected)
+        digest.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import tempfile
+import shutil
+import errno
+import os
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core import asset_placement
+from fmod_importer.core.asset_placement import (
+    AssetPlacer, COPY, REFLINK, HARDLINK, SKIP_IDENTICAL, SKIPPED
+)
+from fmod_importer.core.copy_pipeline import CopyPipeline
+from fmod_importer.gui.settings import SettingsMixin
+
+
+class TestAssetPlacement(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.src = self.test_dir / "Cat_Attack.wav"
+        self.src.write_bytes(b'RIFF' + b'x' * 1000)
+        self.dest_dir = self.test_dir / "Assets"
+        self.dest_dir.mkdir()
+        self.dest = self.dest_dir / "Cat_Attack.wav"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_copy(self):
+        """Test that the default strategy makes an independent copy"""
+        self.assertEqual(AssetPlacer().place(self.src, self.dest), COPY)
+        self.assertEqual(self.dest.read_bytes(), self.src.read_bytes())
+        self.assertFalse(os.path.samefile(self.src, self.dest))
+
+    def test_hardlink(self):
+        """Test that hardlink placement shares the source inode"""
+        placer = AssetPlacer(HARDLINK)
+        self.assertEqual(placer.place(self.src, self.dest), HARDLINK)
+        self.assertTrue(os.path.samefile(self.src, self.dest))
+
+        # Placing again keeps the existing link
+        self.assertEqual(placer.place(self.src, self.dest), HARDLINK)
+        self.assertEqual(placer.counts, {HARDLINK: 2})
+
+    def test_unsupported_reflink_falls_back_once(self):
+        """Test that an unsupported reflink falls back to a copy and is not retried"""
+        unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+        with mock.patch.object(asset_placement, '_reflink', side_effect=unsupported) as reflink:
+            placer = AssetPlacer(REFLINK)
+            for i in range(3):
+                self.assertEqual(placer.place(self.src, self.dest_dir / f"{i}.wav"), COPY)
+
+        self.assertEqual(reflink.call_count, 1)
+        self.assertEqual(placer.counts, {COPY: 3})
+        self.assertEqual((self.dest_dir / "2.wav").read_bytes(), self.src.read_bytes())
+
+    def test_unsupported_hardlink_falls_back(self):
+        """Test that a cross-device hardlink falls back to a copy"""
+        with mock.patch.object(asset_placement.os, 'link',
+                               side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            self.assertEqual(AssetPlacer(HARDLINK).place(self.src, self.dest), COPY)
+        self.assertFalse(os.path.samefile(self.src, self.dest))
+
+    def test_reflink_result_matches_source(self):
+        """Test that reflink yields the source content whether or not the filesystem clones"""
+        self.assertIn(AssetPlacer(REFLINK).place(self.src, self.dest), (REFLINK, COPY))
+        self.assertEqual(self.dest.read_bytes(), self.src.read_bytes())
+
+    def test_skip_identical(self):
+        """Test that an identical destination is left alone and a different one replaced"""
+        placer = AssetPlacer(SKIP_IDENTICAL)
+        self.assertEqual(placer.place(self.src, self.dest), COPY)
+        self.assertEqual(placer.place(self.src, self.dest), SKIPPED)
+
+        self.src.write_bytes(b'RIFF' + b'y' * 1000)
+        self.assertEqual(placer.place(self.src, self.dest), COPY)
+        self.assertEqual(self.dest.read_bytes(), self.src.read_bytes())
+
+    def test_copy_never_writes_through_hardlink(self):
+        """Test that copying over a hard-linked asset leaves the other link untouched"""
+        old_media = self.test_dir / "Old_Cat_Attack.wav"
+        old_media.write_bytes(b'old')
+        os.link(old_media, self.dest)
+
+        AssetPlacer(COPY).place(self.src, self.dest)
+
+        self.assertEqual(old_media.read_bytes(), b'old')
+        self.assertEqual(self.dest.read_bytes(), self.src.read_bytes())
+
+    def test_unknown_strategy(self):
+        """Test that an unknown strategy is rejected"""
+        with self.assertRaises(ValueError):
+            AssetPlacer('teleport')
+
+    def test_pipeline_reports_placements(self):
+        """Test that the copy pipeline reports the strategy used per file"""
+        pipeline = CopyPipeline(workers=2, placement=HARDLINK)
+        pipeline.submit(self.src, self.dest_dir / "Characters" / "Cat_Attack.wav")
+        self.assertEqual(pipeline.close(), [])
+        self.assertEqual(pipeline.placements, {HARDLINK: 1})
+
+
+
+class TestPlacementSetting(unittest.TestCase):
+    def setUp(self):
+        self.home = Path(tempfile.mkdtemp())
+        patcher = mock.patch.object(Path, 'home', return_value=self.home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.home)
+
+    def load_placement(self, value):
+        (self.home / ".fmod_importer_settings.json").write_text(
+            f'{{"asset_placement": "{value}"}}', encoding='utf-8')
+        return SettingsMixin().load_settings()['asset_placement']
+
+    def test_unknown_placement_falls_back_to_copy(self):
+        """Test that a hand-edited or outdated placement is replaced when settings are read"""
+        self.assertEqual(self.load_placement(HARDLINK), HARDLINK)
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.load_placement('symlink'), COPY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+import unittest
+import tempfile
+import shutil
+import os
+import struct
+import wave
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core import audio_probe
+from fmod_importer.core.audio_headers import read_audio_header
+from fmod_importer.core.audio_probe import AudioProbe
+from tests.test_batch_importer import write_wav
+
+
+def chunk(chunk_id: bytes, data: bytes) -> bytes:
+    """Build a RIFF chunk, padded to an even size."""
+    return chunk_id + struct.pack('<I', len(data)) + data + (b'\x00' if len(data) & 1 else b'')
+
+
+def riff(*chunks: bytes) -> bytes:
+    body = b'WAVE' + b''.join(chunks)
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+def extended(value: int) -> bytes:
+    """Encode an integer as an 80-bit IEEE 754 extended float."""
+    exponent = value.bit_length() - 1
+    return struct.pack('>HQ', 16383 + exponent, value << (63 - exponent))
+
+
+def ogg_page(granule: int, packet: bytes) -> bytes:
+    """Build an Ogg page holding one packet (CRC left at zero)."""
+    return (b'OggS' + struct.pack('<BBqIII', 0, 0, granule, 1, 0, 0) +
+            bytes([1, len(packet)]) + packet)
+
+
+MP3_FRAME_HEADER = b'\xff\xfb\x90\x00'  # MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, stereo
+MP3_FRAME_LENGTH = 417
+
+
+class TestAudioHeaders(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_matches_wave_module(self):
+        """Test that the header parser agrees with the wave module"""
+        for channels, width, rate, frames in ((1, 2, 48000, 4800), (2, 3, 44100, 1001), (6, 1, 22050, 7)):
+            path = self.test_dir / f"{channels}_{width}.wav"
+            with wave.open(str(path), 'wb') as wav_file:
+                wav_file.setnchannels(channels)
+                wav_file.setsampwidth(width)
+                wav_file.setframerate(rate)
+                wav_file.writeframes(b'\x00' * channels * width * frames)
+
+            info = read_audio_header(path)
+            with wave.open(str(path), 'rb') as wav_file:
+                self.assertEqual(info.channels, wav_file.getnchannels())
+                self.assertEqual(info.sample_rate, wav_file.getframerate())
+                self.assertEqual(info.frames, wav_file.getnframes())
+                self.assertEqual(str(info.duration), str(wav_file.getnframes() / float(wav_file.getframerate())))
+            self.assertEqual(info.format, 'wav/pcm')
+
+    def test_skips_odd_sized_chunks(self):
+        """Test that padded metadata chunks before fmt/data are skipped"""
+        fmt = struct.pack('<HHIIHH', 3, 2, 96000, 96000 * 8, 8, 32)
+        path = self.test_dir / "float.wav"
+        path.write_bytes(riff(chunk(b'LIST', b'INFOabc'), chunk(b'fmt ', fmt),
+                              chunk(b'bext', b'x' * 3), chunk(b'data', b'\x00' * 80)))
+
+        info = read_audio_header(path)
+        self.assertEqual((info.channels, info.sample_rate, info.frames), (2, 96000, 10))
+        self.assertEqual(info.format, 'wav/float')
+
+    def test_aiff(self):
+        """Test AIFF and AIFF-C COMM chunk parsing"""
+        comm = struct.pack('>HIH', 2, 44100, 16) + extended(44100)
+        aiff = self.test_dir / "a.aif"
+        body = b'AIFF' + chunk(b'COMM', comm).replace(b'COMM' + struct.pack('<I', 18),
+                                                       b'COMM' + struct.pack('>I', 18))
+        aiff.write_bytes(b'FORM' + struct.pack('>I', len(body)) + body)
+
+        info = read_audio_header(aiff)
+        self.assertEqual((info.channels, info.sample_rate, info.frames, info.format),
+                         (2, 44100, 44100, 'aiff'))
+        self.assertEqual(info.duration, 1.0)
+
+        comm = struct.pack('>HIH', 1, 24000, 16) + extended(48000) + b'sowt' + b'\x00\x00'
+        body = b'AIFC' + b'FVER' + struct.pack('>I', 4) + b'\x00' * 4 + \
+            b'COMM' + struct.pack('>I', len(comm)) + comm
+        aifc = self.test_dir / "b.aifc"
+        aifc.write_bytes(b'FORM' + struct.pack('>I', len(body)) + body)
+
+        info = read_audio_header(aifc)
+        self.assertEqual((info.channels, info.sample_rate, info.frames, info.format),
+                         (1, 48000, 24000, 'aifc/sowt'))
+
+    def test_flac(self):
+        """Test FLAC STREAMINFO parsing, with and without a leading ID3v2 tag"""
+        packed = (96000 << 44) | ((2 - 1) << 41) | ((24 - 1) << 36) | 192000
+        streaminfo = b'\x10\x00\x10\x00' + b'\x00' * 6 + packed.to_bytes(8, 'big') + b'\x00' * 16
+        flac = b'fLaC' + b'\x80\x00\x00\x22' + streaminfo
+
+        for name, data in (("plain.flac", flac), ("tagged.flac", b'ID3\x03\x00\x00\x00\x00\x00\x05' + b'x' * 5 + flac)):
+            path = self.test_dir / name
+            path.write_bytes(data)
+            info = read_audio_header(path)
+            self.assertEqual((info.channels, info.sample_rate, info.frames, info.format),
+                             (2, 96000, 192000, 'flac'))
+            self.assertEqual(info.duration, 2.0)
+
+    def test_ogg(self):
+        """Test Vorbis/Opus identification headers and last-page granule length"""
+        vorbis = b'\x01vorbis' + struct.pack('<IBI', 0, 2, 44100) + b'\x00' * 13
+        path = self.test_dir / "a.ogg"
+        path.write_bytes(ogg_page(0, vorbis) + b'\x00' * 100 + ogg_page(88200, b'audio'))
+
+        info = read_audio_header(path)
+        self.assertEqual((info.channels, info.sample_rate, info.frames, info.format),
+                         (2, 44100, 88200, 'ogg/vorbis'))
+
+        opus = b'OpusHead' + struct.pack('<BBHI', 1, 1, 312, 44100) + b'\x00' * 3
+        path = self.test_dir / "b.opus"
+        path.write_bytes(ogg_page(0, opus) + ogg_page(48312, b'audio'))
+
+        info = read_audio_header(path)
+        self.assertEqual((info.channels, info.sample_rate, info.frames, info.format),
+                         (1, 48000, 48000, 'ogg/opus'))
+
+    def test_mp3_cbr(self):
+        """Test that a constant bitrate MP3 length is derived from its size"""
+        frame = MP3_FRAME_HEADER + b'\x00' * (MP3_FRAME_LENGTH - 4)
+        path = self.test_dir / "cbr.mp3"
+        path.write_bytes(b'ID3\x03\x00\x00\x00\x00\x00\x0a' + b'x' * 10 + frame * 100 +
+                         b'TAG' + b'\x00' * 125)
+
+        info = read_audio_header(path)
+        self.assertEqual((info.channels, info.sample_rate, info.format), (2, 44100, 'mp3/layer3'))
+        self.assertEqual(info.frames, 100 * MP3_FRAME_LENGTH * 8 * 44100 // 128000)
+        self.assertAlmostEqual(info.duration, 100 * 1152 / 44100, delta=0.01)  # Unpadded frames
+
+    def test_mp3_xing_and_vbri(self):
+        """Test that Xing and VBRI frame counts give the exact length"""
+        empty = MP3_FRAME_HEADER + b'\x00' * (MP3_FRAME_LENGTH - 4)
+
+        xing = bytearray(empty)
+        xing[36:48] = b'Xing' + struct.pack('>II', 1, 250)
+        vbri = bytearray(empty)
+        vbri[36:54] = b'VBRI' + struct.pack('>HHHII', 1, 0, 75, 0, 300)
+
+        for name, first, mpeg_frames in (("xing.mp3", xing, 250), ("vbri.mp3", vbri, 300)):
+            path = self.test_dir / name
+            path.write_bytes(bytes(first) + empty * 3)
+            self.assertEqual(read_audio_header(path).frames, mpeg_frames * 1152)
+
+    def test_invalid_files_raise(self):
+        """Test that non-WAVE or unsupported files raise ValueError"""
+        garbage = self.test_dir / "garbage.wav"
+        garbage.write_bytes(b'not a wav file')
+        adpcm = self.test_dir / "adpcm.wav"
+        adpcm.write_bytes(riff(chunk(b'fmt ', struct.pack('<HHIIHH', 2, 1, 22050, 11025, 512, 4)),
+                               chunk(b'data', b'\x00' * 512)))
+        no_data = self.test_dir / "no_data.wav"
+        no_data.write_bytes(riff(chunk(b'fmt ', struct.pack('<HHIIHH', 1, 1, 8000, 16000, 2, 16))))
+
+        for path in (garbage, adpcm, no_data):
+            with self.assertRaises(ValueError):
+                read_audio_header(path)
+
+
+class TestAudioProbe(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.path = self.test_dir / "Cat_Attack.wav"
+        write_wav(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_header_read_once(self):
+        """Test that repeated probes of an unchanged file read the header once"""
+        probe = AudioProbe()
+        with mock.patch.object(audio_probe, 'read_audio_header',
+                               wraps=audio_probe.read_audio_header) as read:
+            for _ in range(5):
+                info = probe.probe(str(self.path))
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual((info.channels, info.sample_rate, info.frames), (1, 48000, 4800))
+        self.assertAlmostEqual(info.duration, 0.1)
+
+    def test_modified_file_is_reprobed(self):
+        """Test that a changed file invalidates its record"""
+        probe = AudioProbe()
+        probe.probe(self.path)
+
+        write_wav(self.path, frames=9600)
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(probe.probe(self.path).frames, 9600)
+
+    def test_prefetch(self):
+        """Test that prefetch fills the cache and skips unreadable files"""
+        paths = [self.path]
+        for i in range(5):
+            path = self.test_dir / f"Dog_Bark_{i}.wav"
+            write_wav(path)
+            paths.append(path)
+        broken = self.test_dir / "Broken.wav"
+        broken.write_bytes(b'not a wav file')
+
+        probe = AudioProbe()
+        probe.prefetch(paths + [broken, self.test_dir / "missing.wav"], workers=4)
+        self.assertEqual(len(probe), 6)
+
+        with mock.patch.object(audio_probe, 'read_audio_header') as read:
+            probe.probe(paths[3])
+        read.assert_not_called()
+
+        with self.assertRaises(ValueError):
+            probe.probe(broken)
+
+
+if __name__ == '__main__':
+    unittest.main()
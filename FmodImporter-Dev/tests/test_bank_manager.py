@@ -0,0 +1,72 @@
+import unittest
+import tempfile
+import shutil
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core import bank_manager
+from fmod_importer.core.bank_manager import BankManager
+from tests.project_fixture import make_project
+
+
+class TestBankMembership(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        make_project(Path(self.test_dir))
+        self.metadata_path = Path(self.test_dir) / "Metadata"
+        self.bank_file = self.metadata_path / "Bank" / "{bank-1}.xml"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _bank_events(self):
+        root = ET.parse(self.bank_file).getroot()
+        return [d.text for d in root.findall(".//relationship[@name='events']/destination")]
+
+    def test_batch_writes_once(self):
+        """Test that many events are added with a single bank rewrite"""
+        event_ids = [f'{{event-{i}}}' for i in range(500)]
+
+        with mock.patch.object(bank_manager, 'write_pretty_xml',
+                               wraps=bank_manager.write_pretty_xml) as writer:
+            added = BankManager.add_events_to_bank('{bank-1}', event_ids, self.metadata_path)
+
+        self.assertEqual(added, 500)
+        self.assertEqual(writer.call_count, 1)
+        self.assertEqual(self._bank_events(), event_ids)
+
+    def test_duplicates_are_skipped(self):
+        """Test that existing and repeated events are only listed once"""
+        BankManager.add_event_to_bank('{bank-1}', '{event-a}', self.metadata_path)
+
+        added = BankManager.add_events_to_bank(
+            '{bank-1}', ['{event-a}', '{event-b}', '{event-b}', '{event-c}'], self.metadata_path
+        )
+
+        self.assertEqual(added, 2)
+        self.assertEqual(self._bank_events(), ['{event-a}', '{event-b}', '{event-c}'])
+
+    def test_no_write_when_nothing_added(self):
+        """Test that the bank file is left untouched when all events exist"""
+        BankManager.add_event_to_bank('{bank-1}', '{event-a}', self.metadata_path)
+
+        with mock.patch.object(bank_manager, 'write_pretty_xml') as writer:
+            added = BankManager.add_events_to_bank('{bank-1}', ['{event-a}'], self.metadata_path)
+
+        self.assertEqual(added, 0)
+        writer.assert_not_called()
+
+    def test_unknown_bank_is_ignored(self):
+        """Test that bank folders (no Bank file) are skipped"""
+        self.assertEqual(
+            BankManager.add_events_to_bank('{folder}', ['{event-a}'], self.metadata_path), 0
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
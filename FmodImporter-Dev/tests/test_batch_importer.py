@@ -0,0 +1,144 @@
+import unittest
+import tempfile
+import shutil
+import wave
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core.asset_placement import AssetPlacer
+from fmod_importer.core.batch_importer import BatchImporter
+from fmod_importer.core.event_index import EventIndex
+from fmod_importer.core.xml_loader import XMLLoader
+from tests.project_fixture import make_project, write_event
+
+
+def write_wav(path: Path, frames: int = 4800, rate: int = 48000):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(b'\x00\x00' * frames)
+
+
+class TestBatchImporter(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.project_file = make_project(self.test_dir)
+        self.metadata_path = self.test_dir / "Metadata"
+        write_event(self.metadata_path, '{tmpl-01}', 'Template', '{folder-b}')
+
+        self.media = self.test_dir / "media"
+        for name in ('Cat_Attack_01', 'Cat_Attack_02', 'Dog_Bark'):
+            write_wav(self.media / f"{name}.wav")
+
+        self.index = EventIndex()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _importer(self):
+        workspace = XMLLoader(self.metadata_path).load_workspace()
+        return BatchImporter(
+            self.metadata_path, self.project_file, workspace,
+            '{folder-a}', '{bank-1}', '{bus-1}', 'Characters/',
+            event_index=self.index
+        )
+
+    def _bank_events(self):
+        root = ET.parse(self.metadata_path / "Bank" / "{bank-1}.xml").getroot()
+        return [d.text for d in root.findall(".//relationship[@name='events']/destination")]
+
+    def test_import_writes_everything(self):
+        """Test that events, audio files, assets and bank links are written"""
+        results = self._importer().run([
+            {'name': 'Cat_Attack', 'template_id': '{tmpl-01}',
+             'audio_files': [str(self.media / 'Cat_Attack_01.wav'),
+                             str(self.media / 'Cat_Attack_02.wav')]},
+            {'name': 'Dog_Bark', 'template_id': None,
+             'audio_files': [str(self.media / 'Dog_Bark.wav')]},
+        ])
+
+        self.assertEqual(results['success'], 2)
+        self.assertEqual(results['failed'], 0)
+        for event_id in results['event_ids']:
+            self.assertTrue((self.metadata_path / "Event" / f"{event_id}.xml").exists())
+
+        self.assertEqual(len(list((self.metadata_path / "AudioFile").glob("*.xml"))), 3)
+        self.assertTrue((self.test_dir / "Assets" / "Characters" / "Dog_Bark.wav").exists())
+        self.assertEqual(self._bank_events(), results['event_ids'])
+
+        # New events are visible without a rescan
+        self.assertEqual(len(self.index.in_folders(['{folder-a}'])), 2)
+
+    def test_failed_event_leaves_no_files(self):
+        """Test that an event failing during planning writes nothing"""
+        broken = self.media / "Broken.wav"
+        broken.write_bytes(b'not a wav file')
+
+        results = self._importer().run([
+            {'name': 'Broken', 'template_id': None,
+             'audio_files': [str(self.media / 'Dog_Bark.wav'), str(broken)]},
+            {'name': 'Cat_Attack', 'template_id': '{tmpl-01}',
+             'audio_files': [str(self.media / 'Cat_Attack_01.wav')]},
+        ])
+
+        self.assertEqual(results['success'], 1)
+        self.assertEqual(results['failed'], 1)
+        self.assertTrue(results['errors'][0].startswith('Broken:'))
+
+        self.assertEqual(len(list((self.metadata_path / "AudioFile").glob("*.xml"))), 1)
+        self.assertFalse((self.test_dir / "Assets" / "Characters" / "Dog_Bark.wav").exists())
+        self.assertEqual(self._bank_events(), results['event_ids'])
+
+    def test_failed_copy_fails_its_events(self):
+        """Test that events whose audio failed to copy are not written"""
+        place = AssetPlacer.place
+
+        def failing_place(placer, src, dest):
+            if src.name == 'Cat_Attack_01.wav':
+                raise OSError("disk full")
+            return place(placer, src, dest)
+
+        with mock.patch.object(AssetPlacer, 'place', failing_place):
+            results = self._importer().run([
+                {'name': 'Cat_Attack', 'template_id': '{tmpl-01}',
+                 'audio_files': [str(self.media / 'Cat_Attack_01.wav'),
+                                 str(self.media / 'Cat_Attack_02.wav')]},
+                {'name': 'Dog_Bark', 'template_id': None,
+                 'audio_files': [str(self.media / 'Dog_Bark.wav')]},
+                {'name': 'Cat_Attack_Alt', 'template_id': None,
+                 'audio_files': [str(self.media / 'Cat_Attack_01.wav')]},
+            ])
+
+        self.assertEqual(results['success'], 1)
+        self.assertEqual(results['failed'], 2)
+        self.assertEqual(len(results['errors']), 3)
+        self.assertTrue(any(e.startswith('Cat_Attack:') for e in results['errors']))
+        self.assertTrue(any(e.startswith('Cat_Attack_Alt:') for e in results['errors']))
+
+        # Only the event with copied audio is in the project
+        self.assertEqual(len(list((self.metadata_path / "Event").glob("*.xml"))), 2)  # + template
+        self.assertEqual(len(list((self.metadata_path / "AudioFile").glob("*.xml"))), 1)
+        self.assertEqual(self._bank_events(), results['event_ids'])
+        self.assertEqual([e['name'] for e in self.index.in_folders(['{folder-a}'])], ['Dog_Bark'])
+
+    def test_missing_template_is_reported(self):
+        """Test that an unknown template is reported as a failed event"""
+        results = self._importer().run([
+            {'name': 'Ghost', 'template_id': '{missing}',
+             'audio_files': [str(self.media / 'Dog_Bark.wav')]},
+        ])
+
+        self.assertEqual(results['success'], 0)
+        self.assertEqual(results['failed'], 1)
+        self.assertFalse((self.metadata_path / "AudioFile").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
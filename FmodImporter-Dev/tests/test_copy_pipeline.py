@@ -0,0 +1,82 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core import asset_placement
+from fmod_importer.core.copy_pipeline import CopyPipeline
+
+
+class TestCopyPipeline(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.src_dir = self.test_dir / "src"
+        self.src_dir.mkdir()
+        self.dest_dir = self.test_dir / "Assets" / "Characters"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _source(self, name, data=b'x' * 1000):
+        path = self.src_dir / name
+        path.write_bytes(data)
+        return path
+
+    def test_copies_with_progress(self):
+        """Test that every file is copied and progress reaches the total"""
+        updates = []
+        pipeline = CopyPipeline(workers=3, queue_size=2, progress_callback=updates.append)
+        for i in range(20):
+            pipeline.submit(self._source(f"sound_{i}.wav"), self.dest_dir / f"sound_{i}.wav")
+
+        self.assertEqual(pipeline.close(), [])
+        self.assertEqual(len(list(self.dest_dir.iterdir())), 20)
+
+        self.assertEqual(len(updates), 20)
+        final = max(updates, key=lambda p: p.files_done)
+        self.assertEqual((final.files_done, final.files_total), (20, 20))
+        self.assertEqual(final.bytes_done, 20000)
+        self.assertEqual(final.bytes_total, 20000)
+
+    def test_duplicate_destination_copied_once(self):
+        """Test that the same file submitted twice is only copied once"""
+        src = self._source("cat.wav")
+        with mock.patch.object(asset_placement.shutil, 'copy2', wraps=shutil.copy2) as copy:
+            pipeline = CopyPipeline(workers=2)
+            pipeline.submit(src, self.dest_dir / "cat.wav")
+            pipeline.submit(src, self.dest_dir / "cat.wav")
+            pipeline.close()
+
+        self.assertEqual(copy.call_count, 1)
+
+    def test_last_source_wins(self):
+        """Test that a destination re-targeted to another source ends with the last one"""
+        first = self._source("a_cat.wav", b'first')
+        second = self._source("b_cat.wav", b'second')
+
+        pipeline = CopyPipeline(workers=4)
+        pipeline.submit(first, self.dest_dir / "cat.wav")
+        pipeline.submit(second, self.dest_dir / "cat.wav")
+        pipeline.close()
+
+        self.assertEqual((self.dest_dir / "cat.wav").read_bytes(), b'second')
+
+    def test_errors_are_collected(self):
+        """Test that a failing copy is reported without stopping the others"""
+        pipeline = CopyPipeline(workers=2)
+        pipeline.submit(self.src_dir / "missing.wav", self.dest_dir / "missing.wav")
+        pipeline.submit(self._source("ok.wav"), self.dest_dir / "ok.wav")
+        errors = pipeline.close()
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0].name, "missing.wav")
+        self.assertTrue((self.dest_dir / "ok.wav").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core.event_index import EventIndex
+from fmod_importer.core.xml_loader import XMLLoader
+from fmod_importer.core.event_folder_manager import EventFolderManager
+from tests.project_fixture import make_project, write_event, MASTER_BUS
+
+
+class TestEventIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        make_project(Path(self.test_dir))
+        self.metadata_path = Path(self.test_dir) / "Metadata"
+
+        write_event(self.metadata_path, '{event-01}', 'Attack', '{folder-a}', '{bus-1}')
+        write_event(self.metadata_path, '{event-02}', 'Roar', '{folder-b}', '{bus-1}')
+        write_event(self.metadata_path, '{event-03}', 'Ambience', '{folder-x}')
+
+        self.loader = XMLLoader(self.metadata_path)
+        self.folders = self.loader.load_event_folders()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_load_events(self):
+        """Test that events are indexed with their folder and bus"""
+        index = self.loader.load_events()
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.get('{event-02}')['name'], 'Roar')
+        self.assertEqual(index.get('{event-02}')['folder_id'], '{folder-b}')
+        self.assertEqual(index.get('{event-03}')['bus'], MASTER_BUS)
+
+    def test_malformed_event_is_skipped(self):
+        """Test that an unreadable event file does not abort indexing"""
+        (self.metadata_path / "Event" / "{broken}.xml").write_text('<objects>', encoding='utf-8')
+
+        index = self.loader.load_events()
+        self.assertEqual(len(index), 3)
+        self.assertNotIn('{broken}', index)
+
+    def test_events_in_folder_include_subfolders(self):
+        """Test that folder queries are recursive and use the index"""
+        index = self.loader.load_events()
+
+        events = EventFolderManager.get_events_in_folder('{folder-a}', self.folders, index)
+        self.assertEqual(sorted(e['name'] for e in events), ['Attack', 'Roar'])
+
+        events = EventFolderManager.get_events_in_folder('{folder-b}', self.folders, index)
+        self.assertEqual([e['id'] for e in events], ['{event-02}'])
+
+    def test_bus_from_template_events(self):
+        """Test bus detection over a template folder"""
+        index = self.loader.load_events()
+
+        bus_id, all_same, bus_ids = EventFolderManager.get_bus_from_template_events(
+            '{folder-a}', self.folders, index
+        )
+        self.assertEqual(bus_id, '{bus-1}')
+        self.assertTrue(all_same)
+        self.assertEqual(bus_ids, {'{bus-1}'})
+
+    def test_add_moves_existing_event(self):
+        """Test that re-adding an event replaces its folder membership"""
+        index = EventIndex()
+        index.add('{e}', 'Step', '{folder-a}', Path('e.xml'))
+        index.add('{e}', 'Step', '{folder-b}', Path('e.xml'))
+
+        self.assertEqual(index.in_folders(['{folder-a}']), [])
+        self.assertEqual(len(index.in_folders(['{folder-b}'])), 1)
+
+        index.remove('{e}')
+        self.assertNotIn('{e}', index)
+
+
+if __name__ == '__main__':
+    unittest.main()
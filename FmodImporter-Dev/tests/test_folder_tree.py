@@ -0,0 +1,132 @@
+import unittest
+import random
+from pathlib import Path
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core.folder_tree import FolderTree
+from fmod_importer.core.event_folder_manager import EventFolderManager
+from tests.project_fixture import ProjectTestCase, MASTER_EVENT_FOLDER
+
+
+def reference_hierarchy(master_id, folders):
+    """Former get_hierarchy: rescans every folder for the children of each node."""
+    def build(folder_id, depth=0):
+        result = []
+        if folder_id in folders:
+            result.append((folders[folder_id]['name'], folder_id, depth))
+            for fid, fdata in folders.items():
+                if fdata['parent'] == folder_id:
+                    result.extend(build(fid, depth + 1))
+        return result
+    return build(master_id)
+
+
+def random_folders(rng, count):
+    folders = {'root': {'name': 'Master', 'parent': None}}
+    for i in range(count):
+        parent = rng.choice(list(folders) + ['missing'])
+        folders[f'f{i}'] = {'name': f'Folder{rng.randrange(50)}', 'parent': parent}
+    return folders
+
+
+class TestFolderTree(unittest.TestCase):
+    def setUp(self):
+        self.folders = {
+            'root': {'name': 'Master', 'parent': None},
+            'a': {'name': 'Characters', 'parent': 'root'},
+            'b': {'name': 'Boss', 'parent': 'a'},
+            'c': {'name': 'Ambience', 'parent': 'root'},
+        }
+        self.tree = FolderTree(self.folders)
+
+    def test_children_and_walk(self):
+        """Test children order and depth-first walk with depths"""
+        self.assertEqual(self.tree.children('root'), ['a', 'c'])
+        self.assertEqual(self.tree.children(None), ['root'])
+        self.assertEqual(list(self.tree.walk('root')), [('root', 0), ('a', 1), ('b', 2), ('c', 1)])
+        self.assertEqual(list(self.tree.walk('root', lambda fid: fid != 'a')), [('root', 0), ('c', 1)])
+        self.assertEqual(self.tree.descendants('a'), {'b'})
+
+    def test_add_move_and_remove(self):
+        """Test that updates keep the index consistent"""
+        self.tree.add('b', 'c')
+        self.assertEqual(self.tree.children('a'), [])
+        self.assertEqual(self.tree.children('c'), ['b'])
+        self.assertEqual(self.tree.parent('b'), 'c')
+
+        self.tree.remove('c')
+        self.assertNotIn('c', self.tree)
+        self.assertEqual(self.tree.descendants('root'), {'a'})
+        self.tree.remove('unknown')
+        self.assertEqual(len(self.tree), 3)
+
+    def test_cycles_terminate(self):
+        """Test that malformed parent cycles do not loop forever"""
+        tree = FolderTree({'x': {'parent': 'y'}, 'y': {'parent': 'x'}})
+        self.assertEqual(tree.descendants('x'), {'y'})
+        self.assertEqual(tree.with_matching_descendant(lambda fid: fid == 'x'), {'x', 'y'})
+
+    def test_with_matching_descendant(self):
+        """Test the search filter set: matches and all of their ancestors"""
+        matching = self.tree.with_matching_descendant(lambda fid: self.folders[fid]['name'] == 'Boss')
+        self.assertEqual(matching, {'root', 'a', 'b'})
+
+    def test_hierarchy_matches_full_scan(self):
+        """Test the indexed hierarchy and subfolder queries against the former full scans"""
+        rng = random.Random(7)
+        for _ in range(50):
+            folders = random_folders(rng, rng.randint(0, 60))
+            expected = reference_hierarchy('root', folders)
+            self.assertEqual(EventFolderManager.get_hierarchy('root', folders), expected)
+
+            tree = FolderTree(folders)
+            self.assertEqual(EventFolderManager.get_hierarchy('root', folders, tree), expected)
+            self.assertEqual(tree.descendants('root') | {'root'}, {fid for _, fid, _ in expected})
+
+
+class TestProjectFolderTree(ProjectTestCase):
+    def assert_tree_matches_folders(self):
+        all_folders = self.project.get_all_event_folders()
+        for folder_id, folder_data in all_folders.items():
+            expected = [fid for fid, fdata in all_folders.items()
+                        if fdata['parent'] == folder_id]
+            self.assertEqual(sorted(self.project.get_child_folders(folder_id)), sorted(expected))
+        self.assertEqual(len(self.project.folder_tree), len(all_folders))
+
+    def test_index_follows_create_commit_delete_and_clear(self):
+        """Test that the folder index is maintained by every folder operation"""
+        self.assertEqual(self.project.get_subfolder_ids('{folder-a}'), {'{folder-b}'})
+
+        pending = self.project.create_event_folder('Ambience', MASTER_EVENT_FOLDER, commit=False)
+        child = self.project.create_event_folder('Wind', pending, commit=False)
+        self.assert_tree_matches_folders()
+        self.assertIn(child, self.project.get_subfolder_ids(MASTER_EVENT_FOLDER))
+
+        # Pending folders are not part of the committed hierarchy yet
+        hierarchy_ids = [fid for _, fid, _ in self.project.get_folder_hierarchy()]
+        self.assertNotIn(pending, hierarchy_ids)
+
+        self.project.commit_pending_folders()
+        hierarchy = self.project.get_folder_hierarchy()
+        self.assertIn(('Wind', child, 2), hierarchy)
+        self.assert_tree_matches_folders()
+
+        self.project.delete_folder('{folder-b}')
+        self.assertEqual(self.project.get_child_folders('{folder-a}'), [])
+
+        discarded = self.project.create_event_folder('Temp', '{folder-a}', commit=False)
+        self.project.delete_folder(discarded)
+        self.assertFalse(self.project.is_folder_pending(discarded))
+
+        self.project.create_event_folder('Temp', '{folder-a}', commit=False)
+        self.project.clear_pending_folders()
+        self.assert_tree_matches_folders()
+        self.assertEqual(self.project.get_folder_hierarchy(),
+                         reference_hierarchy(MASTER_EVENT_FOLDER, self.project.event_folders))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import random
+from pathlib import Path
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.keyword_automaton import KeywordAutomaton
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+    def test_matches_rfind(self):
+        """Test that last occurrences equal str.rfind for every keyword"""
+        rng = random.Random(8)
+        for _ in range(2000):
+            keywords = [''.join(rng.choice('abc') for _ in range(rng.randint(1, 4)))
+                        for _ in range(rng.randint(1, 10))]
+            text = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 20)))
+            automaton = KeywordAutomaton(keywords)
+
+            expected = {}
+            for index, keyword in enumerate(automaton.keywords):
+                if text.rfind(keyword) >= 0:
+                    expected[index] = text.rfind(keyword)
+            self.assertEqual(automaton.last_occurrences(text), expected, (keywords, text))
+
+    def test_add_keeps_priority_order(self):
+        """Test that added keywords come last and duplicates keep their first index"""
+        automaton = KeywordAutomaton(['stunloop', 'stun'])
+        self.assertEqual(automaton.last_occurrences('stunloop'), {0: 0, 1: 0})
+
+        automaton.add('loop', 'stun')
+        self.assertEqual(automaton.keywords, ['stunloop', 'stun', 'loop'])
+        self.assertIn('loop', automaton)
+        self.assertEqual(len(automaton), 3)
+        self.assertEqual(automaton.last_occurrences('stunloop'), {0: 0, 1: 0, 2: 4})
+
+    def test_serialization_round_trip(self):
+        """Test that a restored automaton searches like the original"""
+        automaton = KeywordAutomaton(['stunloop', 'stun', 'loop', 'op'])
+        restored = KeywordAutomaton.from_dict(automaton.to_dict())
+        for text in ('stunloop', 'loopstun', 'xxopstunlo', ''):
+            self.assertEqual(restored.last_occurrences(text), automaton.last_occurrences(text))
+
+    def test_empty_keyword_rejected(self):
+        """Test that an empty keyword raises"""
+        with self.assertRaises(ValueError):
+            KeywordAutomaton(['attack', ''])
+
+
+if __name__ == '__main__':
+    unittest.main()
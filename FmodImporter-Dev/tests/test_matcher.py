@@ -0,0 +1,146 @@
+import unittest
+import random
+from pathlib import Path
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.matcher import AudioMatcher, MatchSession, SuffixIndex
+from fmod_importer.naming import NamingPattern
+
+
+def audio_file(basename):
+    return {'basename': basename, 'filename': basename + '.wav', 'path': f'/media/{basename}.wav'}
+
+
+class TestSuffixIndex(unittest.TestCase):
+    def test_matches_linear_scan(self):
+        """Test that lookups return the first name ending with the suffix, like endswith() in order"""
+        rng = random.Random(42)
+        keys = [''.join(rng.choice('abc') for _ in range(rng.randint(0, 6))) for _ in range(300)]
+        items = [(key, f'Template_{i}') for i, key in enumerate(keys)]
+        index = SuffixIndex(items)
+
+        queries = [''.join(rng.choice('abcd') for _ in range(rng.randint(0, 7))) for _ in range(500)]
+        for query in queries:
+            expected = next((name for key, name in items if key.endswith(query)), None)
+            self.assertEqual(index.first_ending_with(query), expected, query)
+
+
+def reference_event_suffix(event_name, prefix, feature):
+    """Former per-file event suffix derivation of match_files_to_events."""
+    feature_variants = AudioMatcher.get_feature_variants(feature)
+    event_suffix = None
+    for variant in feature_variants:
+        exact_pattern = f"{prefix}_{variant}_"
+        if event_name.startswith(exact_pattern):
+            event_suffix = event_name[len(exact_pattern):]
+            break
+    if not event_suffix:
+        prefix_pattern = f"{prefix}_"
+        if event_name.startswith(prefix_pattern):
+            after_prefix = event_name[len(prefix_pattern):]
+            for variant in feature_variants:
+                variant_parts = variant.replace(' ', '_').split('_')
+                for i in range(len(variant_parts), 0, -1):
+                    partial_variant = '_'.join(variant_parts[:i]) + '_'
+                    if after_prefix.startswith(partial_variant):
+                        event_suffix = after_prefix[len(partial_variant):]
+                        break
+                if event_suffix:
+                    break
+            if not event_suffix:
+                norm_feature = AudioMatcher.normalize_string(feature)
+                parts = after_prefix.split('_')
+                for split_idx in range(1, len(parts)):
+                    if AudioMatcher.normalize_string('_'.join(parts[:split_idx])) == norm_feature:
+                        event_suffix = '_'.join(parts[split_idx:])
+                        break
+    return event_suffix
+
+
+def reference_best_match(extracted_suffix, expected_events, prefix, feature):
+    """Former per-file x per-event scoring loop."""
+    best_match, best_score = None, 0.0
+    for event_name in expected_events:
+        event_suffix = reference_event_suffix(event_name, prefix, feature)
+        if event_suffix:
+            score = AudioMatcher.calculate_similarity(extracted_suffix, event_suffix)
+            if score > best_score and score >= 0.7:
+                best_score, best_match = score, event_name
+    return best_match, best_score
+
+
+class TestMatchSession(unittest.TestCase):
+    def test_matches_pairwise_scoring(self):
+        """Test that indexed matching picks the same event and score as scoring every pair"""
+        rng = random.Random(7)
+        words = ['Attack', 'attack', 'Attack_A', 'AttackA', 'Stun_Loop', 'StunLoop', 'Stun', 'Loop',
+                 'Hit', 'Hits', 'tih', 'A', 'B', '', 'Death_01']
+        features = ['Strong Repair', 'Strong_Repair', 'StrongRepair', 'Strong', 'Weak']
+
+        for _ in range(20):
+            feature = rng.choice(features)
+            expected_events = {}
+            for _ in range(rng.randint(0, 25)):
+                name = f"Cat_{rng.choice(features).replace(' ', rng.choice(['_', ' ', '']))}_"
+                name += '_'.join(rng.choice(words) for _ in range(rng.randint(1, 2)))
+                expected_events[name] = {}
+            session = MatchSession('Cat', feature, expected_events)
+
+            for _ in range(40):
+                suffix = '_'.join(rng.choice(words) for _ in range(rng.randint(1, 2))) or 'x'
+                self.assertEqual(session.best_match(suffix),
+                                 reference_best_match(suffix, expected_events, 'Cat', feature),
+                                 (feature, suffix, list(expected_events)))
+
+    def test_event_suffix_derivation(self):
+        """Test event suffix extraction, including fall-through on empty suffixes"""
+        for event_name in ('Cat_Strong_Repair_Attack', 'Cat_StrongRepair_Attack', 'Cat_Strong_Attack',
+                           'Cat_Strong_Repair_', 'Cat_Strong__Hit', 'Dog_Strong_Repair_Attack',
+                           'Cat_strong_repair_Hit', 'Cat_Strong_Repair'):
+            self.assertEqual(
+                AudioMatcher.extract_suffix_from_event_name(event_name, 'Cat', 'Strong Repair') or None,
+                reference_event_suffix(event_name, 'Cat', 'Strong Repair') or None, event_name)
+
+    def test_match_files_to_events(self):
+        """Test grouping with expected events and the auto-generated fallback"""
+        expected_events = {'Cat_Boss_Attack': {}, 'Cat_Boss_Stun_Loop': {}}
+        files = [audio_file('Cat_Boss_Attack_01'), audio_file('Cat_Boss_StunLoop'),
+                 audio_file('Cat_Boss_Dance')]
+
+        groups = AudioMatcher.match_files_to_events(files, 'Cat', 'Boss', expected_events)
+
+        self.assertEqual(groups['Cat_Boss_Attack'], {'files': [files[0]], 'confidence': 1.0})
+        self.assertEqual(groups['Cat_Boss_Stun_Loop'], {'files': [files[1]], 'confidence': 0.95})
+        self.assertEqual(groups['Cat_Boss_Dance'], {'files': [files[2]], 'confidence': 0.5})
+
+
+class TestMatchFilesWithPattern(unittest.TestCase):
+    def test_suffix_fallback_picks_first_template(self):
+        """Test the template suffix fallback (Try 3) and its priority order"""
+        parse_pattern = NamingPattern("$prefix_$feature_$action")
+        build_pattern = NamingPattern("$prefix$feature$action")
+        user_values = {'prefix': 'Cat', 'feature': 'Boss'}
+        expected_events = {
+            'TemplateHeavyStunLoop': {},
+            'TemplateStunLoop': {},
+            'TemplateAttack': {},
+        }
+        files = [audio_file('Cat_Boss_Stun_Loop_01'), audio_file('Cat_Boss_Attack'),
+                 audio_file('Cat_Boss_Dance'), audio_file('Dog_Other')]
+
+        groups, unmatched = AudioMatcher.match_files_with_pattern(
+            files, parse_pattern, build_pattern, user_values, expected_events
+        )
+
+        self.assertEqual(groups['CatBossStunLoop']['matched_template'], 'TemplateHeavyStunLoop')
+        self.assertEqual(groups['CatBossStunLoop']['confidence'], 0.92)
+        self.assertEqual(groups['CatBossAttack']['matched_template'], 'TemplateAttack')
+        self.assertFalse(groups['CatBossDance']['from_template'])
+        self.assertEqual(unmatched, [files[3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
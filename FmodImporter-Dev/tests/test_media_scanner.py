@@ -0,0 +1,187 @@
+import unittest
+import tempfile
+import shutil
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer import media_scanner
+from fmod_importer.matcher import AudioMatcher
+from fmod_importer.media_scanner import scan_audio_files, MediaScanCache
+
+
+def walk_reference(directory, recursive):
+    """Former os.walk/os.scandir implementation of collect_audio_files."""
+    audio_extensions = {'.wav', '.mp3', '.ogg', '.flac', '.aif', '.aiff'}
+    files = []
+    if recursive:
+        for root, _, filenames in os.walk(directory):
+            for filename in filenames:
+                if Path(filename).suffix.lower() in audio_extensions:
+                    files.append({'path': str(Path(root) / filename), 'filename': filename,
+                                  'basename': Path(filename).stem})
+    elif os.path.exists(directory):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and Path(entry.name).suffix.lower() in audio_extensions:
+                    files.append({'path': str(Path(entry.path)), 'filename': entry.name,
+                                  'basename': Path(entry.name).stem})
+    return files
+
+
+class TestMediaScanner(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.media = self.test_dir / "media"
+        names = ['Cat_Attack_01.wav', 'Cat_Attack_02.WAV', 'Dog.Bark.mp3', 'notes.txt',
+                 '.wav', 'trailing.', 'music.flac', 'voice.aiff']
+        for sub in ('', 'Characters', 'Characters/Cat', 'Characters/Dog', 'Ambience',
+                    'Ambience/Wind/Deep', 'Empty'):
+            folder = self.media / sub
+            folder.mkdir(parents=True, exist_ok=True)
+            for name in names[:len(sub) % len(names) + 3]:
+                (folder / name).write_bytes(b'')
+        (self.media / "folder.wav").mkdir()  # Directory with an audio extension
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_matches_sequential_walk(self):
+        """Test that the parallel scan returns exactly the former walk results, in order"""
+        for recursive in (False, True):
+            for directory in (str(self.media), str(self.media) + os.sep):
+                with self.subTest(recursive=recursive, directory=directory):
+                    self.assertEqual(AudioMatcher.collect_audio_files(directory, recursive=recursive),
+                                     walk_reference(directory, recursive))
+
+    def test_relative_directory(self):
+        """Test paths when scanning the current directory"""
+        cwd = os.getcwd()
+        os.chdir(self.media)
+        try:
+            self.assertEqual(AudioMatcher.collect_audio_files('.', recursive=True),
+                             walk_reference('.', True))
+        finally:
+            os.chdir(cwd)
+
+    def test_batches(self):
+        """Test that results are split into batches of at most batch_size"""
+        batches = list(scan_audio_files(str(self.media), recursive=True, workers=3, batch_size=4))
+        self.assertTrue(all(0 < len(batch) <= 4 for batch in batches))
+        self.assertEqual([f for batch in batches for f in batch],
+                         walk_reference(str(self.media), True))
+
+    def test_early_stop_and_missing_directory(self):
+        """Test that a consumer can stop early and a missing directory yields nothing"""
+        scan = scan_audio_files(str(self.media), recursive=True, batch_size=1)
+        self.assertEqual(len(next(scan)), 1)
+        scan.close()
+
+        self.assertEqual(list(scan_audio_files(str(self.test_dir / "missing"), recursive=True)), [])
+
+
+
+class TestMediaScanCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.media = self.test_dir / "media"
+        for sub in ('Characters/Cat', 'Characters/Dog', 'Ambience'):
+            folder = self.media / sub
+            folder.mkdir(parents=True)
+            for i in range(3):
+                (folder / f"{folder.name}_{i}.wav").write_bytes(b'x')
+        self.cache_file = self.test_dir / "cache" / "media.json"
+        self._settle()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _settle(self):
+        """Age every directory mtime past the racy window."""
+        old = time.time() - 60
+        for root, _, _ in os.walk(self.media):
+            os.utime(root, (old, old))
+
+    def _scan(self, **kwargs):
+        cache = MediaScanCache(str(self.media), recursive=True, cache_file=self.cache_file)
+        result = cache.scan(**kwargs)
+        cache.save()
+        return result
+
+    def test_first_scan_matches_walk(self):
+        """Test that a cold scan returns the walk results and reports everything as added"""
+        files, diff = self._scan()
+        self.assertEqual(files, walk_reference(str(self.media), True))
+        self.assertEqual(sorted(diff.added), sorted(f['path'] for f in files))
+        self.assertEqual((diff.removed, diff.modified), ([], []))
+
+    def test_unchanged_directories_are_not_listed(self):
+        """Test that a warm re-scan lists nothing and reports no changes"""
+        self._scan()
+        with mock.patch.object(media_scanner.os, 'scandir') as scandir:
+            files, diff = self._scan()
+        scandir.assert_not_called()
+        self.assertFalse(diff)
+        self.assertEqual(files, walk_reference(str(self.media), True))
+
+    def test_diff(self):
+        """Test added, removed and modified files, including a removed directory"""
+        self._scan()
+        (self.media / "Characters" / "Cat" / "Cat_9.wav").write_bytes(b'new')
+        (self.media / "Characters" / "Dog" / "Dog_0.wav").unlink()
+        shutil.rmtree(self.media / "Ambience")
+        modified = self.media / "Characters" / "Dog" / "Dog_1.wav"
+        modified.write_bytes(b'longer content')
+        self._settle()
+
+        files, diff = self._scan()
+        self.assertEqual(files, walk_reference(str(self.media), True))
+        self.assertEqual(diff.added, [str(self.media / "Characters" / "Cat" / "Cat_9.wav")])
+        self.assertEqual(sorted(diff.removed), sorted(
+            [str(self.media / "Characters" / "Dog" / "Dog_0.wav")] +
+            [str(self.media / "Ambience" / f"Ambience_{i}.wav") for i in range(3)]))
+        self.assertEqual(diff.modified, [str(modified)])
+
+    def test_modified_in_unchanged_directory(self):
+        """Test that detect_modified catches content changes that leave the directory mtime alone"""
+        self._scan()
+        modified = self.media / "Ambience" / "Ambience_2.wav"
+        modified.write_bytes(b'changed')  # Rewriting a file leaves its directory mtime alone
+
+        self.assertFalse(self._scan()[1])
+        self.assertEqual(self._scan(detect_modified=True)[1].modified, [str(modified)])
+
+    def test_mutated_results_do_not_leak_into_cache(self):
+        """Test that callers mutating scan results leave later re-scans intact"""
+        cache = MediaScanCache(str(self.media), recursive=True)
+        files, _ = cache.scan()
+        for file_info in files:
+            file_info['basename'] = 'changed'
+            file_info['path'] = ''
+
+        files, diff = cache.scan()
+        self.assertFalse(diff)
+        self.assertEqual(files, walk_reference(str(self.media), True))
+
+    def test_racy_directory_is_relisted(self):
+        """Test that a directory modified just before the scan is listed again next time"""
+        ambience = self.media / "Ambience"
+        os.utime(ambience)  # mtime = now
+        mtime = os.stat(ambience).st_mtime_ns
+        self._scan()
+
+        # A change within the same coarse timestamp tick leaves the mtime as it was
+        (ambience / "Ambience_9.wav").write_bytes(b'x')
+        os.utime(ambience, ns=(mtime, mtime))
+
+        files, diff = self._scan()
+        self.assertIn(str(self.media / "Ambience" / "Ambience_9.wav"), diff.added)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,83 @@
 import unittest
+import os
+import random
+import re
 import sys
 from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path to allow import
 sys.path.append(str(Path(__file__).parent.parent))
 
+from fmod_importer import name_parser
 from fmod_importer.naming import NamingPattern, normalize_for_comparison
 
+
+def reference_extract_action(pattern, name, prefix, feature):
+    """Former per-name implementation of extract_action_generic."""
+    if '.' in name:
+        name = os.path.splitext(name)[0]
+    name = pattern._strip_iterator(name)
+    name_lower, prefix_lower = name.lower(), prefix.lower()
+    feature_normalized = normalize_for_comparison(feature)
+    if name_lower.startswith(prefix_lower + '_') or name_lower.startswith(prefix_lower + '-'):
+        remaining = name[len(prefix) + 1:]
+    elif name_lower.startswith(prefix_lower):
+        remaining = name[len(prefix):]
+    else:
+        return None
+    if not remaining:
+        return None
+    parts = [p for p in remaining.replace('-', '_').replace(' ', '_').split('_') if p]
+    for i in range(1, len(parts) + 1):
+        if normalize_for_comparison('_'.join(parts[:i])) == feature_normalized:
+            if parts[i:]:
+                return '_'.join(parts[i:])
+            break
+    if normalize_for_comparison(remaining).startswith(feature_normalized):
+        norm_pos = orig_pos = 0
+        while norm_pos < len(feature_normalized) and orig_pos < len(remaining):
+            if remaining[orig_pos] not in '_- ':
+                norm_pos += 1
+            orig_pos += 1
+        return remaining[orig_pos:].lstrip('_- ') or None
+    return None
+
+
+def reference_extract_action_fuzzy(name, keywords=NamingPattern.ACTION_KEYWORDS):
+    """Former per-keyword rfind implementation of extract_action_fuzzy."""
+    name_lower = name.lower()
+    for base_action in keywords:
+        action_lower = base_action.lower()
+        pos = name_lower.rfind(action_lower)
+        if pos == -1:
+            continue
+        action_end = pos + len(action_lower)
+        remaining = name[action_end:]
+        if pos > 0:
+            char_before = name[pos - 1]
+            if char_before == '_' or (char_before.islower() and name[pos].isupper()):
+                pass
+            elif char_before.isalnum():
+                continue
+        suffix_match = re.match(r'^([_]?[A-Za-z0-9])(?:[_]|$|\.)', remaining)
+        if suffix_match:
+            return name[pos:action_end] + suffix_match.group(1)
+        elif remaining == '' or remaining.startswith('_') or remaining.startswith('.'):
+            return name[pos:action_end]
+    return None
+
+
+def random_names(rng, count):
+    words = ['Mecha', 'mecha', 'Strong', 'Repair', 'strong', 'Attack', 'Stun', 'Loop', 'A', '01', '2',
+             'Ç', 'İdle', 'ΑΣ', '٣', '²', '']
+    separators = ['_', '-', ' ', '', '__', '_-']
+    names = []
+    for _ in range(count):
+        name = ''.join(rng.choice(words) + rng.choice(separators) for _ in range(rng.randint(1, 6)))
+        names.append(name + rng.choice(['', '.wav', '_03', '.x', '_1\n']))
+    return names
+
 class TestNamingPattern(unittest.TestCase):
     def test_basic_parsing_simple(self):
         """Test parsing simple pattern $prefix_$feature_$action with single-word components"""
@@ -116,6 +187,57 @@ class TestNamingPattern(unittest.TestCase):
         action = pattern.extract_action_generic(filename, prefix, feature)
         self.assertEqual(action, "Attack")
 
+    def test_parse_many_matches_per_name_parsing(self):
+        """Test that batch parsing gives the same results as the former per-name extraction"""
+        rng = random.Random(21)
+        pattern = NamingPattern("$prefix_$feature_$action")
+        names = random_names(rng, 3000)
+        for prefix, feature in [('Mecha', 'StrongRepair'), ('mecha', 'Strong_Repair'), ('Mecha', 'Strong Repair'),
+                                ('Mecha', 'Strong-Repair'), ('', 'Strong'), ('Mecha', ''), ('İ', 'ΑΣ')]:
+            user_values = {'prefix': prefix, 'feature': feature}
+            results = pattern.parse_many(names, user_values)
+            self.assertEqual(len(results), len(names))
+            for name, result in zip(names, results):
+                action = reference_extract_action(pattern, name, prefix, feature)
+                expected = {'prefix': prefix, 'feature': feature, 'action': action} if action else None
+                self.assertEqual(result, expected, (name, prefix, feature))
+                self.assertEqual(pattern.parse_asset_fuzzy(name, user_values), expected)
+
+    def test_parse_many_process_pool(self):
+        """Test that chunked parsing on a process pool keeps order and results"""
+        pattern = NamingPattern("$prefix_$feature_$action")
+        names = random_names(random.Random(4), 500)
+        user_values = {'prefix': 'Mecha', 'feature': 'Strong_Repair'}
+
+        with mock.patch.object(name_parser, 'PARALLEL_MIN_NAMES', 10):
+            parallel = pattern.parse_many(names, user_values, workers=2)
+        self.assertEqual(parallel, pattern.parse_many(names, user_values))
+
+    def test_extract_action_fuzzy_matches_keyword_scan(self):
+        """Test that the keyword automaton finds the same action as scanning keyword by keyword"""
+        rng = random.Random(22)
+        pattern = NamingPattern("$prefix_$feature_$action")
+        pieces = ['Mecha', 'Flora', 'Stun', 'stun', 'Loop', 'End', 'Idle', 'Animation', 'Attack', 'Hit', 'VFX',
+                  'Heal', 'Run', 'Runner', 'A', 'b', '1', '_', '_', '-', '.', ' ', 'É']
+        for _ in range(3000):
+            name = ''.join(rng.choice(pieces) for _ in range(rng.randint(1, 7)))
+            self.assertEqual(pattern.extract_action_fuzzy(name), reference_extract_action_fuzzy(name), name)
+
+        self.assertEqual(pattern.extract_action_fuzzy("MechafloraStrongRepairIdleA"), "IdleA")
+        self.assertEqual(pattern.extract_action_fuzzy("Mechaflora_Strong_Repair_Stun_Loop"), "Loop")
+        self.assertEqual(pattern.extract_action_fuzzy("Mechaflora_StunLoop_A"), "StunLoop_A")
+
+    def test_extract_action_fuzzy_custom_keywords(self):
+        """Test that a pattern can use its own action keywords"""
+        keywords = ['Grapple', 'Hit']
+        pattern = NamingPattern("$prefix_$feature_$action", action_keywords=keywords)
+        for name in ("Mechaflora_Boss_Grapple_B", "BossGrappleHit", "Boss_Attack", "Boss_Hit_Grapple"):
+            self.assertEqual(pattern.extract_action_fuzzy(name),
+                             reference_extract_action_fuzzy(name, keywords), name)
+        self.assertEqual(pattern.extract_action_fuzzy("Mechaflora_Boss_Grapple_B"), "Grapple_B")
+        self.assertIsNone(pattern.extract_action_fuzzy("Boss_Attack"))
+        self.assertIs(NamingPattern("$prefix_$action").action_automaton, NamingPattern.ACTION_AUTOMATON)
+
     def test_build_name(self):
         """Test building event name from components"""
         pattern = NamingPattern("$prefix_$feature_$action")
@@ -0,0 +1,103 @@
+import unittest
+import random
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.gui.preset_resolver import PresetResolver
+from tests.project_fixture import ProjectTestCase, MASTER_EVENT_FOLDER, MASTER_BUS
+
+
+def reference_folder_path(project, folder_id):
+    """Former get_folder_path: walks up a fresh merge of all folders."""
+    all_folders = project.get_all_event_folders()
+    path_parts = []
+    current_id = folder_id
+    master_id = project.workspace.get('masterEventFolder')
+    while current_id and current_id in all_folders and current_id != master_id:
+        path_parts.insert(0, all_folders[current_id].get('name', ''))
+        current_id = all_folders[current_id].get('parent')
+    return '/'.join(path_parts)
+
+
+def reference_find_folder(project, path):
+    """Former find_folder_by_path: builds the path of every folder."""
+    for folder_id in project.get_all_event_folders():
+        if reference_folder_path(project, folder_id) == path:
+            return folder_id
+    return None
+
+
+class TestPresetResolver(ProjectTestCase):
+    def add_random_folders(self, rng, count):
+        folder_ids = list(self.project.get_all_event_folders())
+        for _ in range(count):
+            parent = rng.choice(folder_ids)
+            name = rng.choice(['Boss', 'Cat', 'Dog', 'Loop', 'Idle'])
+            folder_ids.append(self.project.create_event_folder(name, parent, commit=False))
+        return folder_ids
+
+    def test_folder_paths_match_full_scan(self):
+        """Test indexed folder paths and path lookups against the former scans"""
+        rng = random.Random(2)
+        folder_ids = self.add_random_folders(rng, 300)
+        resolver = PresetResolver(self.project)
+
+        for folder_id in folder_ids:
+            path = reference_folder_path(self.project, folder_id)
+            self.assertEqual(resolver.get_folder_path(folder_id), path)
+            self.assertEqual(resolver.find_folder_by_path(path or 'missing'),
+                             reference_find_folder(self.project, path or 'missing'))
+
+    def test_folder_hierarchy_is_created_once_per_session(self):
+        """Test that created folders are reused by later lookups of the session"""
+        resolver = PresetResolver(self.project)
+
+        with mock.patch.object(self.project, 'get_all_event_folders',
+                               wraps=self.project.get_all_event_folders) as get_all:
+            new_id = resolver.resolve_folder_reference({'id': '{gone}', 'path': 'Characters/Boss/Phase2/Attack'})
+            self.assertEqual(resolver.resolve_folder_reference({'path': 'Characters/Boss/Phase2/Attack'}), new_id)
+            phase2 = resolver.create_folder_hierarchy('Characters/Boss/Phase2')
+            self.assertEqual(get_all.call_count, 1)  # Index built once for the session
+
+        self.assertEqual(self.project.get_all_event_folders()[new_id]['parent'], phase2)
+        self.assertEqual(len(self.project._pending_manager.get_pending_event_folder_ids()), 2)
+        self.assertEqual(resolver.find_folder_by_path('Characters/Boss'), '{folder-b}')
+        self.assertEqual(PresetResolver(self.project).find_folder_by_path('Characters/Boss/Phase2/Attack'),
+                         new_id)
+        self.assertEqual(reference_folder_path(self.project, new_id), 'Characters/Boss/Phase2/Attack')
+
+    def test_banks_buses_and_assets(self):
+        """Test name and path resolution, including items created by the session"""
+        resolver = PresetResolver(self.project)
+
+        self.assertEqual(resolver.resolve_bank_reference({'id': '{gone}', 'name': 'SFX'}), '{bank-1}')
+        self.assertEqual(resolver.get_bank_path('{bank-1}'), 'SFX')
+        music = resolver.resolve_bank_reference({'name': 'Music'})
+        self.assertEqual(resolver.resolve_bank_reference({'name': 'Music'}), music)
+        self.assertEqual(resolver.get_bank_data(music)['name'], 'Music')
+
+        self.assertEqual(resolver.get_bus_path(MASTER_BUS), 'bus:/')
+        self.assertEqual(resolver.resolve_bus_reference({'path': 'bus:/Creatures'}), '{bus-1}')
+        ui_bus = resolver.resolve_bus_reference({'path': 'bus:/UI'})
+        self.assertEqual(resolver.resolve_bus_reference({'path': 'bus:/UI'}), ui_bus)
+        self.assertEqual(resolver.get_bus_path(ui_bus), 'bus:/UI')
+
+        self.assertEqual(resolver.resolve_asset_folder_reference({'path': 'Characters/'}), '{asset-1}')
+        boss = resolver.resolve_asset_folder_reference({'path': 'Characters/Boss/'})
+        self.assertEqual(resolver.resolve_asset_folder_reference({'path': 'Characters/Boss/'}), boss)
+        self.assertEqual(self.project.get_all_asset_folders()[boss]['path'], 'Characters/Boss/')
+
+        # A new session sees the same pending items
+        fresh = PresetResolver(self.project)
+        self.assertEqual(fresh.resolve_bank_reference({'name': 'Music'}), music)
+        self.assertEqual(fresh.resolve_bus_reference({'path': 'bus:/UI'}), ui_bus)
+        self.assertEqual(fresh.get_asset_folder_data(boss)['path'], 'Characters/Boss/')
+        self.assertEqual(fresh.get_folder_data(MASTER_EVENT_FOLDER)['name'], 'Master')
+
+
+if __name__ == '__main__':
+    unittest.main()
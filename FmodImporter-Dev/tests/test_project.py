@@ -0,0 +1,43 @@
+import unittest
+import os
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer import project as project_module
+from tests.project_fixture import ProjectTestCase, write_workspace
+
+
+class TestProjectWorkspace(ProjectTestCase):
+    def test_version_is_captured_at_load(self):
+        """Test that the model is read once and not re-parsed per call"""
+        with mock.patch.object(project_module, 'read_serialization_model') as reader:
+            for _ in range(100):
+                self.assertEqual(self.project.get_serialization_model_string(), "Studio.02.02.00")
+                self.assertEqual(self.project.get_project_version(), "02.02.00")
+
+        reader.assert_not_called()
+
+    def test_version_reloads_when_workspace_changes(self):
+        """Test that a modified Workspace.xml invalidates the cached model"""
+        workspace_file = self.metadata_path / "Workspace.xml"
+        write_workspace(self.metadata_path, model="Studio.02.03.00")
+        stat = workspace_file.stat()
+        os.utime(workspace_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(self.project.serialization_model, "Studio.02.03.00")
+        self.assertEqual(self.project.project_version, "02.03.00")
+
+    def test_missing_workspace_falls_back_to_default(self):
+        """Test the default model when Workspace.xml disappears"""
+        (self.metadata_path / "Workspace.xml").unlink()
+
+        self.assertIsNone(self.project.get_project_version())
+        self.assertEqual(self.project.get_serialization_model_string(), "Studio.02.02.00")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import random
+from pathlib import Path
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.matcher import AudioMatcher
+from fmod_importer.similarity import (
+    EditDistanceScorer, SimilarityScorer, edit_distance, edit_similarity, suffix_similarity
+)
+
+
+def full_distance(a, b, transpositions):
+    """Unbounded optimal string alignment distance, computed on the whole matrix."""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1,
+                          d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if (transpositions and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+def random_word(rng, alphabet='abcd', max_len=8):
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+
+
+class TestEditDistance(unittest.TestCase):
+    def test_matches_full_matrix(self):
+        """Test the banded distance against the full dynamic programming matrix"""
+        rng = random.Random(3)
+        for _ in range(2000):
+            a, b = random_word(rng), random_word(rng)
+            transpositions = rng.random() < 0.5
+            expected = full_distance(a, b, transpositions)
+            self.assertEqual(edit_distance(a, b, transpositions=transpositions), expected, (a, b))
+
+            max_distance = rng.randint(0, 5)
+            bounded = edit_distance(a, b, max_distance, transpositions)
+            self.assertEqual(bounded, expected if expected <= max_distance else max_distance + 1,
+                             (a, b, max_distance))
+
+    def test_transpositions(self):
+        """Test that an adjacent swap is one edit only with transpositions"""
+        self.assertEqual(edit_distance('reload', 'relaod'), 2)
+        self.assertEqual(edit_distance('reload', 'relaod', transpositions=True), 1)
+        self.assertEqual(edit_distance('', 'abc'), 3)
+        self.assertEqual(edit_similarity('', ''), 1.0)
+        self.assertAlmostEqual(edit_similarity('attack', 'atack'), 5 / 6)
+
+
+class TestSuffixSimilarity(unittest.TestCase):
+    def test_tiers(self):
+        """Test the score tiers from exact match down to edit distance"""
+        self.assertEqual(suffix_similarity('Attack_A', 'Attack_A'), 1.0)
+        self.assertEqual(suffix_similarity('Attack_A', 'AttackA'), 0.95)
+        self.assertEqual(suffix_similarity('Attack', 'AttackA'), 0.92)
+        self.assertAlmostEqual(suffix_similarity('Stun', 'Stun_Loop'), 4 / 8 * 0.9)
+        self.assertAlmostEqual(suffix_similarity('Reload', 'Relaod'), 5 / 6 * 0.9)
+        self.assertAlmostEqual(suffix_similarity('Attack', 'Atack_B'), 4 / 6 * 0.9)
+        self.assertEqual(AudioMatcher.calculate_similarity('Attack', 'Atack'), suffix_similarity('Attack', 'Atack'))
+
+    def test_typos_match_unrelated_do_not(self):
+        """Test that single typos pass the 0.7 threshold and unrelated suffixes do not"""
+        self.assertGreaterEqual(suffix_similarity('Footstep_Grass', 'Footstep_Gras'), 0.7)
+        self.assertGreaterEqual(suffix_similarity('Explosion', 'Explsoion'), 0.7)
+        self.assertLess(suffix_similarity('Stun_Loop', 'Loop_Stun'), 0.7)
+        self.assertLess(suffix_similarity('Hit', 'Hut'), 0.7)
+
+    def test_min_score_is_exact_above_threshold(self):
+        """Test that a bounded score is exact whenever it reaches min_score"""
+        rng = random.Random(5)
+        for _ in range(2000):
+            a, b = random_word(rng, 'ab_A', 10), random_word(rng, 'ab_A', 10)
+            min_score = rng.choice([0.0, 0.5, 0.7, 0.8])
+            full = suffix_similarity(a, b)
+            bounded = suffix_similarity(a, b, min_score)
+            if full >= min_score:
+                self.assertEqual(bounded, full, (a, b, min_score))
+            else:
+                self.assertLess(bounded, min_score, (a, b, min_score))
+
+
+class TestScorers(unittest.TestCase):
+    def test_batch_matches_pairwise(self):
+        """Test that the pruned batch match equals scoring every candidate"""
+        rng = random.Random(11)
+        pairwise = SimilarityScorer(suffix_similarity)
+        scorer = EditDistanceScorer()
+        for _ in range(200):
+            candidates = [random_word(rng, 'abcA_', 9) for _ in range(rng.randint(0, 30))]
+            for _ in range(10):
+                query = random_word(rng, 'abcA_', 9)
+                self.assertEqual(scorer.best_match(query, candidates),
+                                 pairwise.best_match(query, candidates), (query, candidates))
+        self.assertEqual(pairwise.score_many('ab', ['ab', 'a_b']), [1.0, 0.95])
+
+    def test_custom_scorer_in_match_files_to_events(self):
+        """Test that match_files_to_events uses a plugged-in scorer"""
+        expected_events = {'Cat_Boss_Attack': {}, 'Cat_Boss_Stun': {}}
+        files = [{'basename': 'Cat_Boss_Attack', 'filename': 'Cat_Boss_Attack.wav', 'path': 'a.wav'}]
+        first_letter = SimilarityScorer(lambda a, b: 0.8 if a[0] == b[0] else 0.0)
+
+        groups = AudioMatcher.match_files_to_events(files, 'Cat', 'Boss', expected_events, first_letter)
+        self.assertEqual(groups, {'Cat_Boss_Attack': {'files': files, 'confidence': 0.8}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import unittest
+import tempfile
+import shutil
+import os
+import re
+import uuid
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core import template_cache
+from fmod_importer.core.template_cache import TemplateCache
+from fmod_importer.core.event_creator import EventCreator
+from fmod_importer.core.import_plan import ImportPlan
+from fmod_importer.core.xml_loader import XMLLoader
+from tests.project_fixture import make_project, _write, _object, MASTER_BUS
+
+TEMPLATE_ID = '{tmpl-01}'
+
+
+def write_template(metadata: Path, name: str = 'Template'):
+    """Write a template event with internal and external references."""
+    body = (
+        _object('Event', TEMPLATE_ID, {'name': name},
+                {'folder': '{folder-b}', 'banks': '{old-bank}',
+                 'mixer': '{mixer-01}', 'mixerInput': '{input-01}'}) +
+        _object('EventMixer', '{mixer-01}', rels={'masterBus': '{master-01}'}) +
+        _object('EventMixerMaster', '{master-01}', {'name': 'Master', 'volume': '-3'},
+                {'mixer': '{mixer-01}'}) +
+        _object('MixerInput', '{input-01}', rels={'output': MASTER_BUS,
+                                                  'effectChain': '{external}'})
+    )
+    _write(metadata / "Event" / f"{TEMPLATE_ID}.xml", body)
+
+
+def deep_copy_reference(template_root, new_event_id, new_name, folder_id, bank_id, bus_id):
+    """Former two-pass deep copy of copy_from_template, used as the reference output."""
+    new_root = ET.Element('objects')
+    id_map = {obj.get('id'): f"{{new-{i}}}" for i, obj in enumerate(template_root.findall(".//object"))}
+    event_obj = template_root.find(".//object[@class='Event']")
+    if event_obj is not None:
+        id_map[event_obj.get('id')] = new_event_id
+
+    for obj in template_root.findall(".//object"):
+        new_obj = ET.SubElement(new_root, 'object', {'class': obj.get('class'), 'id': id_map[obj.get('id')]})
+        for prop in obj.findall('property'):
+            if obj.get('class') == 'EventMixerMaster' and prop.get('name') == 'name':
+                continue
+            new_prop = ET.SubElement(new_obj, 'property', name=prop.get('name'))
+            value_elem = prop.find('value')
+            if value_elem is not None:
+                is_name = obj.get('class') == 'Event' and prop.get('name') == 'name'
+                ET.SubElement(new_prop, 'value').text = new_name if is_name else value_elem.text
+        for rel in obj.findall('relationship'):
+            new_rel = ET.SubElement(new_obj, 'relationship', name=rel.get('name'))
+            override = {('Event', 'folder'): folder_id, ('Event', 'banks'): bank_id,
+                        ('MixerInput', 'output'): bus_id}.get((obj.get('class'), rel.get('name')))
+            if override is not None:
+                ET.SubElement(new_rel, 'destination').text = override
+                continue
+            for dest_elem in rel.findall('destination'):
+                ET.SubElement(new_rel, 'destination').text = id_map.get(dest_elem.text, dest_elem.text)
+    return new_root
+
+
+def canonical(root):
+    """Serialize a tree with generated UUIDs renamed in order of appearance."""
+    xml_str = ET.tostring(root, encoding='unicode')
+    names = {}
+    return re.sub(r'\{(new-\d+|[0-9a-f]{8}-[0-9a-f-]{27})\}',
+                  lambda m: names.setdefault(m.group(0), f"{{id-{len(names)}}}"), xml_str)
+
+
+class TestTemplateCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.project_file = make_project(self.test_dir)
+        self.metadata_path = self.test_dir / "Metadata"
+        self.workspace = XMLLoader(self.metadata_path).load_workspace()
+        write_template(self.metadata_path)
+
+        EventCreator.template_cache.clear()
+        self.plan = ImportPlan()
+
+    def tearDown(self):
+        EventCreator.template_cache.clear()
+        shutil.rmtree(self.test_dir)
+
+    def _copy(self, name):
+        EventCreator.copy_from_template(
+            TEMPLATE_ID, name, '{folder-a}', '{bank-1}', '{bus-1}', [], 'Characters/',
+            self.metadata_path, self.project_file, self.workspace, plan=self.plan
+        )
+        return self.plan.xml_writes[-1][0]
+
+    def test_template_parsed_once(self):
+        """Test that repeated copies reuse the parsed template"""
+        with mock.patch.object(template_cache.ET, 'parse', wraps=ET.parse) as parse:
+            for i in range(20):
+                self._copy(f'Event_{i}')
+
+        self.assertEqual(parse.call_count, 1)
+
+    def test_modified_template_is_reparsed(self):
+        """Test that a changed template file invalidates the cache entry"""
+        self._copy('First')
+
+        template_file = self.metadata_path / "Event" / f"{TEMPLATE_ID}.xml"
+        write_template(self.metadata_path, name='Changed')
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with mock.patch.object(template_cache.ET, 'parse', wraps=ET.parse) as parse:
+            self._copy('Second')
+        self.assertEqual(parse.call_count, 1)
+
+    def test_copy_structure(self):
+        """Test overrides and ID remapping of a cached copy"""
+        root = self._copy('Cat_Attack')
+        objects = root.findall('object')
+        self.assertEqual([o.get('class') for o in objects],
+                         ['Event', 'EventMixer', 'EventMixerMaster', 'MixerInput'])
+
+        event, mixer, master, mixer_input = objects
+        ids = {o.get('id') for o in objects}
+        self.assertEqual(len(ids), 4)
+        self.assertFalse(ids & {TEMPLATE_ID, '{mixer-01}', '{master-01}', '{input-01}'})
+
+        def dest(obj, name):
+            return obj.find(f"relationship[@name='{name}']/destination").text
+
+        self.assertEqual(event.find("property[@name='name']/value").text, 'Cat_Attack')
+        self.assertEqual(dest(event, 'folder'), '{folder-a}')
+        self.assertEqual(dest(event, 'banks'), '{bank-1}')
+        self.assertEqual(dest(event, 'mixer'), mixer.get('id'))
+        self.assertEqual(dest(master, 'mixer'), mixer.get('id'))
+        self.assertEqual(dest(mixer_input, 'output'), '{bus-1}')
+        self.assertEqual(dest(mixer_input, 'effectChain'), '{external}')
+
+        # EventMixerMaster loses its name, keeps other properties
+        self.assertEqual([p.get('name') for p in master.findall('property')], ['volume'])
+
+    def test_clone_plan_matches_deep_copy(self):
+        """Test that the compiled clone plan emits the same tree as the former deep copy"""
+        template_file = self.metadata_path / "Event" / f"{TEMPLATE_ID}.xml"
+        template_root = ET.parse(template_file).getroot()
+
+        copied = ET.Element('objects')
+        template_cache.ParsedTemplate(template_root).clone_plan.instantiate(
+            copied, '{event}', 'Cat_Attack', '{folder-a}', '{bank-1}', '{bus-1}'
+        )
+        expected = deep_copy_reference(template_root, '{event}', 'Cat_Attack',
+                                       '{folder-a}', '{bank-1}', '{bus-1}')
+
+        self.assertEqual(canonical(copied), canonical(expected))
+
+    def test_new_ids_are_version_4(self):
+        """Test that batch-generated IDs are valid, unique version 4 UUIDs"""
+        ids = template_cache.new_ids(500)
+        self.assertEqual(len(set(ids)), 500)
+        for new_id in ids:
+            parsed = uuid.UUID(new_id)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+            self.assertEqual(new_id, "{" + str(parsed) + "}")
+
+    def test_lru_eviction(self):
+        """Test that the least recently used template is evicted"""
+        cache = TemplateCache(max_size=2)
+        paths = {}
+        for template_id in ('{a}', '{b}', '{c}'):
+            path = self.test_dir / f"{template_id}.xml"
+            path.write_text('<objects><object class="Event" id="x"/></objects>', encoding='utf-8')
+            paths[template_id] = path
+
+        cache.get('{a}', paths['{a}'])
+        cache.get('{b}', paths['{b}'])
+        cache.get('{a}', paths['{a}'])  # Refresh {a}
+        cache.get('{c}', paths['{c}'])
+
+        self.assertEqual(len(cache), 2)
+        with mock.patch.object(template_cache.ET, 'parse', wraps=ET.parse) as parse:
+            cache.get('{a}', paths['{a}'])
+            cache.get('{b}', paths['{b}'])
+        self.assertEqual(parse.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import tempfile
+import shutil
+import os
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core import xml_loader
+from fmod_importer.core.xml_loader import XMLLoader
+from fmod_importer.core.metadata_cache import MetadataCache
+from tests.project_fixture import (
+    make_project, write_event_folder, MASTER_EVENT_FOLDER, MASTER_BUS
+)
+
+
+class TestXMLLoader(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_file = make_project(Path(self.test_dir))
+        self.metadata_path = Path(self.test_dir) / "Metadata"
+        self.cache_file = Path(self.test_dir) / "cache" / "index.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_load_all_kinds(self):
+        """Test that every loader returns the expected dictionaries"""
+        loader = XMLLoader(self.metadata_path)
+
+        folders = loader.load_event_folders()
+        self.assertEqual(folders['{folder-b}']['name'], 'Boss')
+        self.assertEqual(folders['{folder-b}']['parent'], '{folder-a}')
+        self.assertIsNone(folders[MASTER_EVENT_FOLDER]['parent'])
+
+        banks = loader.load_banks()
+        self.assertEqual(banks['{bank-1}']['type'], 'bank')
+
+        buses = loader.load_buses()
+        self.assertIsNone(buses[MASTER_BUS]['parent'])
+        self.assertEqual(buses['{bus-1}']['parent'], MASTER_BUS)
+
+        assets = loader.load_asset_folders()
+        self.assertEqual(assets['{asset-1}']['path'], 'Characters/')
+
+    def test_cache_matches_direct_parse(self):
+        """Test that a cached load returns the same data as an uncached one"""
+        expected = XMLLoader(self.metadata_path).load_event_folders()
+
+        XMLLoader(self.metadata_path, MetadataCache(self.cache_file)).load_event_folders()
+        self.assertTrue(self.cache_file.exists())
+
+        cached = XMLLoader(self.metadata_path, MetadataCache(self.cache_file)).load_event_folders()
+        self.assertEqual(cached, expected)
+
+    def test_warm_load_skips_unchanged_files(self):
+        """Test that only modified files are re-parsed on a warm load"""
+        XMLLoader(self.metadata_path, MetadataCache(self.cache_file)).load_event_folders()
+
+        # Modify one folder (name change also changes size)
+        write_event_folder(self.metadata_path, '{folder-b}', 'Boss Fight', '{folder-a}')
+        folder_file = self.metadata_path / "EventFolder" / "{folder-b}.xml"
+        stat = folder_file.stat()
+        os.utime(folder_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with mock.patch.object(xml_loader, 'read_objects', wraps=xml_loader.read_objects) as spy:
+            folders = XMLLoader(self.metadata_path, MetadataCache(self.cache_file)).load_event_folders()
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(folders['{folder-b}']['name'], 'Boss Fight')
+
+    def test_deleted_files_are_pruned(self):
+        """Test that folders removed from disk disappear from a warm load"""
+        XMLLoader(self.metadata_path, MetadataCache(self.cache_file)).load_event_folders()
+        (self.metadata_path / "EventFolder" / "{folder-b}.xml").unlink()
+
+        folders = XMLLoader(self.metadata_path, MetadataCache(self.cache_file)).load_event_folders()
+        self.assertNotIn('{folder-b}', folders)
+
+    def test_parallel_load_matches_serial(self):
+        """Test that the process pool path returns the same dictionaries"""
+        for i in range(8):
+            write_event_folder(self.metadata_path, f'{{extra-{i}}}', f'Extra {i}', '{folder-a}')
+
+        expected = XMLLoader(self.metadata_path).load_event_folders()
+        with mock.patch.object(xml_loader, 'PARALLEL_MIN_FILES', 0):
+            parallel = XMLLoader(self.metadata_path, workers=2).load_event_folders()
+
+        self.assertEqual(parallel, expected)
+
+    def test_corrupt_cache_is_ignored(self):
+        """Test that an unreadable index falls back to parsing"""
+        self.cache_file.parent.mkdir(parents=True)
+        self.cache_file.write_text('{not json', encoding='utf-8')
+
+        folders = XMLLoader(self.metadata_path, MetadataCache(self.cache_file)).load_event_folders()
+        self.assertIn('{folder-a}', folders)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import tempfile
+import shutil
+import random
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+from pathlib import Path
+
+# Add parent directory to path to allow import
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fmod_importer.core.xml_writer import write_pretty_xml
+
+
+def minidom_pretty(element: ET.Element) -> bytes:
+    """Previous implementation of write_pretty_xml, used as the reference output."""
+    xml_str = ET.tostring(element, encoding='unicode')
+    return minidom.parseString(xml_str).toprettyxml(indent='\t', encoding='UTF-8')
+
+
+class TestWritePrettyXml(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.out_file = self.test_dir / "out.xml"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def assertSameBytes(self, element):
+        write_pretty_xml(element, self.out_file)
+        self.assertEqual(self.out_file.read_bytes(), minidom_pretty(element))
+
+    def test_generated_event(self):
+        """Test a freshly built event tree"""
+        root = ET.Element('objects', serializationModel="Studio.02.02.00")
+        obj = ET.SubElement(root, 'object', {'class': 'Event', 'id': '{e}'})
+        prop = ET.SubElement(obj, 'property', name='name')
+        ET.SubElement(prop, 'value').text = 'Cat_Attack'
+        rel = ET.SubElement(obj, 'relationship', name='mixer')
+        ET.SubElement(rel, 'destination')  # Empty destination
+        ET.SubElement(root, 'object', {'class': 'MarkerTrack', 'id': '{m}'})
+
+        self.assertSameBytes(root)
+
+    def test_special_characters(self):
+        """Test escaping of text and attribute values"""
+        root = ET.Element('objects', note='a "quoted" <b> & \'c\'\n\ttab\rcr')
+        ET.SubElement(root, 'value').text = 'Tom & Jerry <"boss"> fight\r\nline\rend'
+        ET.SubElement(root, 'value').text = 'Éclair 音 \U0001F3B5'
+        ET.SubElement(root, 'value').text = ''
+
+        self.assertSameBytes(root)
+
+    def test_reparsed_file_keeps_whitespace_nodes(self):
+        """Test trees read from disk, which carry whitespace text and tails"""
+        source = self.test_dir / "source.xml"
+        write_pretty_xml(ET.fromstring(
+            '<objects><object class="Bank" id="{b}"><relationship name="events">'
+            '<destination>{e1}</destination></relationship></object></objects>'
+        ), source)
+
+        # Round-trip twice, as repeated bank updates do
+        for _ in range(2):
+            root = ET.parse(source).getroot()
+            root.find('.//relationship').append(ET.Element('destination'))
+            self.assertSameBytes(root)
+            write_pretty_xml(root, source)
+
+    def test_mixed_content(self):
+        """Test elements with both text and children"""
+        root = ET.fromstring('<a>head<b>x</b>mid<c/>tail <d k="v">y</d></a>')
+        self.assertSameBytes(root)
+
+    def test_random_trees(self):
+        """Test random trees against the minidom reference"""
+        rng = random.Random(1234)
+        alphabet = 'ab &<>"\'\t\n\r{}-é'
+
+        def rand_text():
+            if rng.random() < 0.3:
+                return None
+            return ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+
+        def build(elem, depth):
+            for _ in range(rng.randint(0, 3) if depth < 4 else 0):
+                child = ET.SubElement(elem, rng.choice(['object', 'property', 'value']))
+                for name in rng.sample(['id', 'class', 'name'], rng.randint(0, 3)):
+                    child.set(name, rand_text() or '')
+                child.text = rand_text()
+                child.tail = rand_text() if rng.random() < 0.3 else None
+                build(child, depth + 1)
+
+        for _ in range(200):
+            root = ET.Element('objects', serializationModel='Studio.02.02.00')
+            root.text = rand_text()
+            build(root, 0)
+            self.assertSameBytes(root)
+
+
+if __name__ == '__main__':
+    unittest.main()